@@ -0,0 +1,56 @@
+"""query indexes
+
+One index per router filter/ordering, so list endpoints stay on index scans
+as the tables grow:
+
+- blogs: featured listing, author joins and cascades
+- blog_tags: the tag filter (tag_id first; the primary key leads with blog_id)
+- comments: per-post lists ordered by created_at, optionally approved only
+- contacts / newsletters / users: admin lists ordered by created_at
+- features / testimonials / menu_items: published filter + display order
+- menu_items.parent_id: reparenting children on delete
+
+On Postgres the indexes are built CONCURRENTLY so writes are not blocked.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 23:05:09.754530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_blog_tags_tag_id_blog_id', 'blog_tags', ['tag_id', 'blog_id']),
+    ('ix_blogs_author_id', 'blogs', ['author_id']),
+    ('ix_blogs_featured_published_publish_date_id', 'blogs', ['featured', 'published', 'publish_date', 'id']),
+    ('ix_comments_blog_id_approved_created_at_id', 'comments', ['blog_id', 'approved', 'created_at', 'id']),
+    ('ix_contacts_created_at', 'contacts', ['created_at']),
+    ('ix_contacts_status_created_at', 'contacts', ['status', 'created_at']),
+    ('ix_features_published_order_created_at', 'features', ['published', 'order', 'created_at']),
+    ('ix_menu_items_parent_id', 'menu_items', ['parent_id']),
+    ('ix_menu_items_published_order_created_at', 'menu_items', ['published', 'order', 'created_at']),
+    ('ix_newsletters_active_created_at', 'newsletters', ['active', 'created_at']),
+    ('ix_testimonials_published_order_created_at', 'testimonials', ['published', 'order', 'created_at']),
+    ('ix_users_created_at', 'users', ['created_at']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,61 @@
+"""blog facets
+
+Summary table for the blog sidebar facets (app.services.facets), backfilled
+from the existing posts. The blog write handlers keep it up to date.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 23:40:12.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('blog_facets',
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('kind', 'key')
+    )
+
+    if op.get_bind().dialect.name == 'postgresql':
+        month = "to_char(publish_date, 'YYYY-MM')"
+        published = "published"
+    else:
+        month = "strftime('%Y-%m', publish_date)"
+        published = "published = 1"
+
+    op.execute(
+        "INSERT INTO blog_facets (kind, key, count) "
+        f"SELECT 'published', 'all', count(*) FROM blogs WHERE {published} HAVING count(*) > 0"
+    )
+    op.execute(
+        "INSERT INTO blog_facets (kind, key, count) "
+        f"SELECT 'featured', 'featured', count(*) FROM blogs WHERE {published} AND featured "
+        "HAVING count(*) > 0"
+    )
+    op.execute(
+        "INSERT INTO blog_facets (kind, key, count) "
+        "SELECT 'tag', blog_tags.tag_id, count(*) FROM blog_tags "
+        f"JOIN blogs ON blogs.id = blog_tags.blog_id WHERE {published} GROUP BY blog_tags.tag_id"
+    )
+    op.execute(
+        "INSERT INTO blog_facets (kind, key, count) "
+        f"SELECT 'month', {month}, count(*) FROM blogs "
+        f"WHERE {published} AND publish_date IS NOT NULL GROUP BY {month}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('blog_facets')
@@ -0,0 +1,34 @@
+"""blog comment counts
+
+Denormalized approved comment count on blogs, backfilled from comments.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:12:31.402876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('blogs', sa.Column('approved_comment_count', sa.Integer(), server_default='0', nullable=False))
+
+    approved = "comments.approved" if op.get_bind().dialect.name == 'postgresql' else "comments.approved = 1"
+    op.execute(
+        "UPDATE blogs SET approved_comment_count = ("
+        f"SELECT count(*) FROM comments WHERE comments.blog_id = blogs.id AND {approved})"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('blogs', 'approved_comment_count')
@@ -0,0 +1,40 @@
+"""related posts
+
+Top-K neighbours per post (app.services.related). The table starts empty:
+fill it with POST /api/blogs/related/rebuild once the app is running.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 23:17:45.101644
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('related_posts',
+    sa.Column('blog_id', sa.String(), nullable=False),
+    sa.Column('related_id', sa.String(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['blog_id'], ['blogs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('blog_id', 'related_id')
+    )
+    op.create_index('ix_related_posts_blog_id_rank', 'related_posts', ['blog_id', 'rank'], unique=False)
+    op.create_index('ix_related_posts_related_id', 'related_posts', ['related_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_related_posts_related_id', table_name='related_posts')
+    op.drop_index('ix_related_posts_blog_id_rank', table_name='related_posts')
+    op.drop_table('related_posts')
@@ -0,0 +1,61 @@
+"""newsletter campaigns
+
+Campaigns and their per-recipient delivery log (the dispatch checkpoint).
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 23:23:52.657156
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('campaigns',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('subject', sa.String(), nullable=False),
+    sa.Column('body_text', sa.Text(), nullable=False),
+    sa.Column('body_html', sa.Text(), nullable=True),
+    sa.Column('status', sa.Enum('DRAFT', 'SENDING', 'SENT', name='campaignstatus'), nullable=True),
+    sa.Column('cursor', sa.String(), nullable=True),
+    sa.Column('sent_count', sa.Integer(), nullable=True),
+    sa.Column('failed_count', sa.Integer(), nullable=True),
+    sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_campaigns_id'), 'campaigns', ['id'], unique=False)
+    op.create_table('campaign_deliveries',
+    sa.Column('campaign_id', sa.String(), nullable=False),
+    sa.Column('subscriber_id', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('status', sa.Enum('SENT', 'FAILED', name='deliverystatus'), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('campaign_id', 'subscriber_id')
+    )
+    op.create_index('ix_campaign_deliveries_campaign_id_status', 'campaign_deliveries', ['campaign_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_campaign_deliveries_campaign_id_status', table_name='campaign_deliveries')
+    op.drop_table('campaign_deliveries')
+    op.drop_index(op.f('ix_campaigns_id'), table_name='campaigns')
+    op.drop_table('campaigns')
+    sa.Enum(name='deliverystatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='campaignstatus').drop(op.get_bind(), checkfirst=True)
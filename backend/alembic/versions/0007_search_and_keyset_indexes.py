@@ -0,0 +1,90 @@
+"""search vector and keyset indexes, content versions
+
+Schema added to the models after the 0001 baseline but before migrations
+existed. create_all() adds missing tables but never columns or indexes on a
+table that is already there, so a database stamped at 0001 may have
+content_versions and lack the blog column and indexes; a database created
+later may have all of them. Each object is created only where it is missing.
+
+- blogs.search_vector (Postgres only): the weighted search document as a
+  stored generated column, with a GIN index; full-text search matches and
+  ranks against it. Replaces the earlier expression index on the document.
+  Adding the column rewrites the table under an exclusive lock.
+- blogs: (published, publish_date, id) for keyset pages
+- content_versions: per-namespace counters behind the ETags
+
+On Postgres the indexes are built CONCURRENTLY so writes are not blocked.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 09:12:31.208417
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.models.blog_search_document
+SEARCH_DOCUMENT = (
+    "((setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B')) || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C'))"
+)
+
+
+def _missing_column(table: str, column: str) -> bool:
+    if context.is_offline_mode():
+        return True
+    return column not in {c['name'] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    if context.is_offline_mode() or not sa.inspect(op.get_bind()).has_table('content_versions'):
+        op.create_table('content_versions',
+        sa.Column('namespace', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('namespace')
+        )
+
+    if postgres and _missing_column('blogs', 'search_vector'):
+        op.add_column('blogs', sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_DOCUMENT, persisted=True), nullable=True
+        ))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_blogs_published_publish_date_id', 'blogs', ['published', 'publish_date', 'id'],
+            unique=False, if_not_exists=True, postgresql_concurrently=True
+        )
+        if postgres:
+            op.create_index(
+                'ix_blogs_search_vector', 'blogs', ['search_vector'],
+                unique=False, if_not_exists=True, postgresql_using='gin', postgresql_concurrently=True
+            )
+            # Expression index from before the column; nothing queries the expression now
+            op.drop_index(
+                'ix_blogs_search_document', table_name='blogs', if_exists=True,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        if op.get_bind().dialect.name == 'postgresql':
+            op.drop_index('ix_blogs_search_vector', table_name='blogs', postgresql_concurrently=True)
+        op.drop_index('ix_blogs_published_publish_date_id', table_name='blogs', postgresql_concurrently=True)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_column('blogs', 'search_vector')
+    op.drop_table('content_versions')
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -9,39 +10,102 @@ from app.core.config import settings
 from app.database import get_async_session
 from app.models.models import User, Role
 from app.schemas.schemas import User as UserSchema
+from app.services.cache import TTLCache
+from app.services.events import EntityChanged, event_bus
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller, without an ORM load."""
+    id: str
+    email: str
+    role: Role
+
+
+# user id -> Principal, dropped whenever the user is changed or deleted
+principal_cache = TTLCache(
+    maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_principal(event: EntityChanged):
+    if event.entity_id is None:
+        principal_cache.clear()
+    else:
+        principal_cache.delete(event.entity_id)
+
+
+event_bus.subscribe("user", invalidate_principal)
+
+
+def _decode_user_id(token: str) -> Optional[str]:
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM]
+        )
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+
+async def _load_principal(session: AsyncSession, user_id: str) -> Optional[Principal]:
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    result = await session.execute(
+        select(User.id, User.email, User.role).where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    principal = Principal(id=row.id, email=row.email, role=row.role)
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     session: AsyncSession = Depends(get_async_session)
-) -> User:
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    try:
-        payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+
+    user_id = _decode_user_id(credentials.credentials)
+    if user_id is None:
         raise credentials_exception
-    
-    # Get user from database
-    result = await session.execute(select(User).where(User.id == user_id))
+
+    principal = await _load_principal(session, user_id)
+    if principal is None:
+        raise credentials_exception
+
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_async_session)
+) -> User:
+    # Full ORM user, for handlers that return or modify the profile
+    result = await session.execute(select(User).where(User.id == principal.id))
     user = result.scalar_one_or_none()
-    
+
     if user is None:
-        raise credentials_exception
-    
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     return user
 
 
@@ -52,8 +116,8 @@ async def get_current_active_user(
 
 
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
     if current_user.role != Role.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -64,26 +128,14 @@ async def get_current_admin_user(
 
 # Optional authentication (for endpoints that can work with or without auth)
 async def get_optional_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     session: AsyncSession = Depends(get_async_session)
-) -> Optional[User]:
+) -> Optional[Principal]:
     if not credentials:
         return None
-    
-    try:
-        payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-    except JWTError:
+
+    user_id = _decode_user_id(credentials.credentials)
+    if user_id is None:
         return None
-    
-    # Get user from database
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
-    return user
+
+    return await _load_principal(session, user_id)
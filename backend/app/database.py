@@ -1,21 +1,184 @@
-from sqlalchemy import create_engine
+import asyncio
+import bisect
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from uuid import uuid4
+
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event, exc, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Convert PostgreSQL URL to async version
 ASYNC_DATABASE_URL = settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
+ASYNC_READ_DATABASE_URL = (
+    settings.READ_DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
+    if settings.READ_DATABASE_URL else None
+)
+
+
+class PoolMetrics:
+    """Checkout counters and a wait-time histogram for the connection pool."""
+
+    # Upper bounds of the wait-time histogram buckets, in milliseconds
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.total_wait_ms = 0.0
+        self.wait_histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        self._lock = threading.Lock()
+
+    def wait_started(self):
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def wait_finished(self, wait_ms: float, timed_out: bool = False):
+        with self._lock:
+            self.waiting -= 1
+            self.total_wait_ms += wait_ms
+            self.wait_histogram[bisect.bisect_left(self.BUCKETS_MS, wait_ms)] += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        waits = sum(self.wait_histogram)
+        labels = [f"le_{bound}ms" for bound in self.BUCKETS_MS] + ["inf"]
+        data = {
+            "pool_class": type(pool).__name__,
+            "status": pool.status(),
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "avg_wait_ms": round(self.total_wait_ms / waits, 3) if waits else 0.0,
+            "wait_histogram": dict(zip(labels, self.wait_histogram)),
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            data.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        return data
+
+
+pool_metrics = PoolMetrics()
+read_pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long (and how many) callers wait for a connection."""
+
+    metrics = pool_metrics
+
+    def _do_get(self):
+        self.metrics.wait_started()
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.wait_finished((time.perf_counter() - started) * 1000, timed_out)
+
+
+class InstrumentedReadQueuePool(InstrumentedAsyncQueuePool):
+    metrics = read_pool_metrics
+
+
+def engine_options(url: str, poolclass=InstrumentedAsyncQueuePool) -> dict:
+    """create_async_engine() keyword arguments for the configured pool."""
+    if not url.startswith("postgresql"):
+        return {}
+
+    options = {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_PGBOUNCER_MODE:
+        # Transaction pooling: prepared statements cannot outlive a transaction,
+        # so disable both statement caches and use unique statement names
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    else:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+def instrument_engine(async_engine, metrics: PoolMetrics):
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.checkins += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
 
 # Create async engine
-engine = create_async_engine(ASYNC_DATABASE_URL)
+engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+instrument_engine(engine, pool_metrics)
 
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Optional read replica for public GET endpoints
+read_engine = None
+read_session_maker = None
+if ASYNC_READ_DATABASE_URL:
+    read_engine = create_async_engine(
+        ASYNC_READ_DATABASE_URL,
+        **engine_options(ASYNC_READ_DATABASE_URL, poolclass=InstrumentedReadQueuePool)
+    )
+    instrument_engine(read_engine, read_pool_metrics)
+    read_session_maker = async_sessionmaker(
+        read_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
 Base = declarative_base()
 
 
@@ -24,6 +187,158 @@ async def get_async_session():
         yield session
 
 
+# Seconds a replica may lag behind; NULL (not in recovery) or a fully replayed
+# WAL counts as no lag
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class ReplicaMonitor:
+    """Decides whether reads may go to the replica.
+
+    Replica lag is probed at most every ``check_interval`` seconds; a replica
+    that lags more than ``max_lag`` seconds, or cannot be reached, is skipped
+    until the next probe. After a write, reads stick to the primary for
+    ``sticky_seconds``: for the writing client through a cookie, and for
+    everyone on the worker that handled the write.
+    """
+
+    cookie_name = "read_primary_until"
+
+    def __init__(self, max_lag: float, check_interval: float, sticky_seconds: float):
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.sticky_seconds = sticky_seconds
+        self.lag: Optional[float] = None
+        self.healthy = True
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self._checked_at = float("-inf")
+        self._last_write = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def replica_usable(self) -> bool:
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return self.healthy
+
+        async with self._lock:
+            if time.monotonic() - self._checked_at >= self.check_interval:
+                await self._probe()
+        return self.healthy
+
+    async def _probe(self):
+        try:
+            async with read_engine.connect() as conn:
+                if read_engine.dialect.name == "postgresql":
+                    lag = await conn.scalar(REPLICA_LAG_QUERY)
+                else:
+                    await conn.execute(text("SELECT 1"))
+                    lag = 0
+            self.lag = float(lag or 0)
+            self.healthy = self.lag <= self.max_lag
+        except Exception:
+            logger.exception("Read replica probe failed, reading from the primary")
+            self.lag = None
+            self.healthy = False
+        self._checked_at = time.monotonic()
+
+    def sticky(self, request: Request) -> bool:
+        if time.monotonic() - self._last_write < self.sticky_seconds:
+            return True
+        try:
+            return float(request.cookies.get(self.cookie_name, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def mark_write(self, response: Response):
+        self._last_write = time.monotonic()
+        response.set_cookie(
+            self.cookie_name,
+            str(time.time() + self.sticky_seconds),
+            max_age=max(1, int(self.sticky_seconds)),
+            httponly=True,
+            samesite="lax",
+        )
+
+    def stats(self) -> dict:
+        return {
+            "configured": read_engine is not None,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "max_lag_seconds": self.max_lag,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+        }
+
+
+replica_monitor = ReplicaMonitor(
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.REPLICA_CHECK_INTERVAL_SECONDS,
+    sticky_seconds=settings.REPLICA_STICKY_SECONDS,
+)
+
+
+async def get_read_session(request: Request):
+    """Session for read-only handlers: the replica when it is usable, else the primary."""
+    use_replica = (
+        read_session_maker is not None
+        and not replica_monitor.sticky(request)
+        and await replica_monitor.replica_usable()
+    )
+    if use_replica:
+        replica_monitor.replica_reads += 1
+    else:
+        replica_monitor.primary_reads += 1
+
+    async with (read_session_maker if use_replica else async_session_maker)() as session:
+        session.info["replica"] = use_replica
+        yield session
+
+
+@asynccontextmanager
+async def sibling_session(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """A second session on the same database as ``session`` (primary or replica).
+
+    A session runs one statement at a time; handlers that fetch independent
+    parts concurrently give each extra part its own sibling.
+    """
+    replica = session.info.get("replica", False)
+    async with (read_session_maker if replica else async_session_maker)() as sibling:
+        sibling.info["replica"] = replica
+        yield sibling
+
+
+async def read_your_writes(request: Request, call_next):
+    """HTTP middleware: successful writes pin the client's reads to the primary."""
+    response = await call_next(request)
+    if (
+        read_engine is not None
+        and request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+    ):
+        replica_monitor.mark_write(response)
+    return response
+
+
 async def create_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+def pool_stats() -> dict:
+    stats = pool_metrics.snapshot(engine.pool)
+    if read_engine is not None:
+        stats["replica_pool"] = read_pool_metrics.snapshot(read_engine.pool)
+    stats["replica"] = replica_monitor.stats()
+    stats["config"] = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pgbouncer_mode": settings.DB_PGBOUNCER_MODE,
+        "statement_cache_size": 0 if settings.DB_PGBOUNCER_MODE else settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    return stats
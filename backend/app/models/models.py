@@ -1,5 +1,8 @@
-from sqlalchemy import Column, String, Boolean, Integer, Text, DateTime, Float, ForeignKey, Table, Enum
+from sqlalchemy import Column, Computed, String, Boolean, Integer, Text, DateTime, Float, ForeignKey, Table, Enum, Index, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
@@ -18,12 +21,57 @@ class ContactStatus(str, enum.Enum):
     ARCHIVED = "ARCHIVED"
 
 
+class CampaignStatus(str, enum.Enum):
+    DRAFT = "DRAFT"
+    SENDING = "SENDING"
+    SENT = "SENT"
+
+
+class DeliveryStatus(str, enum.Enum):
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+# Full-text search document for blogs: title (A) > excerpt (B) > content (C),
+# stored in blogs.search_vector on Postgres so matching and ranking read the
+# column instead of re-parsing every matching post.
+BLOG_SEARCH_CONFIG = "english"
+
+
+@compiles(CreateColumn)
+def _create_column(element, compiler, **kw):
+    """Leave columns with ``info={"postgresql_only": True}`` out of CREATE TABLE elsewhere."""
+    if element.element.info.get("postgresql_only") and compiler.dialect.name != "postgresql":
+        return None
+    return compiler.visit_create_column(element, **kw)
+
+
+def blog_search_document(title, excerpt, content):
+    def weighted(column, weight):
+        return func.setweight(
+            func.to_tsvector(
+                literal_column(f"'{BLOG_SEARCH_CONFIG}'"),
+                func.coalesce(column, literal_column("''"))
+            ),
+            literal_column(f"'{weight}'"),
+            type_=TSVECTOR
+        )
+
+    return (
+        weighted(title, "A")
+        .op("||", return_type=TSVECTOR)(weighted(excerpt, "B"))
+        .op("||", return_type=TSVECTOR)(weighted(content, "C"))
+    )
+
+
 # Association table for many-to-many relationship between Blog and Tag
 blog_tags = Table(
     'blog_tags',
     Base.metadata,
     Column('blog_id', String, ForeignKey('blogs.id', ondelete='CASCADE'), primary_key=True),
-    Column('tag_id', String, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True)
+    Column('tag_id', String, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    # Tag filter (EXISTS ... WHERE tag_id = ?); the primary key covers blog_id lookups
+    Index('ix_blog_tags_tag_id_blog_id', 'tag_id', 'blog_id')
 )
 
 
@@ -40,6 +88,11 @@ class User(Base):
     
     # Relationships
     blogs = relationship("Blog", back_populates="author", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Admin user list, newest first
+        Index("ix_users_created_at", created_at),
+    )
 
 
 class Blog(Base):
@@ -54,9 +107,19 @@ class Blog(Base):
     published = Column(Boolean, default=False)
     featured = Column(Boolean, default=False)
     views = Column(Integer, default=0)
+    # Kept in step with comment create/approve/delete by the comments endpoints
+    approved_comment_count = Column(Integer, nullable=False, default=0, server_default="0")
     publish_date = Column(DateTime, server_default=func.now())
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Generated by Postgres from title, excerpt and content, and absent from
+    # other databases. Table-only (see __mapper_args__): the ORM never loads or
+    # returns it; queries use Blog.__table__.c.search_vector
+    search_vector = Column(
+        TSVECTOR,
+        Computed(blog_search_document(title, excerpt, content), persisted=True),
+        info={"postgresql_only": True}
+    )
     
     # Foreign keys
     author_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"))
@@ -65,6 +128,21 @@ class Blog(Base):
     author = relationship("User", back_populates="blogs")
     tags = relationship("Tag", secondary=blog_tags, back_populates="blogs")
     comments = relationship("Comment", back_populates="blog", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Keyset pagination: published filter + (publish_date, id) ordering
+        Index("ix_blogs_published_publish_date_id", published, publish_date, id),
+        # Featured posts: featured + published filter, same ordering
+        Index("ix_blogs_featured_published_publish_date_id", featured, published, publish_date, id),
+        # Author joins and ON DELETE CASCADE from users
+        Index("ix_blogs_author_id", author_id),
+        Index(
+            "ix_blogs_search_vector", "search_vector", postgresql_using="gin",
+            info={"postgresql_only": True}
+        ).ddl_if(dialect="postgresql"),
+    )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+
 
 
 class Tag(Base):
@@ -90,6 +168,10 @@ class Feature(Base):
     published = Column(Boolean, default=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        Index("ix_features_published_order_created_at", published, order, created_at),
+    )
 
 
 class Testimonial(Base):
@@ -107,6 +189,10 @@ class Testimonial(Base):
     order = Column(Integer, default=0)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        Index("ix_testimonials_published_order_created_at", published, order, created_at),
+    )
 
 
 class Brand(Base):
@@ -133,6 +219,12 @@ class Contact(Base):
     status = Column(Enum(ContactStatus), default=ContactStatus.UNREAD)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # Admin inbox, newest first, optionally filtered by status
+        Index("ix_contacts_status_created_at", status, created_at),
+        Index("ix_contacts_created_at", created_at),
+    )
 
 
 class Newsletter(Base):
@@ -143,6 +235,55 @@ class Newsletter(Base):
     active = Column(Boolean, default=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        Index("ix_newsletters_active_created_at", active, created_at),
+    )
+
+
+class Campaign(Base):
+    __tablename__ = "campaigns"
+    
+    id = Column(String, primary_key=True, index=True)
+    subject = Column(String, nullable=False)
+    body_text = Column(Text, nullable=False)
+    body_html = Column(Text, nullable=True)
+    status = Column(Enum(CampaignStatus), default=CampaignStatus.DRAFT)
+    # Dispatch checkpoint: subscribers are sent in id order, and every id up
+    # to cursor has a delivery row
+    cursor = Column(String, nullable=True)
+    sent_count = Column(Integer, default=0)
+    failed_count = Column(Integer, default=0)
+    # Held by the worker that is sending; an expired lease can be resumed
+    lease_expires_at = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    # Relationships
+    deliveries = relationship("CampaignDelivery", back_populates="campaign", cascade="all, delete-orphan")
+
+
+class CampaignDelivery(Base):
+    __tablename__ = "campaign_deliveries"
+    
+    campaign_id = Column(String, ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True)
+    # No foreign key: the delivery log outlives deleted subscribers
+    subscriber_id = Column(String, primary_key=True)
+    email = Column(String, nullable=False)
+    status = Column(Enum(DeliveryStatus), nullable=False)
+    error = Column(String, nullable=True)
+    attempts = Column(Integer, default=1)
+    sent_at = Column(DateTime, server_default=func.now())
+    
+    # Relationships
+    campaign = relationship("Campaign", back_populates="deliveries")
+    
+    __table_args__ = (
+        # Failed deliveries of a campaign
+        Index("ix_campaign_deliveries_campaign_id_status", campaign_id, status),
+    )
 
 
 class PricingPlan(Base):
@@ -188,6 +329,11 @@ class Comment(Base):
     
     # Relationships
     blog = relationship("Blog", back_populates="comments")
+    
+    __table_args__ = (
+        # Per-post comment lists, newest first, optionally approved only
+        Index("ix_comments_blog_id_approved_created_at_id", blog_id, approved, created_at, id),
+    )
 
 
 class MenuItem(Base):
@@ -205,3 +351,50 @@ class MenuItem(Base):
     
     # Self-referential relationship for submenus
     children = relationship("MenuItem", backref="parent", remote_side=[id])
+    
+    __table_args__ = (
+        Index("ix_menu_items_published_order_created_at", published, order, created_at),
+        # Reparenting children when an item is deleted
+        Index("ix_menu_items_parent_id", parent_id),
+    )
+
+
+class BlogFacet(Base):
+    __tablename__ = "blog_facets"
+    
+    # Published-post counts for the blog sidebar, maintained by the blog write
+    # handlers (app.services.facets): ("tag", tag id), ("month", "YYYY-MM"),
+    # ("featured", "featured") and ("published", "all")
+    kind = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class RelatedPost(Base):
+    __tablename__ = "related_posts"
+    
+    # Top-K neighbours per published post, written by the background job in
+    # app.services.related. related_id has no foreign key: the job has to find
+    # the lists that still point at a deleted post, and reads join blogs, so a
+    # stale row is never served.
+    blog_id = Column(String, ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True)
+    related_id = Column(String, primary_key=True)
+    rank = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        # The endpoint's lookup: one post's neighbours in rank order
+        Index("ix_related_posts_blog_id_rank", blog_id, rank),
+        # Lists that mention a changed post
+        Index("ix_related_posts_related_id", related_id),
+    )
+
+
+class ContentVersion(Base):
+    __tablename__ = "content_versions"
+    
+    # One row per cached content namespace ("blogs", "features", ...), bumped
+    # in the same transaction as every write to that content
+    namespace = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
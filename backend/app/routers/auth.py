@@ -6,10 +6,11 @@ from sqlalchemy import select
 import uuid
 
 from app.core.config import settings
-from app.core.security import create_access_token, verify_password, get_password_hash
-from app.core.deps import get_current_active_user, get_current_admin_user
+from app.core.security import create_access_token, verify_password_async, get_password_hash_async
+from app.core.deps import Principal, get_current_active_user, get_current_admin_user
 from app.database import get_async_session
 from app.models.models import User, Role
+from app.services.rate_limit import rate_limiter
 from app.schemas.schemas import (
     Token, User as UserSchema, UserCreate, UserLogin, MessageResponse
 )
@@ -17,7 +18,7 @@ from app.schemas.schemas import (
 router = APIRouter()
 
 
-@router.post("/register", response_model=Token)
+@router.post("/register", response_model=Token, dependencies=[Depends(rate_limiter.limit("register"))])
 async def register(
     user_data: UserCreate,
     session: AsyncSession = Depends(get_async_session)
@@ -33,7 +34,7 @@ async def register(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     db_user = User(
         id=str(uuid.uuid4()),
         email=user_data.email,
@@ -59,21 +60,29 @@ async def register(
     )
 
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=[Depends(rate_limiter.limit("login"))])
 async def login(
     user_data: UserLogin,
     session: AsyncSession = Depends(get_async_session)
 ):
+    # Per account as well as per IP: guessing one account's password from many
+    # addresses. The token is taken up front, so a parallel burst cannot slip
+    # past, and refunded on success. Anyone's failed guesses drain the bucket,
+    # so they also lock out the owner until it refills
+    account = user_data.email.lower()
+    await rate_limiter.check("login_account", account)
+    
     # Get user from database
     result = await session.execute(select(User).where(User.email == user_data.email))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(user_data.password, user.password):
+    if not user or not await verify_password_async(user_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    await rate_limiter.refund("login_account", account)
     
     # Create access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -88,21 +97,29 @@ async def login(
     )
 
 
-@router.post("/admin/login", response_model=Token)
+@router.post("/admin/login", response_model=Token, dependencies=[Depends(rate_limiter.limit("admin_login"))])
 async def admin_login(
     user_data: UserLogin,
     session: AsyncSession = Depends(get_async_session)
 ):
+    # Per account as well as per IP: guessing one account's password from many
+    # addresses. The token is taken up front, so a parallel burst cannot slip
+    # past, and refunded on success. Anyone's failed guesses drain the bucket,
+    # so they also lock out the owner until it refills
+    account = user_data.email.lower()
+    await rate_limiter.check("login_account", account)
+    
     # Get user from database
     result = await session.execute(select(User).where(User.email == user_data.email))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(user_data.password, user.password):
+    if not user or not await verify_password_async(user_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    await rate_limiter.refund("login_account", account)
     
     # Check if user is admin
     if user.role != Role.ADMIN:
@@ -141,7 +158,7 @@ async def logout():
 @router.post("/admin/create-user", response_model=UserSchema)
 async def create_user_by_admin(
     user_data: UserCreate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
     # Check if user already exists
@@ -155,7 +172,7 @@ async def create_user_by_admin(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     db_user = User(
         id=str(uuid.uuid4()),
         email=user_data.email,
@@ -1,88 +1,246 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, and_, update, delete
+from sqlalchemy.orm import load_only, selectinload
 import uuid
 
-from app.core.deps import get_current_admin_user, get_current_active_user, get_optional_current_user
-from app.database import get_async_session
-from app.models.models import Blog, User, Tag, Comment
+from app.core.config import settings
+from app.core.deps import Principal, get_current_admin_user, get_optional_current_user
+from app.database import get_async_session, get_read_session, sibling_session
+from app.models.models import Blog, Tag, Comment
+from app.services.blog_list import AUTHOR_COLUMNS, BLOG_LIST_COLUMNS, BlogPage
+from app.services.blog_writes import blogs_deleted, delete_blogs
+from app.services.cache import TTLCache
+from app.services.conditional import Validators, bump_content_version, make_etag
+from app.services.counts import TotalMode, blog_counts
+from app.services.events import EntityChanged, event_bus
+from app.services.facets import apply_facet_changes, blog_facet_keys, load_facets, rebuild_facets
+from app.services.ingest import ingest_buffer
+from app.services.pagination import keyset_after, next_cursor
+from app.services.rate_limit import rate_limiter
+from app.services.related import related_engine, related_posts
+from app.services.response_cache import response_cache
+from app.services.search import BlogSearch, uses_postgres
+from app.services.serialization import TypedJSONResponse, validate_rows
+from app.services.view_counter import view_counter
 from app.schemas.schemas import (
-    Blog as BlogSchema, BlogCreate, BlogUpdate, BlogList, BlogsResponse,
-    Comment as CommentSchema, CommentCreate, MessageResponse
+    Blog as BlogSchema, BlogBundle, BlogCreate, BlogUpdate, BlogFacets, BlogList, BlogsResponse,
+    Comment as CommentSchema, CommentCreate, CommentsResponse, MessageResponse
 )
 
 router = APIRouter()
 
+# slug -> (blog id, published), dropped on every blog write (slugs can change)
+slug_cache = TTLCache(maxsize=settings.SLUG_CACHE_SIZE, ttl=settings.SLUG_CACHE_TTL_SECONDS)
+# blog ids known to exist, so a burst of comments on one post checks it once
+blog_id_cache = TTLCache(maxsize=settings.SLUG_CACHE_SIZE, ttl=settings.SLUG_CACHE_TTL_SECONDS)
+
+
+def invalidate_blog_caches(event: EntityChanged):
+    blog_counts.invalidate()
+    slug_cache.clear()
+    blog_id_cache.clear()
+    response_cache.invalidate("blogs")
+
+
+event_bus.subscribe("blog", invalidate_blog_caches)
+
+
+async def _drop_orphan_comments(session: AsyncSession, rows: List[dict]) -> List[dict]:
+    """Buffered comments whose post still exists (it may be deleted before the flush)."""
+    blog_ids = {row["blog_id"] for row in rows}
+    result = await session.execute(select(Blog.id).where(Blog.id.in_(blog_ids)))
+    existing = set(result.scalars())
+    return [row for row in rows if row["blog_id"] in existing]
+
+
+ingest_buffer.register(Comment.__table__, _drop_orphan_comments)
+
+
+async def _adjust_comment_count(session: AsyncSession, blog_id: str, delta: int) -> None:
+    """Shift the post's approved comment count in the current transaction."""
+    await session.execute(
+        update(Blog)
+        .where(Blog.id == blog_id)
+        # A comment is not an edit: keep updated_at (and the post's ETag) as is
+        .values(
+            approved_comment_count=Blog.approved_comment_count + delta,
+            updated_at=Blog.updated_at
+        )
+    )
+    await bump_content_version(session, "blogs")
+
+
+async def _resolve_slug(session: AsyncSession, slug: str) -> Optional[Tuple[str, bool]]:
+    ref = slug_cache.get(slug)
+    if ref is None:
+        result = await session.execute(select(Blog.id, Blog.published).where(Blog.slug == slug))
+        row = result.one_or_none()
+        if row is None:
+            return None
+        ref = (row.id, row.published)
+        slug_cache.set(slug, ref)
+    return ref
+
+
+async def _load_blog(session: AsyncSession, blog_id: str) -> Optional[BlogSchema]:
+    result = await session.execute(
+        select(Blog).options(
+            selectinload(Blog.author).load_only(*AUTHOR_COLUMNS),
+            selectinload(Blog.tags)
+        ).where(Blog.id == blog_id)
+    )
+    blog = result.scalar_one_or_none()
+    return BlogSchema.model_validate(blog) if blog is not None else None
+
+
+async def _comment_page(
+    session: AsyncSession, blog_id: str, approved_only: bool, limit: int, after: Optional[str]
+) -> CommentsResponse:
+    query = select(Comment).where(Comment.blog_id == blog_id)
+    
+    if approved_only:
+        query = query.where(Comment.approved == True)
+    
+    # Keyset pagination on (created_at, id), newest first
+    if after:
+        query = query.where(keyset_after(Comment.created_at, Comment.id, after))
+    
+    query = query.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(limit)
+    
+    result = await session.execute(query)
+    comments = result.scalars().all()
+    
+    return CommentsResponse(
+        comments=validate_rows(CommentSchema, comments),
+        limit=limit,
+        next_cursor=next_cursor(comments, limit, "created_at")
+    )
+
+
+def _can_view(published: bool, current_user: Optional[Principal]) -> bool:
+    return published or (current_user is not None and current_user.role == "ADMIN")
+
+
+def _blog_validators(blog_id: str, updated_at) -> Validators:
+    return Validators(make_etag("blog", blog_id, updated_at), updated_at)
+
 
 @router.get("/", response_model=BlogsResponse)
 async def get_blogs(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
     featured: Optional[bool] = Query(None),
     published: Optional[bool] = Query(True),
     tag: Optional[str] = Query(None),
-    session: AsyncSession = Depends(get_async_session)
+    after: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    total_mode: TotalMode = Query(TotalMode.EXACT),
+    session: AsyncSession = Depends(get_read_session)
 ):
-    # Build query
-    query = select(Blog).options(
-        selectinload(Blog.author),
-        selectinload(Blog.tags)
+    cache_key = response_cache.key(
+        "blogs", "list", skip=skip, limit=limit, search=search, featured=featured,
+        published=published, tag=tag, after=after, total_mode=total_mode
     )
+    cached, validators = await response_cache.lookup(request, session, cache_key)
+    if cached is not None:
+        return cached
     
-    # Apply filters
-    filters = []
-    if published is not None:
-        filters.append(Blog.published == published)
-    if featured is not None:
-        filters.append(Blog.featured == featured)
-    if search:
-        filters.append(
-            or_(
-                Blog.title.ilike(f"%{search}%"),
-                Blog.excerpt.ilike(f"%{search}%"),
-                Blog.content.ilike(f"%{search}%")
-            )
-        )
-    if tag:
-        query = query.join(Blog.tags).where(Tag.slug == tag)
-    
-    if filters:
-        query = query.where(and_(*filters))
-    
-    # Get total count
-    count_query = select(func.count(Blog.id))
-    if filters:
-        count_query = count_query.where(and_(*filters))
-    if tag:
-        count_query = count_query.join(Blog.tags).where(Tag.slug == tag)
+    blog_search = None
+    if search and search.strip():
+        blog_search = BlogSearch(search, postgres=uses_postgres(session))
     
-    total_result = await session.execute(count_query)
-    total = total_result.scalar()
+    page = BlogPage(
+        published=published, featured=featured, tag=tag, search=blog_search,
+        after=after, skip=skip, limit=limit
+    )
     
-    # Apply pagination and ordering
-    query = query.order_by(Blog.publish_date.desc()).offset(skip).limit(limit)
+    if settings.BLOG_LIST_QUERY_MODE == "single":
+        # One statement; an exact total that is not cached yet comes from a
+        # window count over the same filters (not possible past a cursor)
+        total = blog_counts.cached(page.signature) if total_mode == TotalMode.EXACT else None
+        with_total = total_mode == TotalMode.EXACT and total is None and after is None
+        blogs, window_total = await page.fetch_single(session, with_total=with_total)
+        if window_total is not None or (with_total and skip == 0):
+            total = window_total or 0
+            blog_counts.store(page.signature, total)
+        elif total is None:
+            total = await blog_counts.total(session, page.count_source(), page.signature, total_mode)
+    else:
+        # Get total count (cached per filter signature, see app.services.counts)
+        total = await blog_counts.total(session, page.count_source(), page.signature, total_mode)
+        blogs = await page.fetch_orm(session)
+    
+    return response_cache.set(
+        cache_key,
+        BlogsResponse(
+            blogs=blogs,
+            total=total,
+            skip=skip,
+            limit=limit,
+            next_cursor=None if page.ranked else next_cursor(blogs, limit, "publish_date")
+        ),
+        BlogsResponse,
+        validators
+    )
+
+
+@router.get("/facets", response_model=BlogFacets)
+async def get_blog_facets(
+    request: Request,
+    session: AsyncSession = Depends(get_read_session)
+):
+    """Published-post counts per tag, per month and featured, for the blog sidebar"""
+    cache_key = response_cache.key("blogs", "facets")
+    cached, validators = await response_cache.lookup(request, session, cache_key)
+    if cached is not None:
+        return cached
     
-    result = await session.execute(query)
-    blogs = result.scalars().all()
+    return response_cache.set(cache_key, await load_facets(session), BlogFacets, validators)
+
+
+@router.post("/facets/rebuild", response_model=BlogFacets)
+async def rebuild_blog_facets(
+    current_user: Principal = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Recompute the facet counts from scratch (backfill or repair)"""
+    await rebuild_facets(session)
+    await bump_content_version(session, "blogs")
+    await session.commit()
+    await event_bus.publish("blog", "updated")
     
-    return BlogsResponse(
-        blogs=[BlogList.model_validate(blog) for blog in blogs],
-        total=total,
-        skip=skip,
-        limit=limit
-    )
+    return await load_facets(session)
+
+
+@router.post("/related/rebuild", response_model=MessageResponse)
+async def rebuild_related_posts(
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """Recompute every post's related list (after a restart or a bulk import)"""
+    written = await related_engine.rebuild()
+    return MessageResponse(message=f"Related posts rebuilt for {written} posts")
 
 
 @router.get("/featured", response_model=List[BlogList])
 async def get_featured_blogs(
+    request: Request,
     limit: int = Query(3, ge=1, le=10),
-    session: AsyncSession = Depends(get_async_session)
+    session: AsyncSession = Depends(get_read_session)
 ):
+    cache_key = response_cache.key("blogs", "featured", limit=limit)
+    cached, validators = await response_cache.lookup(request, session, cache_key)
+    if cached is not None:
+        return cached
+    
     query = select(Blog).options(
-        selectinload(Blog.author),
+        load_only(*BLOG_LIST_COLUMNS),
+        selectinload(Blog.author).load_only(*AUTHOR_COLUMNS),
         selectinload(Blog.tags)
     ).where(
         and_(Blog.published == True, Blog.featured == True)
@@ -91,19 +249,34 @@ async def get_featured_blogs(
     result = await session.execute(query)
     blogs = result.scalars().all()
     
-    return [BlogList.model_validate(blog) for blog in blogs]
+    return response_cache.set(
+        cache_key, validate_rows(BlogList, blogs), List[BlogList], validators
+    )
 
 
 @router.get("/{slug}", response_model=BlogSchema)
 async def get_blog_by_slug(
     slug: str,
-    session: AsyncSession = Depends(get_async_session),
-    current_user: Optional[User] = Depends(get_optional_current_user)
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Optional[Principal] = Depends(get_optional_current_user)
 ):
+    # Conditional request: check the validators before loading the post body
+    if "if-none-match" in request.headers or "if-modified-since" in request.headers:
+        result = await session.execute(
+            select(Blog.id, Blog.published, Blog.updated_at).where(Blog.slug == slug)
+        )
+        row = result.one_or_none()
+        if row is not None and _can_view(row.published, current_user):
+            validators = _blog_validators(row.id, row.updated_at)
+            if validators.matches(request):
+                await view_counter.record(row.id)
+                return validators.not_modified()
+    
     query = select(Blog).options(
-        selectinload(Blog.author),
-        selectinload(Blog.tags),
-        selectinload(Blog.comments)
+        selectinload(Blog.author).load_only(*AUTHOR_COLUMNS),
+        selectinload(Blog.tags)
     ).where(Blog.slug == slug)
     
     result = await session.execute(query)
@@ -116,24 +289,68 @@ async def get_blog_by_slug(
         )
     
     # Check if user can view unpublished blog
-    if not blog.published:
-        if not current_user or current_user.role != "ADMIN":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Blog not found"
-            )
+    if not _can_view(blog.published, current_user):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blog not found"
+        )
     
-    # Increment views
-    blog.views += 1
-    await session.commit()
+    # Count the view; it is written to the database in batches
+    pending_views = await view_counter.record(blog.id)
     
-    return BlogSchema.model_validate(blog)
+    response.headers.update(_blog_validators(blog.id, blog.updated_at).headers())
+    blog_response = BlogSchema.model_validate(blog)
+    blog_response.views += pending_views
+    return blog_response
+
+
+@router.get("/{slug}/bundle", response_model=BlogBundle)
+async def get_blog_bundle(
+    slug: str,
+    comments_limit: int = Query(20, ge=1, le=100),
+    related_limit: int = Query(3, ge=1, le=settings.RELATED_POSTS_K),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: Optional[Principal] = Depends(get_optional_current_user)
+):
+    """Everything the blog detail page shows, in one round trip"""
+    ref = await _resolve_slug(session, slug)
+    if ref is None or not _can_view(ref[1], current_user):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blog not found"
+        )
+    blog_id = ref[0]
+    
+    # The parts are independent: fetch them concurrently, one session each
+    async def with_sibling(load):
+        async with sibling_session(session) as sibling:
+            return await load(sibling)
+    
+    blog, comments, related, pending_views = await asyncio.gather(
+        _load_blog(session, blog_id),
+        with_sibling(lambda sibling: _comment_page(sibling, blog_id, True, comments_limit, None)),
+        with_sibling(lambda sibling: related_posts(sibling, blog_id, related_limit)),
+        view_counter.record(blog_id)
+    )
+    
+    # Deleted or unpublished since the slug was cached (another worker's write)
+    if blog is None or not _can_view(blog.published, current_user):
+        slug_cache.delete(slug)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blog not found"
+        )
+    blog.views += pending_views
+    
+    return TypedJSONResponse(
+        BlogBundle(blog=blog, comments=comments, related=related), BlogBundle
+    )
 
 
 @router.post("/", response_model=BlogSchema)
 async def create_blog(
     blog_data: BlogCreate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
     # Check if slug already exists
@@ -156,25 +373,33 @@ async def create_blog(
         slug=blog_data.slug,
         published=blog_data.published,
         featured=blog_data.featured,
-        author_id=current_user.id
+        author_id=current_user.id,
+        tags=[]
     )
     
     session.add(db_blog)
     await session.flush()
     
     # Add tags if provided
+    tags = []
     if blog_data.tag_ids:
         tag_result = await session.execute(select(Tag).where(Tag.id.in_(blog_data.tag_ids)))
         tags = tag_result.scalars().all()
         db_blog.tags = tags
     
+    # publish_date comes from the server default
+    await session.refresh(db_blog, ["publish_date"])
+    await apply_facet_changes(session, Counter(), blog_facet_keys(db_blog, [tag.id for tag in tags]))
+    await bump_content_version(session, "blogs")
     await session.commit()
+    await event_bus.publish("blog", "created", db_blog.id)
+    related_engine.mark_dirty(db_blog.id)
     await session.refresh(db_blog)
     
     # Load relationships
     result = await session.execute(
         select(Blog).options(
-            selectinload(Blog.author),
+            selectinload(Blog.author).load_only(*AUTHOR_COLUMNS),
             selectinload(Blog.tags)
         ).where(Blog.id == db_blog.id)
     )
@@ -187,11 +412,13 @@ async def create_blog(
 async def update_blog(
     blog_id: str,
     blog_data: BlogUpdate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
-    # Get blog
-    result = await session.execute(select(Blog).where(Blog.id == blog_id))
+    # Get blog (tags are loaded so they can be replaced below)
+    result = await session.execute(
+        select(Blog).options(selectinload(Blog.tags)).where(Blog.id == blog_id)
+    )
     blog = result.scalar_one_or_none()
     
     if not blog:
@@ -200,6 +427,8 @@ async def update_blog(
             detail="Blog not found"
         )
     
+    facets_before = blog_facet_keys(blog)
+    
     # Update fields
     update_data = blog_data.dict(exclude_unset=True)
     tag_ids = update_data.pop("tag_ids", None)
@@ -212,14 +441,19 @@ async def update_blog(
         tag_result = await session.execute(select(Tag).where(Tag.id.in_(tag_ids)))
         tags = tag_result.scalars().all()
         blog.tags = tags
+        blog.updated_at = func.now()  # tag changes alone do not touch the row
     
+    await apply_facet_changes(session, facets_before, blog_facet_keys(blog))
+    await bump_content_version(session, "blogs")
     await session.commit()
+    await event_bus.publish("blog", "updated", blog_id)
+    related_engine.mark_dirty(blog_id)
     await session.refresh(blog)
     
     # Load relationships
     result = await session.execute(
         select(Blog).options(
-            selectinload(Blog.author),
+            selectinload(Blog.author).load_only(*AUTHOR_COLUMNS),
             selectinload(Blog.tags)
         ).where(Blog.id == blog.id)
     )
@@ -231,11 +465,13 @@ async def update_blog(
 @router.delete("/{blog_id}", response_model=MessageResponse)
 async def delete_blog(
     blog_id: str,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
-    # Get blog
-    result = await session.execute(select(Blog).where(Blog.id == blog_id))
+    # Get blog (with tags, for the facet counts)
+    result = await session.execute(
+        select(Blog).options(selectinload(Blog.tags)).where(Blog.id == blog_id)
+    )
     blog = result.scalar_one_or_none()
     
     if not blog:
@@ -244,69 +480,77 @@ async def delete_blog(
             detail="Blog not found"
         )
     
-    await session.delete(blog)
+    await delete_blogs(session, [blog])
     await session.commit()
+    await blogs_deleted([blog_id])
     
     return MessageResponse(message="Blog deleted successfully")
 
 
+@router.get("/{blog_id}/related", response_model=List[BlogList])
+async def get_related_posts(
+    blog_id: str,
+    limit: int = Query(3, ge=1, le=settings.RELATED_POSTS_K),
+    session: AsyncSession = Depends(get_read_session)
+):
+    return TypedJSONResponse(await related_posts(session, blog_id, limit), List[BlogList])
+
+
 # Comments endpoints
-@router.get("/{blog_id}/comments", response_model=List[CommentSchema])
+@router.get("/{blog_id}/comments", response_model=CommentsResponse)
 async def get_blog_comments(
     blog_id: str,
     approved_only: bool = Query(True),
-    session: AsyncSession = Depends(get_async_session)
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    session: AsyncSession = Depends(get_read_session)
 ):
-    query = select(Comment).where(Comment.blog_id == blog_id)
-    
-    if approved_only:
-        query = query.where(Comment.approved == True)
-    
-    query = query.order_by(Comment.created_at.desc())
-    
-    result = await session.execute(query)
-    comments = result.scalars().all()
-    
-    return [CommentSchema.model_validate(comment) for comment in comments]
+    return TypedJSONResponse(
+        await _comment_page(session, blog_id, approved_only, limit, after), CommentsResponse
+    )
 
 
-@router.post("/{blog_id}/comments", response_model=CommentSchema)
+@router.post(
+    "/{blog_id}/comments", response_model=CommentSchema, status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(rate_limiter.limit("comment"))]
+)
 async def create_comment(
     blog_id: str,
     comment_data: CommentCreate,
     session: AsyncSession = Depends(get_async_session)
 ):
     # Check if blog exists
-    result = await session.execute(select(Blog).where(Blog.id == blog_id))
-    blog = result.scalar_one_or_none()
-    
-    if not blog:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Blog not found"
-        )
+    if blog_id_cache.get(blog_id) is None:
+        result = await session.execute(select(Blog.id).where(Blog.id == blog_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Blog not found"
+            )
+        blog_id_cache.set(blog_id, True)
     
-    # Create comment
-    db_comment = Comment(
+    # Queued for the next batched insert; new comments await approval, so the
+    # post's approved comment count is unaffected
+    now = datetime.utcnow()
+    comment = CommentSchema(
         id=str(uuid.uuid4()),
         content=comment_data.content,
         author_name=comment_data.author_name,
         author_email=comment_data.author_email,
         blog_id=blog_id,
-        approved=False  # Comments need approval by default
+        approved=False,  # Comments need approval by default
+        created_at=now,
+        updated_at=now
     )
+    await ingest_buffer.accept(Comment.__table__, comment.model_dump())
     
-    session.add(db_comment)
-    await session.commit()
-    await session.refresh(db_comment)
-    
-    return CommentSchema.model_validate(db_comment)
+    return comment
 
 
 @router.put("/comments/{comment_id}/approve", response_model=CommentSchema)
 async def approve_comment(
     comment_id: str,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
     # Get comment
@@ -319,8 +563,18 @@ async def approve_comment(
             detail="Comment not found"
         )
     
-    comment.approved = True
+    # Conditional, so a repeated or concurrent approve counts the comment once
+    result = await session.execute(
+        update(Comment)
+        .where(Comment.id == comment_id, Comment.approved.is_not(True))
+        .values(approved=True)
+    )
+    newly_approved = result.rowcount == 1
+    if newly_approved:
+        await _adjust_comment_count(session, comment.blog_id, 1)
     await session.commit()
+    if newly_approved:
+        await event_bus.publish("blog", "updated", comment.blog_id)
     await session.refresh(comment)
     
     return CommentSchema.model_validate(comment)
@@ -329,7 +583,7 @@ async def approve_comment(
 @router.delete("/comments/{comment_id}", response_model=MessageResponse)
 async def delete_comment(
     comment_id: str,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
     # Get comment
@@ -342,7 +596,20 @@ async def delete_comment(
             detail="Comment not found"
         )
     
-    await session.delete(comment)
+    # Whether the row was approved when this statement deleted it, so a
+    # concurrent approve or a second delete cannot shift the count twice
+    result = await session.execute(
+        delete(Comment)
+        .where(Comment.id == comment_id)
+        .returning(Comment.approved)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = result.first()
+    blog_id, was_approved = comment.blog_id, deleted is not None and bool(deleted.approved)
+    if was_approved:
+        await _adjust_comment_count(session, blog_id, -1)
     await session.commit()
+    if was_approved:
+        await event_bus.publish("blog", "updated", blog_id)
     
     return MessageResponse(message="Comment deleted successfully")
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,27 +9,30 @@ from app.core.deps import get_current_admin_user
 from app.database import get_async_session
 from app.models.models import Contact, ContactStatus
 from app.schemas.schemas import Contact as ContactSchema, ContactCreate, MessageResponse
+from app.services.ingest import ingest_buffer
+from app.services.rate_limit import rate_limiter
+from app.services.serialization import TypedJSONResponse, validate_rows
 
 router = APIRouter()
 
+ingest_buffer.register(Contact.__table__)
 
-@router.post("/", response_model=MessageResponse)
-async def submit_contact_form(
-    contact_data: ContactCreate,
-    session: AsyncSession = Depends(get_async_session)
-):
-    # Create contact submission
-    db_contact = Contact(
-        id=str(uuid.uuid4()),
-        name=contact_data.name,
-        email=contact_data.email,
-        subject=contact_data.subject,
-        message=contact_data.message,
-        status=ContactStatus.UNREAD
-    )
-    
-    session.add(db_contact)
-    await session.commit()
+
+@router.post(
+    "/", response_model=MessageResponse, status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(rate_limiter.limit("contact"))]
+)
+async def submit_contact_form(contact_data: ContactCreate):
+    # Queued for the next batched insert (see app/services/ingest.py)
+    await ingest_buffer.accept(Contact.__table__, {
+        "id": str(uuid.uuid4()),
+        "name": contact_data.name,
+        "email": contact_data.email,
+        "subject": contact_data.subject,
+        "message": contact_data.message,
+        "status": ContactStatus.UNREAD.name,
+        "created_at": datetime.utcnow()
+    })
     
     return MessageResponse(message="Thank you for your message! We'll get back to you soon.")
 
@@ -56,7 +60,7 @@ async def get_contacts(
     result = await session.execute(query)
     contacts = result.scalars().all()
     
-    return [ContactSchema.model_validate(contact) for contact in contacts]
+    return TypedJSONResponse(validate_rows(ContactSchema, contacts), List[ContactSchema])
 
 
 @router.put("/{contact_id}/status", response_model=ContactSchema)
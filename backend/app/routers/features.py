@@ -1,22 +1,39 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import uuid
 
 from app.core.deps import get_current_admin_user
-from app.database import get_async_session
+from app.database import get_async_session, get_read_session
 from app.models.models import Feature
 from app.schemas.schemas import Feature as FeatureSchema, FeatureCreate, MessageResponse
+from app.services.conditional import bump_content_version
+from app.services.events import EntityChanged, event_bus
+from app.services.response_cache import response_cache
+from app.services.serialization import validate_rows
 
 router = APIRouter()
 
 
+def invalidate_feature_caches(event: EntityChanged):
+    response_cache.invalidate("features")
+
+
+event_bus.subscribe("feature", invalidate_feature_caches)
+
+
 @router.get("/", response_model=List[FeatureSchema])
 async def get_features(
+    request: Request,
     published_only: bool = True,
-    session: AsyncSession = Depends(get_async_session)
+    session: AsyncSession = Depends(get_read_session)
 ):
+    cache_key = response_cache.key("features", "list", published_only=published_only)
+    cached, validators = await response_cache.lookup(request, session, cache_key)
+    if cached is not None:
+        return cached
+    
     query = select(Feature)
     
     if published_only:
@@ -27,7 +44,12 @@ async def get_features(
     result = await session.execute(query)
     features = result.scalars().all()
     
-    return [FeatureSchema.model_validate(feature) for feature in features]
+    return response_cache.set(
+        cache_key,
+        validate_rows(FeatureSchema, features),
+        List[FeatureSchema],
+        validators
+    )
 
 
 @router.post("/", response_model=FeatureSchema)
@@ -57,7 +79,9 @@ async def create_feature(
     )
     
     session.add(db_feature)
+    await bump_content_version(session, "features")
     await session.commit()
+    await event_bus.publish("feature", "created", db_feature.id)
     await session.refresh(db_feature)
     
     return FeatureSchema.model_validate(db_feature)
@@ -85,7 +109,9 @@ async def update_feature(
     for field, value in update_data.items():
         setattr(feature, field, value)
     
+    await bump_content_version(session, "features")
     await session.commit()
+    await event_bus.publish("feature", "updated", feature_id)
     await session.refresh(feature)
     
     return FeatureSchema.model_validate(feature)
@@ -108,6 +134,8 @@ async def delete_feature(
         )
     
     await session.delete(feature)
+    await bump_content_version(session, "features")
     await session.commit()
+    await event_bus.publish("feature", "deleted", feature_id)
     
     return MessageResponse(message="Feature deleted successfully")
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends
+
+from app.core.deps import get_current_admin_user, principal_cache
+from app.core.security import hashing_executor
+from app.database import pool_stats
+from app.services.counts import blog_counts
+from app.services.events import event_bus
+from app.services.ingest import ingest_buffer
+from app.services.newsletter_dispatch import newsletter_dispatcher
+from app.services.rate_limit import rate_limiter
+from app.services.related import related_engine
+from app.services.response_cache import response_cache
+from app.services.view_counter import view_counter
+
+router = APIRouter()
+
+
+@router.get("/pool")
+async def get_pool_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return pool_stats()
+
+
+@router.get("/hashing")
+async def get_hashing_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return hashing_executor.stats()
+
+
+@router.get("/ingest")
+async def get_ingest_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return ingest_buffer.stats()
+
+
+@router.get("/newsletter")
+async def get_newsletter_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return newsletter_dispatcher.stats()
+
+
+@router.get("/rate-limits")
+async def get_rate_limit_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return rate_limiter.stats()
+
+
+@router.get("/related")
+async def get_related_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return related_engine.stats()
+
+
+@router.get("/views")
+async def get_view_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return view_counter.stats()
+
+
+@router.get("/cache")
+async def get_cache_metrics(
+    current_user = Depends(get_current_admin_user)
+):
+    return {
+        "responses": response_cache.stats(),
+        "blog_counts": blog_counts.cache.stats(),
+        "principals": principal_cache.stats(),
+        "events": event_bus.stats(),
+    }
@@ -288,20 +288,32 @@
 #         )
 
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status, Query
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, delete
 import uuid
 
+from app.core.config import settings
 from app.core.deps import get_current_admin_user
-from app.database import get_async_session
+from app.database import get_async_session, get_read_session
 from app.models.models import MenuItem
 from app.schemas.schemas import MenuItem as MenuItemSchema, MenuItemCreate, MessageResponse
+from app.services.conditional import bump_content_version
+from app.services.events import EntityChanged, event_bus
+from app.services.response_cache import response_cache
+from app.services.serialization import TypedJSONResponse, validate_rows
 
 router = APIRouter()
 
+
+def invalidate_menu_caches(event: EntityChanged):
+    response_cache.invalidate("menu")
+
+
+event_bus.subscribe("menu_item", invalidate_menu_caches)
+
 # Note: CORS middleware should be in main.py
 # app = FastAPI()
 # app.add_middleware(
@@ -312,50 +324,270 @@ router = APIRouter()
 #     allow_headers=["*"],
 # )
 
+
+MENU_COLUMNS = (
+    MenuItem.id, MenuItem.title, MenuItem.path, MenuItem.new_tab, MenuItem.order,
+    MenuItem.published, MenuItem.parent_id, MenuItem.created_at, MenuItem.updated_at
+)
+
+
+async def load_menu_tree(session: AsyncSession, include_unpublished: bool = False) -> List[MenuItemSchema]:
+    """Fetch the whole menu in one query and assemble it into a tree.
+
+    Items are grouped by parent_id in an adjacency map and attached from the
+    roots down, so any depth works. Items whose parent is missing (or hidden
+    because it is unpublished) are left out, like the children of a hidden item.
+    """
+    query = select(*MENU_COLUMNS).order_by(MenuItem.order, MenuItem.created_at)
+    if not include_unpublished:
+        query = query.where(MenuItem.published == True)
+    
+    result = await session.execute(query)
+    
+    children_by_parent: Dict[Optional[str], List[dict]] = {}
+    for row in result.mappings():
+        item = dict(row, children=[])
+        children_by_parent.setdefault(item["parent_id"], []).append(item)
+    
+    roots = children_by_parent.get(None, [])
+    stack = list(roots)
+    while stack:
+        item = stack.pop()
+        item["children"] = children_by_parent.get(item["id"], [])
+        stack.extend(item["children"])
+    
+    return validate_rows(MenuItemSchema, roots)
+
+
+async def load_menu_parents(session: AsyncSession) -> Dict[str, Optional[str]]:
+    """Every menu item's parent_id, keyed by id."""
+    result = await session.execute(select(MenuItem.id, MenuItem.parent_id))
+    return dict(result.all())
+
+
+def menu_subtree(parents: Dict[str, Optional[str]], item_ids: List[str]) -> set:
+    """``item_ids`` and all of their descendants."""
+    children_by_parent: Dict[Optional[str], List[str]] = {}
+    for item_id, parent_id in parents.items():
+        children_by_parent.setdefault(parent_id, []).append(item_id)
+    
+    subtree = set()
+    stack = list(item_ids)
+    while stack:
+        item_id = stack.pop()
+        if item_id not in subtree:
+            subtree.add(item_id)
+            stack.extend(children_by_parent.get(item_id, []))
+    return subtree
+
+
+def menu_item_response(menu_item: MenuItem) -> MenuItemSchema:
+    # Built from columns; touching the children relationship would lazy-load
+    item = {column.key: getattr(menu_item, column.key) for column in MENU_COLUMNS}
+    return MenuItemSchema.model_validate(dict(item, children=[]))
+
+
+async def menu_changed(session: AsyncSession, action: str, item_id: Optional[str] = None):
+    await bump_content_version(session, "menu")
+    await session.commit()
+    await event_bus.publish("menu_item", action, item_id)
+
+
 @router.get("/menu", response_model=List[MenuItemSchema])
 async def get_menu_items(
+    request: Request,
+    session: AsyncSession = Depends(get_read_session)
+):
+    cache_key = response_cache.key("menu", "published")
+    cached, validators = await response_cache.lookup(request, session, cache_key)
+    if cached is not None:
+        return cached
+    
+    menu_response = await load_menu_tree(session)
+    
+    # Kept until the next menu write (see invalidate_menu_caches)
+    return response_cache.set(
+        cache_key, menu_response, List[MenuItemSchema], validators,
+        ttl=settings.MENU_CACHE_TTL_SECONDS
+    )
+
+
+@router.post("/menu", response_model=MenuItemSchema)
+async def create_menu_item(
+    menu_data: MenuItemCreate,
+    current_user = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
-    query = select(MenuItem).where(
-        MenuItem.parent_id.is_(None),
-        MenuItem.published == True
-    ).order_by(MenuItem.order)
+    # Create menu item
+    db_menu_item = MenuItem(
+        id=str(uuid.uuid4()),
+        title=menu_data.title,
+        path=menu_data.path,
+        new_tab=menu_data.new_tab,
+        order=menu_data.order,
+        published=menu_data.published,
+        parent_id=menu_data.parent_id
+    )
     
-    result = await session.execute(query)
-    menu_items = result.scalars().all()
-    
-    menu_response = []
-    for item in menu_items:
-        children_query = select(MenuItem).where(
-            MenuItem.parent_id == item.id,
-            MenuItem.published == True
-        ).order_by(MenuItem.order)
-        children_result = await session.execute(children_query)
-        children = children_result.scalars().all()
+    session.add(db_menu_item)
+    await menu_changed(session, "created", db_menu_item.id)
+    await session.refresh(db_menu_item)
+    
+    return menu_item_response(db_menu_item)
+
+
+@router.put("/menu/{item_id}", response_model=MenuItemSchema)
+async def update_menu_item(
+    item_id: str,
+    menu_data: MenuItemCreate,
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    # Get menu item
+    result = await session.execute(select(MenuItem).where(MenuItem.id == item_id))
+    menu_item = result.scalar_one_or_none()
+    
+    if not menu_item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Menu item not found"
+        )
+    
+    if menu_data.parent_id == item_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A menu item cannot be its own parent"
+        )
+    
+    # Moving an item under one of its own descendants would detach both from the tree
+    if menu_data.parent_id is not None and menu_data.parent_id != menu_item.parent_id:
+        parents = await load_menu_parents(session)
+        ancestor, seen = menu_data.parent_id, set()
+        while ancestor is not None and ancestor not in seen:
+            if ancestor == item_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="A menu item cannot be moved under one of its descendants"
+                )
+            seen.add(ancestor)
+            ancestor = parents.get(ancestor)
+    
+    # Update fields
+    update_data = menu_data.dict()
+    for field, value in update_data.items():
+        setattr(menu_item, field, value)
+    
+    await menu_changed(session, "updated", item_id)
+    await session.refresh(menu_item)
+    
+    return menu_item_response(menu_item)
+
+
+@router.delete("/menu/{item_id}", response_model=MessageResponse)
+async def delete_menu_item(
+    item_id: str,
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    # Get menu item
+    result = await session.execute(select(MenuItem).where(MenuItem.id == item_id))
+    menu_item = result.scalar_one_or_none()
+    
+    if not menu_item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Menu item not found"
+        )
+    
+    # Children move up to the deleted item's parent
+    await session.execute(
+        update(MenuItem)
+        .where(MenuItem.parent_id == item_id)
+        .values(parent_id=menu_item.parent_id)
+    )
+    await session.delete(menu_item)
+    await menu_changed(session, "deleted", item_id)
+    
+    return MessageResponse(message="Menu item deleted successfully")
+
+
+@router.get("/admin/menu", response_model=List[MenuItemSchema])
+async def get_all_menu_items(
+    include_unpublished: bool = Query(False),
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Get all menu items for admin management (including unpublished)"""
+    return TypedJSONResponse(
+        await load_menu_tree(session, include_unpublished=include_unpublished),
+        List[MenuItemSchema]
+    )
+
+
+@router.post("/admin/menu/reorder", response_model=MessageResponse)
+async def reorder_menu_items(
+    item_orders: List[dict],  # [{'id': 'uuid', 'order': 1, 'parent_id': 'uuid'}]
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Bulk update menu item orders and hierarchy"""
+    try:
+        for item_data in item_orders:
+            await session.execute(
+                update(MenuItem)
+                .where(MenuItem.id == item_data['id'])
+                .values(
+                    order=item_data.get('order', 0),
+                    parent_id=item_data.get('parent_id')
+                )
+            )
+        
+        await menu_changed(session, "updated")
+        return MessageResponse(message="Menu items reordered successfully")
+        
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to reorder menu items: {str(e)}"
+        )
+
+
+@router.post("/admin/menu/bulk-action", response_model=MessageResponse)
+async def bulk_menu_action(
+    item_ids: List[str] = Body(...),
+    action: str = Body(...),  # 'publish', 'unpublish', 'delete'
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Perform bulk actions on menu items"""
+    if action not in ['publish', 'unpublish', 'delete']:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid action. Must be 'publish', 'unpublish', or 'delete'"
+        )
+    
+    try:
+        if action == 'delete':
+            # Delete items together with everything below them, in one
+            # statement so no row is left pointing at a deleted parent
+            subtree = menu_subtree(await load_menu_parents(session), item_ids)
+            await session.execute(delete(MenuItem).where(MenuItem.id.in_(subtree)))
+        else:
+            # Update published status
+            published = action == 'publish'
+            await session.execute(
+                update(MenuItem)
+                .where(MenuItem.id.in_(item_ids))
+                .values(published=published)
+            )
+        
+        await menu_changed(session, "deleted" if action == 'delete' else "updated")
+        return MessageResponse(message=f"Bulk {action} completed successfully")
         
-        item_dict = {
-            "id": str(item.id),
-            "title": item.title,
-            "path": item.path,
-            "new_tab": item.new_tab,
-            "order": item.order,
-            "children": [
-                {
-                    "id": str(child.id),
-                    "title": child.title,
-                    "path": child.path,
-                    "new_tab": child.new_tab,
-                    "order": child.order,
-                    "children": []
-                }
-                for child in children
-            ],
-            "created_at": item.created_at.isoformat(),
-            "updated_at": item.updated_at.isoformat()
-        }
-        menu_response.append(MenuItemSchema.model_validate(item_dict))
-    
-    return menu_response
-
-# Include other routes (POST, PUT, DELETE, etc.) as previously provided...
-# (Omitted for brevity but can be added back as needed)
\ No newline at end of file
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Bulk action failed: {str(e)}"
+        )
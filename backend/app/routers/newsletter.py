@@ -1,18 +1,28 @@
+from datetime import date
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import uuid
 
+from app.core.config import settings
 from app.core.deps import get_current_admin_user
 from app.database import get_async_session
-from app.models.models import Newsletter
-from app.schemas.schemas import Newsletter as NewsletterSchema, NewsletterCreate, MessageResponse
+from app.models.models import Campaign, CampaignStatus, Newsletter
+from app.schemas.schemas import (
+    Campaign as CampaignSchema, CampaignCreate, Newsletter as NewsletterSchema, NewsletterCreate,
+    MessageResponse, SubscriberImportResponse
+)
+from app.services.export import ExportFormat, export_response
+from app.services.newsletter_dispatch import newsletter_dispatcher
+from app.services.rate_limit import rate_limiter
+from app.services.serialization import TypedJSONResponse, validate_rows
+from app.services.subscriber_import import import_subscribers
 
 router = APIRouter()
 
 
-@router.post("/subscribe", response_model=MessageResponse)
+@router.post("/subscribe", response_model=MessageResponse, dependencies=[Depends(rate_limiter.limit("newsletter"))])
 async def subscribe_to_newsletter(
     newsletter_data: NewsletterCreate,
     session: AsyncSession = Depends(get_async_session)
@@ -81,7 +91,42 @@ async def get_newsletter_subscribers(
     result = await session.execute(query)
     subscribers = result.scalars().all()
     
-    return [NewsletterSchema.model_validate(subscriber) for subscriber in subscribers]
+    return TypedJSONResponse(validate_rows(NewsletterSchema, subscribers), List[NewsletterSchema])
+
+
+@router.get("/subscribers/export")
+async def export_newsletter_subscribers(
+    format: ExportFormat = Query(ExportFormat.CSV),
+    active_only: bool = True,
+    current_user = Depends(get_current_admin_user)
+):
+    """Download subscribers as CSV or NDJSON, streamed in batches"""
+    query = select(
+        Newsletter.id, Newsletter.email, Newsletter.active,
+        Newsletter.created_at, Newsletter.updated_at
+    )
+    
+    if active_only:
+        query = query.where(Newsletter.active == True)
+    
+    query = query.order_by(Newsletter.created_at.desc(), Newsletter.id.desc())
+    
+    return export_response(
+        query, format, f"subscribers-{date.today():%Y%m%d}", settings.EXPORT_BATCH_SIZE
+    )
+
+
+@router.post("/subscribers/import", response_model=SubscriberImportResponse)
+async def import_newsletter_subscribers(
+    request: Request,
+    format: ExportFormat = Query(ExportFormat.CSV),
+    current_user = Depends(get_current_admin_user)
+):
+    """Bulk subscribe the addresses in a CSV (with an email column) or NDJSON request body
+
+    The body is read as a stream; existing inactive subscribers are reactivated.
+    """
+    return await import_subscribers(request.stream(), format, settings.IMPORT_BATCH_SIZE)
 
 
 @router.delete("/subscribers/{subscriber_id}", response_model=MessageResponse)
@@ -104,3 +149,90 @@ async def delete_subscriber(
     await session.commit()
     
     return MessageResponse(message="Subscriber deleted successfully")
+
+
+# Campaigns
+def _campaign_response(campaign: Campaign) -> CampaignSchema:
+    response = CampaignSchema.model_validate(campaign)
+    response.sending = newsletter_dispatcher.running(campaign.id)
+    return response
+
+
+@router.post("/campaigns", response_model=CampaignSchema)
+async def create_campaign(
+    campaign_data: CampaignCreate,
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    db_campaign = Campaign(
+        id=str(uuid.uuid4()),
+        subject=campaign_data.subject,
+        body_text=campaign_data.body_text,
+        body_html=campaign_data.body_html,
+        status=CampaignStatus.DRAFT
+    )
+    
+    session.add(db_campaign)
+    await session.commit()
+    await session.refresh(db_campaign)
+    
+    return _campaign_response(db_campaign)
+
+
+@router.get("/campaigns", response_model=List[CampaignSchema])
+async def get_campaigns(
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    result = await session.execute(select(Campaign).order_by(Campaign.created_at.desc()))
+    return [_campaign_response(campaign) for campaign in result.scalars().all()]
+
+
+@router.get("/campaigns/{campaign_id}", response_model=CampaignSchema)
+async def get_campaign(
+    campaign_id: str,
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    campaign = await session.get(Campaign, campaign_id)
+    
+    if not campaign:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    
+    return _campaign_response(campaign)
+
+
+@router.post("/campaigns/{campaign_id}/send", response_model=CampaignSchema, status_code=status.HTTP_202_ACCEPTED)
+async def send_campaign(
+    campaign_id: str,
+    current_user = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Start sending to every active subscriber, or resume an interrupted send"""
+    campaign = await session.get(Campaign, campaign_id)
+    
+    if not campaign:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Campaign not found"
+        )
+    
+    if campaign.status == CampaignStatus.SENT:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Campaign has already been sent"
+        )
+    
+    if not await newsletter_dispatcher.claim(campaign_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Campaign is already being sent"
+        )
+    
+    newsletter_dispatcher.start(campaign_id)
+    await session.refresh(campaign)
+    
+    return _campaign_response(campaign)
@@ -1,23 +1,42 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import uuid
 
 from app.core.deps import get_current_admin_user
-from app.database import get_async_session
+from app.database import get_async_session, get_read_session
 from app.models.models import Testimonial
 from app.schemas.schemas import Testimonial as TestimonialSchema, TestimonialCreate, MessageResponse
+from app.services.conditional import bump_content_version
+from app.services.events import EntityChanged, event_bus
+from app.services.response_cache import response_cache
+from app.services.serialization import validate_rows
 
 router = APIRouter()
 
 
+def invalidate_testimonial_caches(event: EntityChanged):
+    response_cache.invalidate("testimonials")
+
+
+event_bus.subscribe("testimonial", invalidate_testimonial_caches)
+
+
 @router.get("/", response_model=List[TestimonialSchema])
 async def get_testimonials(
+    request: Request,
     published_only: bool = True,
     featured_only: bool = False,
-    session: AsyncSession = Depends(get_async_session)
+    session: AsyncSession = Depends(get_read_session)
 ):
+    cache_key = response_cache.key(
+        "testimonials", "list", published_only=published_only, featured_only=featured_only
+    )
+    cached, validators = await response_cache.lookup(request, session, cache_key)
+    if cached is not None:
+        return cached
+    
     query = select(Testimonial)
     
     if published_only:
@@ -31,7 +50,12 @@ async def get_testimonials(
     result = await session.execute(query)
     testimonials = result.scalars().all()
     
-    return [TestimonialSchema.model_validate(testimonial) for testimonial in testimonials]
+    return response_cache.set(
+        cache_key,
+        validate_rows(TestimonialSchema, testimonials),
+        List[TestimonialSchema],
+        validators
+    )
 
 
 @router.post("/", response_model=TestimonialSchema)
@@ -65,7 +89,9 @@ async def create_testimonial(
     )
     
     session.add(db_testimonial)
+    await bump_content_version(session, "testimonials")
     await session.commit()
+    await event_bus.publish("testimonial", "created", db_testimonial.id)
     await session.refresh(db_testimonial)
     
     return TestimonialSchema.model_validate(db_testimonial)
@@ -93,7 +119,9 @@ async def update_testimonial(
     for field, value in update_data.items():
         setattr(testimonial, field, value)
     
+    await bump_content_version(session, "testimonials")
     await session.commit()
+    await event_bus.publish("testimonial", "updated", testimonial_id)
     await session.refresh(testimonial)
     
     return TestimonialSchema.model_validate(testimonial)
@@ -116,6 +144,8 @@ async def delete_testimonial(
         )
     
     await session.delete(testimonial)
+    await bump_content_version(session, "testimonials")
     await session.commit()
+    await event_bus.publish("testimonial", "deleted", testimonial_id)
     
     return MessageResponse(message="Testimonial deleted successfully")
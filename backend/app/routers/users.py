@@ -2,33 +2,45 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import load_only, selectinload
 
-from app.core.deps import get_current_admin_user, get_current_active_user
+from app.core.deps import Principal, get_current_admin_user, get_current_active_user
 from app.database import get_async_session
-from app.models.models import User
+from app.models.models import Blog, User
 from app.schemas.schemas import User as UserSchema, UserUpdate, MessageResponse
+from app.services.blog_writes import author_updated, blogs_deleted, delete_blogs
+from app.services.events import event_bus
+from app.services.projection import schema_columns
+from app.services.serialization import TypedJSONResponse, validate_rows
 
 router = APIRouter()
 
+# Everything UserSchema returns; leaves the password hash in the database
+USER_COLUMNS = schema_columns(User, UserSchema)
+
 
 @router.get("/", response_model=List[UserSchema])
 async def get_users(
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
-    result = await session.execute(select(User).order_by(User.created_at.desc()))
+    result = await session.execute(
+        select(User).options(load_only(*USER_COLUMNS)).order_by(User.created_at.desc())
+    )
     users = result.scalars().all()
     
-    return [UserSchema.model_validate(user) for user in users]
+    return TypedJSONResponse(validate_rows(UserSchema, users), List[UserSchema])
 
 
 @router.get("/{user_id}", response_model=UserSchema)
 async def get_user(
     user_id: str,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
-    result = await session.execute(select(User).where(User.id == user_id))
+    result = await session.execute(
+        select(User).options(load_only(*USER_COLUMNS)).where(User.id == user_id)
+    )
     user = result.scalar_one_or_none()
     
     if not user:
@@ -44,7 +56,7 @@ async def get_user(
 async def update_user(
     user_id: str,
     user_data: UserUpdate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
     # Get user
@@ -59,10 +71,16 @@ async def update_user(
     
     # Update fields
     update_data = user_data.dict(exclude_unset=True)
+    changed = [field for field, value in update_data.items() if getattr(user, field) != value]
     for field, value in update_data.items():
         setattr(user, field, value)
     
+    # Renaming an author changes every list and post that shows them
+    posts_changed = await author_updated(session, user_id, changed)
     await session.commit()
+    await event_bus.publish("user", "updated", user_id)
+    if posts_changed:
+        await event_bus.publish("blog", "updated")
     await session.refresh(user)
     
     return UserSchema.model_validate(user)
@@ -71,7 +89,7 @@ async def update_user(
 @router.delete("/{user_id}", response_model=MessageResponse)
 async def delete_user(
     user_id: str,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_async_session)
 ):
     # Prevent admin from deleting themselves
@@ -91,8 +109,17 @@ async def delete_user(
             detail="User not found"
         )
     
+    # Their posts go through the same bookkeeping as a single blog delete
+    result = await session.execute(
+        select(Blog).options(selectinload(Blog.tags)).where(Blog.author_id == user_id)
+    )
+    blogs = result.scalars().all()
+    await delete_blogs(session, blogs)
+    
     await session.delete(user)
     await session.commit()
+    await event_bus.publish("user", "deleted", user_id)
+    await blogs_deleted(blog.id for blog in blogs)
     
     return MessageResponse(message="User deleted successfully")
 
@@ -105,10 +132,15 @@ async def update_own_profile(
 ):
     # Update current user's profile
     update_data = user_data.dict(exclude_unset=True)
+    changed = [field for field, value in update_data.items() if getattr(current_user, field) != value]
     for field, value in update_data.items():
         setattr(current_user, field, value)
     
+    posts_changed = await author_updated(session, current_user.id, changed)
     await session.commit()
+    await event_bus.publish("user", "updated", current_user.id)
+    if posts_changed:
+        await event_bus.publish("blog", "updated")
     await session.refresh(current_user)
     
     return UserSchema.model_validate(current_user)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, Field, WithJsonSchema
+from typing import Annotated, Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -17,6 +17,17 @@ class ContactStatus(str, Enum):
     ARCHIVED = "ARCHIVED"
 
 
+class CampaignStatus(str, Enum):
+    DRAFT = "DRAFT"
+    SENDING = "SENDING"
+    SENT = "SENT"
+
+
+# Addresses read back from the database were validated when they were written;
+# response schemas skip the (slow) re-check but document the same format
+StoredEmail = Annotated[str, WithJsonSchema({"type": "string", "format": "email"})]
+
+
 # Base schemas
 class UserBase(BaseModel):
     email: EmailStr
@@ -34,6 +45,7 @@ class UserUpdate(BaseModel):
 
 
 class User(UserBase):
+    email: StoredEmail
     id: str
     created_at: datetime
     updated_at: datetime
@@ -115,9 +127,11 @@ class BlogList(BaseModel):
     published: bool
     featured: bool
     views: int
+    approved_comment_count: int = 0
     publish_date: datetime
     author: User
     tags: List[Tag] = []
+    snippet: Optional[str] = None  # Highlighted search match, only set when searching
     
     model_config = {"from_attributes": True}
 
@@ -134,6 +148,7 @@ class CommentCreate(CommentBase):
 
 
 class Comment(CommentBase):
+    author_email: StoredEmail
     id: str
     approved: bool = False
     created_at: datetime
@@ -143,6 +158,12 @@ class Comment(CommentBase):
     model_config = {"from_attributes": True}
 
 
+class CommentsResponse(BaseModel):
+    comments: List[Comment]
+    limit: int
+    next_cursor: Optional[str] = None  # Pass as `after` to fetch the next page
+
+
 # Feature schemas
 class FeatureBase(BaseModel):
     title: str
@@ -202,6 +223,7 @@ class ContactCreate(ContactBase):
 
 
 class Contact(ContactBase):
+    email: StoredEmail
     id: str
     status: ContactStatus = ContactStatus.UNREAD
     created_at: datetime
@@ -220,6 +242,7 @@ class NewsletterCreate(NewsletterBase):
 
 
 class Newsletter(NewsletterBase):
+    email: StoredEmail
     id: str
     active: bool = True
     created_at: datetime
@@ -228,6 +251,48 @@ class Newsletter(NewsletterBase):
     model_config = {"from_attributes": True}
 
 
+class SubscriberImportBatch(BaseModel):
+    batch: int
+    received: int
+    new: int
+    reactivated: int
+    already_active: int
+    duplicates: int  # repeated within the batch
+    invalid: int
+    invalid_examples: List[str] = []  # first few, as "line N: value"
+
+
+class SubscriberImportResponse(BaseModel):
+    batches: List[SubscriberImportBatch]
+    received: int
+    new: int
+    reactivated: int
+    already_active: int
+    duplicates: int
+    invalid: int
+
+
+# Newsletter campaign schemas
+class CampaignCreate(BaseModel):
+    subject: str
+    body_text: str
+    body_html: Optional[str] = None
+
+
+class Campaign(CampaignCreate):
+    id: str
+    status: CampaignStatus = CampaignStatus.DRAFT
+    sent_count: int = 0
+    failed_count: int = 0
+    sending: bool = False  # a send is running in this worker
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = {"from_attributes": True}
+
+
 # Menu Item schemas
 class MenuItemBase(BaseModel):
     title: str
@@ -271,6 +336,36 @@ class PaginationParams(BaseModel):
 
 class BlogsResponse(BaseModel):
     blogs: List[BlogList]
-    total: int
+    total: Optional[int] = None  # None when requested with total_mode=none
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # Pass as `after` to fetch the next page
+
+
+# Blog detail page: the post plus what the page shows around it
+class BlogBundle(BaseModel):
+    blog: Blog
+    comments: CommentsResponse  # First page of approved comments
+    related: List[BlogList]
+
+
+# Blog sidebar facets (published posts only)
+class TagFacet(BaseModel):
+    id: str
+    name: str
+    slug: str
+    color: Optional[str] = None
+    count: int
+
+
+class MonthFacet(BaseModel):
+    year: int
+    month: int
+    count: int
+
+
+class BlogFacets(BaseModel):
+    total: int
+    featured: int
+    tags: List[TagFacet]
+    archive: List[MonthFacet]  # newest month first
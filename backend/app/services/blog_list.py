@@ -0,0 +1,196 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import JSON, and_, func, literal_column, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, load_only, selectinload
+
+from app.models.models import Blog, Tag, User, blog_tags
+from app.schemas.schemas import BlogList, User as UserSchema
+from app.services.pagination import keyset_after
+from app.services.projection import schema_columns
+from app.services.search import BlogSearch
+from app.services.serialization import validate_rows
+
+TAG_FIELDS = ("id", "name", "slug", "color")
+
+
+def tags_json(dialect: str):
+    """Correlated subquery: the blog's tags as a JSON array of objects."""
+    tag = aliased(Tag)
+    link = blog_tags.alias()
+    pairs = []
+    for field in TAG_FIELDS:
+        pairs += [literal_column(f"'{field}'"), getattr(tag, field)]
+
+    if dialect == "postgresql":
+        aggregate = func.coalesce(
+            func.json_agg(func.json_build_object(*pairs)),
+            literal_column("'[]'::json")
+        )
+    else:
+        aggregate = func.json_group_array(func.json_object(*pairs))
+
+    subquery = (
+        select(aggregate)
+        .select_from(link.join(tag, tag.id == link.c.tag_id))
+        .where(link.c.blog_id == Blog.id)
+        .correlate(Blog)
+        .scalar_subquery()
+    )
+    return type_coerce(subquery, JSON).label("tags")
+
+
+# Columns loaded for list responses: no post bodies, no password hashes
+BLOG_LIST_COLUMNS = schema_columns(Blog, BlogList, "author_id")
+AUTHOR_COLUMNS = schema_columns(User, UserSchema)
+AUTHOR_PREFIX = "user_"
+
+
+def list_columns(dialect: str) -> list:
+    """Flat columns for one BlogList per row: the blog, its author, its tags as JSON."""
+    columns = BLOG_LIST_COLUMNS + [
+        column.label(f"{AUTHOR_PREFIX}{column.key}") for column in AUTHOR_COLUMNS
+    ]
+    columns.append(tags_json(dialect))
+    return columns
+
+
+def list_item(row) -> dict:
+    """BlogList fields from a row selected with ``list_columns`` (joined to the author)."""
+    item = {column.key: getattr(row, column.key) for column in BLOG_LIST_COLUMNS}
+    item["author"] = {
+        column.key: getattr(row, f"{AUTHOR_PREFIX}{column.key}") for column in AUTHOR_COLUMNS
+    }
+    item["tags"] = row.tags or []
+    return item
+
+
+class BlogPage:
+    """One page of /api/blogs: filters, ordering and paging.
+
+    ``fetch_orm`` loads ORM rows plus ``selectinload`` round trips for authors
+    and tags. ``fetch_single`` gets the same page in one statement: the author
+    joined in, tags aggregated to JSON per blog and, on request, the filtered
+    total as ``count(*) OVER ()``.
+    """
+
+    def __init__(
+        self,
+        *,
+        published: Optional[bool],
+        featured: Optional[bool],
+        tag: Optional[str],
+        search: Optional[BlogSearch],
+        after: Optional[str],
+        skip: int,
+        limit: int
+    ):
+        self.published = published
+        self.featured = featured
+        self.tag = tag
+        self.search = search
+        self.after = after
+        self.skip = skip
+        self.limit = limit
+
+    @property
+    def signature(self) -> Tuple:
+        return (self.published, self.featured, self.search.term if self.search else None, self.tag)
+
+    @property
+    def ranked(self) -> bool:
+        """Searches are ranked and offset-paged on Postgres unless a cursor is given."""
+        return self.after is None and self.search is not None and self.search.rank is not None
+
+    @property
+    def filters(self) -> list:
+        filters = []
+        if self.published is not None:
+            filters.append(Blog.published == self.published)
+        if self.featured is not None:
+            filters.append(Blog.featured == self.featured)
+        if self.search is not None:
+            filters.append(self.search.condition)
+        if self.tag:
+            filters.append(Blog.tags.any(Tag.slug == self.tag))
+        return filters
+
+    def count_source(self):
+        """Statement whose row count is the filtered total."""
+        query = select(Blog.id)
+        filters = self.filters
+        return query.where(and_(*filters)) if filters else query
+
+    @property
+    def snippet_from_content(self) -> bool:
+        return self.search is not None and not self.search.postgres
+
+    def _paged(self, query):
+        filters = self.filters
+        if filters:
+            query = query.where(and_(*filters))
+
+        if self.search is not None and self.search.postgres:
+            query = query.add_columns(self.search.headline)
+        if self.ranked:
+            query = query.order_by(self.search.rank.desc(), Blog.publish_date.desc(), Blog.id.desc())
+        else:
+            query = query.order_by(Blog.publish_date.desc(), Blog.id.desc())
+
+        if self.after:
+            query = query.where(keyset_after(Blog.publish_date, Blog.id, self.after))
+        else:
+            query = query.offset(self.skip)
+        return query.limit(self.limit)
+
+    def _snippet(self, row, content: Optional[str]) -> Optional[str]:
+        if self.search is None:
+            return None
+        if self.search.postgres:
+            return row.search_snippet
+        return self.search.snippet(content)
+
+    def orm_statement(self):
+        columns = BLOG_LIST_COLUMNS + ([Blog.content] if self.snippet_from_content else [])
+        return self._paged(
+            select(Blog).options(
+                load_only(*columns),
+                selectinload(Blog.author).load_only(*AUTHOR_COLUMNS),
+                selectinload(Blog.tags)
+            )
+        )
+
+    def single_statement(self, dialect: str, with_total: bool = False):
+        columns = list_columns(dialect)
+        if self.snippet_from_content:
+            columns.append(Blog.content)
+        if with_total:
+            columns.append(func.count().over().label("total_count"))
+        return self._paged(select(*columns).join(Blog.author))
+
+    async def fetch_orm(self, session: AsyncSession) -> List[BlogList]:
+        result = await session.execute(self.orm_statement())
+        rows = result.all()
+
+        blogs = validate_rows(BlogList, [row[0] for row in rows])
+        for blog, row in zip(blogs, rows):
+            blog.snippet = self._snippet(row, row[0].content if self.snippet_from_content else None)
+        return blogs
+
+    async def fetch_single(
+        self, session: AsyncSession, with_total: bool = False
+    ) -> Tuple[List[BlogList], Optional[int]]:
+        """The page and, when ``with_total``, the filtered total (None if the page is empty)."""
+        result = await session.execute(
+            self.single_statement(session.bind.dialect.name, with_total)
+        )
+        rows = result.all()
+
+        items = []
+        for row in rows:
+            item = list_item(row)
+            item["snippet"] = self._snippet(row, row.content if self.snippet_from_content else None)
+            items.append(item)
+
+        total = rows[0].total_count if with_total and rows else None
+        return validate_rows(BlogList, items), total
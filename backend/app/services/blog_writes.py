@@ -0,0 +1,50 @@
+from collections import Counter
+from typing import Iterable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Blog
+from app.services.blog_list import AUTHOR_COLUMNS
+from app.services.conditional import bump_content_version
+from app.services.events import event_bus
+from app.services.facets import apply_facet_changes, blog_facet_keys
+from app.services.related import related_engine
+
+# User fields embedded in every blog response as its author
+AUTHOR_FIELDS = frozenset(column.key for column in AUTHOR_COLUMNS)
+
+
+async def delete_blogs(session: AsyncSession, blogs: Sequence[Blog]) -> None:
+    """Delete ``blogs`` (loaded with their tags) and take them out of the facet
+    counts; call before committing, then ``blogs_deleted()`` after.
+
+    Every path that removes posts goes through here, including a cascade from
+    their author, so facets, list versions and related posts stay in step.
+    """
+    if not blogs:
+        return
+    for blog in blogs:
+        await apply_facet_changes(session, blog_facet_keys(blog), Counter())
+        await session.delete(blog)
+    await bump_content_version(session, "blogs")
+
+
+async def blogs_deleted(blog_ids: Iterable[str]) -> None:
+    """Invalidate caches in every worker and queue the related-posts update."""
+    blog_ids = list(blog_ids)
+    for blog_id in blog_ids:
+        await event_bus.publish("blog", "deleted", blog_id)
+    related_engine.mark_dirty(*blog_ids)
+
+
+async def author_updated(session: AsyncSession, user_id: str, fields: Iterable[str]) -> bool:
+    """Advance the blogs version if ``fields`` show on ``user_id``'s posts; call
+    before committing. True if it did: publish a blog event after the commit.
+    """
+    if not AUTHOR_FIELDS.intersection(fields):
+        return False
+    if await session.scalar(select(Blog.id).where(Blog.author_id == user_id).limit(1)) is None:
+        return False
+    await bump_content_version(session, "blogs")
+    return True
@@ -0,0 +1,89 @@
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Hashable, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import ContentVersion
+from app.services.upsert import dialect_insert
+
+
+@dataclass(frozen=True)
+class Validators:
+    """ETag / Last-Modified pair for one representation."""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+    # False when the representation may predate the latest write (lagging replica)
+    cacheable: bool = field(default=True, compare=False)
+    # The response cache's invalidation count for the namespace when the
+    # representation started loading (see ResponseCache.lookup)
+    generation: Optional[int] = field(default=None, compare=False)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_as_utc(self.last_modified), usegmt=True)
+        return headers
+
+    def matches(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or _opaque(self.etag) in {_opaque(tag) for tag in tags}
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return _as_utc(self.last_modified).replace(microsecond=0) <= _as_utc(since)
+
+        return False
+
+    def not_modified(self) -> Response:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers())
+
+
+def make_etag(*parts: Hashable) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+async def bump_content_version(session: AsyncSession, namespace: str) -> None:
+    """Advance ``namespace``'s version; call before committing the write."""
+    insert = dialect_insert(session)
+    table = ContentVersion.__table__
+    statement = insert(table).values(namespace=namespace, version=1, updated_at=func.now())
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.namespace],
+        set_={"version": table.c.version + 1, "updated_at": func.now()}
+    )
+    await session.execute(statement)
+
+
+async def load_validators(session: AsyncSession, namespace: str, key: Hashable) -> Validators:
+    """Validators for the representation cached under ``key`` (one primary-key lookup)."""
+    result = await session.execute(
+        select(ContentVersion.version, ContentVersion.updated_at)
+        .where(ContentVersion.namespace == namespace)
+    )
+    row = result.one_or_none()
+    version, updated_at = row if row is not None else (0, None)
+    return Validators(make_etag(key, version), updated_at)
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Model timestamps are naive UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,64 @@
+from enum import Enum
+from typing import Hashable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.cache import TTLCache
+from app.services.explain import estimate_rows
+
+
+class TotalMode(str, Enum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+class CountStrategy:
+    """Resolves list totals without re-counting on every request.
+
+    Exact counts are cached per filter signature until the next write that
+    calls ``invalidate()`` (or until the TTL runs out). Estimates come from
+    the Postgres planner and fall back to a cached exact count elsewhere.
+    """
+
+    def __init__(self, cache: TTLCache):
+        self.cache = cache
+
+    async def total(
+        self,
+        session: AsyncSession,
+        source,
+        signature: Hashable,
+        mode: TotalMode = TotalMode.EXACT
+    ) -> Optional[int]:
+        if mode == TotalMode.NONE:
+            return None
+
+        if mode == TotalMode.ESTIMATE and session.bind.dialect.name == "postgresql":
+            return await estimate_rows(session, source)
+
+        total = self.cache.get(signature)
+        if total is None:
+            result = await session.execute(
+                select(func.count()).select_from(source.subquery())
+            )
+            total = result.scalar()
+            self.cache.set(signature, total)
+        return total
+
+    def cached(self, signature: Hashable) -> Optional[int]:
+        return self.cache.get(signature)
+
+    def store(self, signature: Hashable, total: int) -> None:
+        """Record a total computed elsewhere, e.g. by a ``count(*) OVER ()`` column."""
+        self.cache.set(signature, total)
+
+    def invalidate(self) -> None:
+        self.cache.clear()
+
+
+blog_counts = CountStrategy(
+    TTLCache(maxsize=settings.COUNT_CACHE_SIZE, ttl=settings.COUNT_CACHE_TTL_SECONDS)
+)
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[["EntityChanged"], None]
+
+
+@dataclass(frozen=True)
+class EntityChanged:
+    entity: str  # "blog", "feature", "testimonial", "menu_item", ...
+    action: str  # "created", "updated", "deleted"
+    entity_id: Optional[str] = None
+    origin: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> "EntityChanged":
+        return cls(**json.loads(data))
+
+
+class EventBus:
+    """In-process entity-change bus used to invalidate per-worker caches.
+
+    Handlers are plain callables registered per entity name and run in the
+    publishing worker only. ``RedisEventBus`` fans events out to every worker.
+    """
+
+    def __init__(self):
+        self.origin = uuid.uuid4().hex
+        self.published = 0
+        self.received = 0
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+
+    def subscribe(self, entity: str, handler: Handler) -> None:
+        self._handlers[entity].append(handler)
+
+    async def publish(self, entity: str, action: str, entity_id: Optional[str] = None) -> None:
+        event = EntityChanged(entity, action, entity_id, self.origin)
+        self.published += 1
+        self._dispatch(event)
+
+    def _dispatch(self, event: EntityChanged) -> None:
+        for handler in self._handlers.get(event.entity, []):
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Event handler failed for %s", event)
+
+    def _dispatch_all(self) -> None:
+        for entity in list(self._handlers):
+            self._dispatch(EntityChanged(entity, "resync", origin=self.origin))
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self).__name__,
+            "published": self.published,
+            "received": self.received,
+            "subscriptions": {entity: len(handlers) for entity, handlers in self._handlers.items()},
+        }
+
+
+class RedisEventBus(EventBus):
+    """EventBus backed by Redis pub/sub so every worker sees every change.
+
+    Events are dispatched locally right away and then published; each worker
+    ignores its own messages when they come back. After a lost subscription
+    every handler is run once, since events may have been missed meanwhile.
+    """
+
+    reconnect_delay = 1.0
+
+    def __init__(self, redis_url: Optional[str] = None, channel: str = "content-events", client=None):
+        super().__init__()
+        if client is None:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as exc:
+                raise RuntimeError("EVENT_BUS_BACKEND=redis requires the 'redis' package") from exc
+            client = redis_asyncio.from_url(redis_url, decode_responses=True)
+
+        self.channel = channel
+        self.redis = client
+        self._task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    async def publish(self, entity: str, action: str, entity_id: Optional[str] = None) -> None:
+        event = EntityChanged(entity, action, entity_id, self.origin)
+        self.published += 1
+        self._dispatch(event)
+        try:
+            await self.redis.publish(self.channel, event.to_json())
+        except Exception:
+            logger.exception("Failed to publish %s to Redis", event)
+
+    async def _listen(self) -> None:
+        first = True
+        while True:
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(self.channel)
+                self._subscribed.set()
+                if not first:
+                    self._dispatch_all()
+                first = False
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    event = EntityChanged.from_json(message["data"])
+                    if event.origin == self.origin:
+                        continue
+                    self.received += 1
+                    self._dispatch(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Lost Redis event subscription, reconnecting")
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+            try:
+                await asyncio.wait_for(self._subscribed.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("Redis event subscription not ready, continuing without it")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.redis.close()
+
+
+def create_event_bus() -> EventBus:
+    if settings.EVENT_BUS_BACKEND == "redis":
+        return RedisEventBus(settings.REDIS_URL, channel=settings.EVENT_BUS_CHANNEL)
+    return EventBus()
+
+
+event_bus = create_event_bus()
@@ -0,0 +1,42 @@
+import json
+from typing import Any, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <statement>`` that keeps the statement's bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement, analyze: bool = False):
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain_postgresql(element, compiler, **kw):
+    options = "ANALYZE, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
+
+
+@compiles(Explain, "sqlite")
+def _compile_explain_sqlite(element, compiler, **kw):
+    return "EXPLAIN QUERY PLAN " + compiler.process(element.statement, **kw)
+
+
+async def explain(session: AsyncSession, statement, analyze: bool = False) -> List[Any]:
+    """Return the query plan for ``statement`` as reported by the database."""
+    result = await session.execute(Explain(statement, analyze=analyze))
+    if session.bind.dialect.name == "postgresql":
+        plan = result.scalar()
+        return json.loads(plan) if isinstance(plan, str) else plan
+    return [tuple(row) for row in result.all()]
+
+
+async def estimate_rows(session: AsyncSession, statement) -> int:
+    """Planner row estimate for ``statement`` (Postgres only)."""
+    plan = await explain(session, statement)
+    return int(plan[0]["Plan"]["Plan Rows"])
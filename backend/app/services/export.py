@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import AsyncIterator, List, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.database import engine
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def encode_csv(columns: List[str], rows: Sequence, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def encode_ndjson(columns: List[str], rows: Sequence) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(columns, row)), default=_json_default, separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode()
+
+
+async def stream_rows(
+    statement: Select, export_format: ExportFormat, batch_size: int
+) -> AsyncIterator[bytes]:
+    """``statement``'s rows encoded as ``export_format``, one chunk per batch.
+
+    The rows come through a server-side cursor on a connection of its own
+    (the request's session may be closed before the body is sent), so at most
+    ``batch_size`` rows are held at a time however large the result is.
+    """
+    async with engine.connect() as conn:
+        result = await conn.stream(statement.execution_options(yield_per=batch_size))
+        columns = list(result.keys())
+        if export_format == ExportFormat.CSV:
+            yield encode_csv(columns, [], header=True)
+
+        async for rows in result.partitions():
+            if export_format == ExportFormat.CSV:
+                yield encode_csv(columns, rows)
+            else:
+                yield encode_ndjson(columns, rows)
+
+
+def export_response(
+    statement: Select, export_format: ExportFormat, filename: str, batch_size: int
+) -> StreamingResponse:
+    """Streaming download of ``statement``'s rows as ``filename.<format>``."""
+    return StreamingResponse(
+        stream_rows(statement, export_format, batch_size),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'
+        }
+    )
@@ -0,0 +1,126 @@
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Blog, BlogFacet, Tag, blog_tags
+from app.schemas.schemas import BlogFacets, MonthFacet, TagFacet
+from app.services.upsert import dialect_insert
+
+TAG = "tag"
+MONTH = "month"
+FEATURED = "featured"
+PUBLISHED = "published"
+
+
+def facet_keys(
+    published: bool, featured: bool, publish_date: Optional[datetime], tag_ids: Iterable[str]
+) -> Counter:
+    """Facet buckets one post counts towards (none unless it is published)."""
+    if not published:
+        return Counter()
+
+    keys = Counter({(PUBLISHED, "all"): 1})
+    keys.update((TAG, tag_id) for tag_id in set(tag_ids))
+    if publish_date is not None:
+        keys[(MONTH, publish_date.strftime("%Y-%m"))] += 1
+    if featured:
+        keys[(FEATURED, FEATURED)] += 1
+    return keys
+
+
+def blog_facet_keys(blog: Blog, tag_ids: Optional[Iterable[str]] = None) -> Counter:
+    if tag_ids is None:
+        tag_ids = [tag.id for tag in blog.tags]
+    return facet_keys(blog.published, blog.featured, blog.publish_date, tag_ids)
+
+
+async def apply_facet_changes(session: AsyncSession, before: Counter, after: Counter) -> None:
+    """Move a post's counts from ``before`` to ``after`` buckets; call before committing."""
+    deltas = Counter(after)
+    deltas.subtract(before)
+    changed = {key: delta for key, delta in deltas.items() if delta}
+    if not changed:
+        return
+
+    table = BlogFacet.__table__
+    upsert = dialect_insert(session)
+    for (kind, key), delta in changed.items():
+        statement = upsert(table).values(kind=kind, key=key, count=delta)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.kind, table.c.key],
+            set_={"count": table.c.count + delta}
+        )
+        await session.execute(statement)
+
+
+async def rebuild_facets(session: AsyncSession) -> None:
+    """Recompute every bucket from the blogs table (one-off backfill / repair)."""
+    published = Blog.published == True
+
+    if session.bind.dialect.name == "postgresql":
+        month = func.to_char(Blog.publish_date, "YYYY-MM")
+    else:
+        month = func.strftime("%Y-%m", Blog.publish_date)
+
+    await session.execute(delete(BlogFacet))
+
+    rows: List[dict] = []
+    result = await session.execute(select(func.count()).select_from(Blog).where(published))
+    rows.append({"kind": PUBLISHED, "key": "all", "count": result.scalar()})
+
+    result = await session.execute(
+        select(func.count()).select_from(Blog).where(published, Blog.featured == True)
+    )
+    rows.append({"kind": FEATURED, "key": FEATURED, "count": result.scalar()})
+
+    result = await session.execute(
+        select(blog_tags.c.tag_id, func.count())
+        .join(Blog, Blog.id == blog_tags.c.blog_id)
+        .where(published)
+        .group_by(blog_tags.c.tag_id)
+    )
+    rows += [{"kind": TAG, "key": tag_id, "count": count} for tag_id, count in result]
+
+    result = await session.execute(
+        select(month, func.count())
+        .where(published, Blog.publish_date.is_not(None))
+        .group_by(month)
+    )
+    rows += [{"kind": MONTH, "key": key, "count": count} for key, count in result]
+
+    rows = [row for row in rows if row["count"]]
+    if rows:
+        await session.execute(insert(BlogFacet), rows)
+
+
+async def load_facets(session: AsyncSession) -> BlogFacets:
+    result = await session.execute(
+        select(BlogFacet.kind, BlogFacet.key, BlogFacet.count)
+        .where(BlogFacet.kind != TAG, BlogFacet.count > 0)
+    )
+    counts = {(kind, key): count for kind, key, count in result}
+
+    result = await session.execute(
+        select(Tag.id, Tag.name, Tag.slug, Tag.color, BlogFacet.count)
+        .join(BlogFacet, (BlogFacet.kind == TAG) & (BlogFacet.key == Tag.id))
+        .where(BlogFacet.count > 0)
+        .order_by(BlogFacet.count.desc(), Tag.name)
+    )
+    tags = [TagFacet.model_validate(row._mapping) for row in result]
+
+    archive = []
+    for (kind, key), count in counts.items():
+        if kind == MONTH:
+            year, month = key.split("-")
+            archive.append(MonthFacet(year=int(year), month=int(month), count=count))
+    archive.sort(key=lambda facet: (facet.year, facet.month), reverse=True)
+
+    return BlogFacets(
+        total=counts.get((PUBLISHED, "all"), 0),
+        featured=counts.get((FEATURED, FEATURED), 0),
+        tags=tags,
+        archive=archive
+    )
@@ -0,0 +1,354 @@
+import asyncio
+import glob
+import json
+import logging
+import math
+import os
+import re
+from collections import defaultdict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, Table
+from sqlalchemy.exc import InterfaceError, OperationalError, TimeoutError as SQLAlchemyTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database import async_session_maker
+from app.services.upsert import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# Hook run at flush time on a table's rows; returns the rows to insert
+Prepare = Callable[[AsyncSession, List[dict]], Awaitable[List[dict]]]
+
+SPOOL_NAME = re.compile(r"ingest-(\d+)(\.\d+\.(flushing|claimed))?\.jsonl$")
+DEAD_LETTER_NAME = "dead-letter.jsonl"
+
+
+class IngestFull(Exception):
+    """The buffer is at capacity and did not drain within the submit timeout."""
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _transient(exc: Exception) -> bool:
+    """Whether a failed flush is worth retrying as is (the database, not the rows)."""
+    return (
+        isinstance(exc, (OperationalError, InterfaceError, SQLAlchemyTimeoutError, OSError, asyncio.TimeoutError))
+        or getattr(exc, "connection_invalidated", False)
+    )
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class IngestBuffer:
+    """Write-behind buffer for public submissions (contact forms, comments).
+
+    ``submit()`` appends the row to this process's spool file and to an
+    in-memory queue, then returns; the HTTP handler answers 202 without
+    touching the database. Rows are written with one multi-row ``INSERT ...
+    ON CONFLICT (id) DO NOTHING`` per table and batch, when ``batch_size``
+    rows are queued or every ``flush_interval`` seconds, and on shutdown.
+
+    The spool is what survives a crash: ``start()`` replays the files left
+    by processes that are no longer running, claiming each with an atomic
+    rename so that workers starting together replay it once. Rows carry
+    their primary key from submission, so a row that reaches the database
+    twice (crash between commit and spool cleanup) is inserted once.
+
+    A batch failing on a database outage is kept and retried. One failing
+    on its data is retried a row at a time, and rows that fail on their own
+    go to ``dead-letter.jsonl`` in the spool directory instead of blocking
+    the buffer.
+
+    At most ``capacity`` rows are queued or in flight; beyond that
+    ``submit()`` waits up to ``submit_timeout`` seconds for a flush and then
+    raises IngestFull.
+    """
+
+    def __init__(
+        self, spool_dir: str, *, batch_size: int = 200, flush_interval: float = 1.0,
+        capacity: int = 5000, submit_timeout: float = 2.0, fsync: bool = False
+    ):
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.capacity = capacity
+        self.submit_timeout = submit_timeout
+        self.fsync = fsync
+        self.flushed = 0
+        self.batches = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.quarantined = 0
+        self._tables: Dict[str, Table] = {}
+        self._prepare: Dict[str, Prepare] = {}
+        self._pending: List[dict] = []
+        self._inflight = 0
+        self._spool = None
+        self._rotations = 0
+        self._task: Optional[asyncio.Task] = None
+        self._kicked: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._space = asyncio.Condition()
+
+    def register(self, table: Table, prepare: Optional[Prepare] = None) -> None:
+        self._tables[table.name] = table
+        if prepare is not None:
+            self._prepare[table.name] = prepare
+
+    @property
+    def spool_path(self) -> str:
+        return os.path.join(self.spool_dir, f"ingest-{os.getpid()}.jsonl")
+
+    def _queued(self) -> int:
+        return len(self._pending) + self._inflight
+
+    # Spool files
+    def _append_to_spool(self, records: List[dict]) -> None:
+        if self._spool is None:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            self._spool = open(self.spool_path, "a", encoding="utf-8")
+        self._spool.write("".join(
+            json.dumps(record, default=_json_default, separators=(",", ":")) + "\n"
+            for record in records
+        ))
+        self._spool.flush()
+        if self.fsync:
+            os.fsync(self._spool.fileno())
+
+    def _rotate_spool(self) -> Optional[str]:
+        """Move the current spool aside for the flush that is about to run."""
+        if self._spool is None:
+            return None
+        self._spool.close()
+        self._spool = None
+        self._rotations += 1
+        rotated = os.path.join(
+            self.spool_dir, f"ingest-{os.getpid()}.{self._rotations}.flushing.jsonl"
+        )
+        os.replace(self.spool_path, rotated)
+        return rotated
+
+    def _claim(self, path: str) -> Optional[str]:
+        """Rename another process's spool to one of ours; None if a worker got there first."""
+        self._rotations += 1
+        claimed = os.path.join(
+            self.spool_dir, f"ingest-{os.getpid()}.{self._rotations}.claimed.jsonl"
+        )
+        try:
+            os.replace(path, claimed)
+        except FileNotFoundError:
+            return None
+        return claimed
+
+    def _recover(self) -> List[dict]:
+        """Records from spool files whose process has exited (or is this one, restarted)."""
+        records = []
+        for path in sorted(glob.glob(os.path.join(self.spool_dir, "ingest-*.jsonl"))):
+            match = SPOOL_NAME.search(os.path.basename(path))
+            if match is None:
+                continue
+            pid = int(match.group(1))
+            if pid != os.getpid() and _pid_alive(pid):
+                continue
+            claimed = self._claim(path)
+            if claimed is None:
+                continue
+            with open(claimed, encoding="utf-8") as spool:
+                for line in spool:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # A torn last line from a crash mid-write
+                        logger.warning("Skipping unreadable spool line in %s", path)
+            os.remove(claimed)
+        return records
+
+    def _quarantine(self, record: dict, exc: Exception) -> None:
+        os.makedirs(self.spool_dir, exist_ok=True)
+        with open(os.path.join(self.spool_dir, DEAD_LETTER_NAME), "a", encoding="utf-8") as dead:
+            dead.write(json.dumps(
+                dict(record, error=f"{type(exc).__name__}: {exc}"[:500]),
+                default=_json_default, separators=(",", ":")
+            ) + "\n")
+        self.quarantined += 1
+        logger.error("Moved a buffered %s row to %s: %s", record.get("table"), DEAD_LETTER_NAME, exc)
+
+    # Writing
+    def _decode(self, table: Table, row: dict) -> dict:
+        return {
+            key: datetime.fromisoformat(value)
+            if isinstance(value, str) and isinstance(table.c[key].type, DateTime) else value
+            for key, value in row.items()
+        }
+
+    async def _write(self, records: List[dict]) -> None:
+        grouped: Dict[str, List[dict]] = defaultdict(list)
+        for record in records:
+            table = self._tables[record["table"]]
+            grouped[table.name].append(self._decode(table, record["row"]))
+
+        async with async_session_maker() as session:
+            insert = dialect_insert(session)
+            for name, rows in grouped.items():
+                table = self._tables[name]
+                if name in self._prepare:
+                    kept = await self._prepare[name](session, rows)
+                    self.dropped += len(rows) - len(kept)
+                    rows = kept
+                for start in range(0, len(rows), self.batch_size):
+                    statement = insert(table).values(rows[start:start + self.batch_size])
+                    await session.execute(statement.on_conflict_do_nothing(index_elements=[table.c.id]))
+                    self.batches += 1
+            await session.commit()
+        self.flushed += len(records)
+
+    async def _write_each(self, records: List[dict]) -> List[dict]:
+        """Write ``records`` one at a time, quarantining the ones that fail; returns those to retry."""
+        retry = []
+        for record in records:
+            try:
+                await self._write([record])
+            except Exception as exc:
+                if _transient(exc):
+                    retry.append(record)
+                else:
+                    self._quarantine(record, exc)
+        return retry
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            records, self._pending = self._pending, []
+            if not records:
+                return 0
+            self._inflight = len(records)
+            rotated = self._rotate_spool()
+            flushed = self.flushed
+            try:
+                try:
+                    await self._write(records)
+                    retry = []
+                except Exception as exc:
+                    if _transient(exc):
+                        logger.warning("Failed to flush %d buffered submissions: %s", len(records), exc)
+                        retry = records
+                    else:
+                        logger.exception(
+                            "Failed to flush %d buffered submissions; retrying them one at a time",
+                            len(records)
+                        )
+                        retry = await self._write_each(records)
+                if retry:
+                    self._pending[:0] = retry
+                    self._append_to_spool(retry)
+            finally:
+                self._inflight = 0
+                if rotated is not None:
+                    os.remove(rotated)
+                async with self._space:
+                    self._space.notify_all()
+
+            return self.flushed - flushed
+
+    def _kick(self) -> None:
+        if not self._flush_lock.locked():
+            self._kicked = asyncio.create_task(self.flush())
+
+    async def submit(self, table: Table, row: dict) -> None:
+        if self._queued() >= self.capacity:
+            self._kick()
+            try:
+                async with self._space:
+                    await asyncio.wait_for(
+                        self._space.wait_for(lambda: self._queued() < self.capacity),
+                        self.submit_timeout
+                    )
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise IngestFull()
+
+        record = {"table": table.name, "row": row}
+        self._append_to_spool([record])
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self._kick()
+
+    async def accept(self, table: Table, row: dict) -> None:
+        """``submit()``, answering 503 with Retry-After when the buffer is full."""
+        try:
+            await self.submit(table, row)
+        except IngestFull:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="We're receiving a lot of submissions, please try again shortly",
+                headers={"Retry-After": str(math.ceil(self.flush_interval))}
+            )
+
+    # Lifecycle
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        recovered = self._recover()
+        if recovered:
+            logger.info("Replaying %d spooled submissions", len(recovered))
+            self._append_to_spool(recovered)
+            self._pending.extend(recovered)
+            await self.flush()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+            # Keep the file if the final flush failed: the next start replays it
+            if not self._pending:
+                os.remove(self.spool_path)
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "inflight": self._inflight,
+            "capacity": self.capacity,
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "quarantined": self.quarantined,
+        }
+
+
+ingest_buffer = IngestBuffer(
+    settings.INGEST_SPOOL_DIR,
+    batch_size=settings.INGEST_BATCH_SIZE,
+    flush_interval=settings.INGEST_FLUSH_SECONDS,
+    capacity=settings.INGEST_CAPACITY,
+    submit_timeout=settings.INGEST_SUBMIT_TIMEOUT_SECONDS,
+    fsync=settings.INGEST_FSYNC,
+)
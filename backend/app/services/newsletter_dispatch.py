@@ -0,0 +1,422 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from email.policy import SMTP
+from email.utils import formatdate, parseaddr
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import aiosmtplib
+from sqlalchemy import and_, func, or_, select, update
+
+from app.core.config import settings
+from app.database import async_session_maker
+from app.models.models import (
+    Campaign, CampaignDelivery, CampaignStatus, DeliveryStatus, Newsletter
+)
+from app.services.upsert import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# Connection-level failures: the connection is dropped and the message retried once
+CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPTimeoutError,
+    OSError,
+)
+
+
+def _closing(exc: aiosmtplib.SMTPException) -> bool:
+    """Whether the server answered 421 (service closing the channel)."""
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused):
+        return any(recipient.code == 421 for recipient in exc.recipients)
+    return getattr(exc, "code", None) == 421
+
+
+def render_campaign(campaign: Campaign, sender: str) -> bytes:
+    """The campaign as wire-format bytes, minus the To header (added per recipient)."""
+    message = EmailMessage(policy=SMTP)
+    message["From"] = sender
+    message["Subject"] = campaign.subject
+    message["Date"] = formatdate(localtime=True)
+    message.set_content(campaign.body_text)
+    if campaign.body_html:
+        message.add_alternative(campaign.body_html, subtype="html")
+    return message.as_bytes()
+
+
+class SMTPConnectionPool:
+    """Up to ``size`` persistent SMTP connections, reused across messages."""
+
+    def __init__(
+        self, hostname: str, port: int, size: int, *, username: Optional[str] = None,
+        password: Optional[str] = None, start_tls: bool = False, timeout: float = 30.0
+    ):
+        self.options = {
+            "hostname": hostname, "port": port, "username": username,
+            "password": password, "start_tls": start_tls, "timeout": timeout,
+        }
+        self.size = size
+        self.opened = 0
+        self._idle: List[aiosmtplib.SMTP] = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(**self.options)
+        await client.connect()
+        self.opened += 1
+        return client
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        async with self._slots:
+            client = self._idle.pop() if self._idle else await self._connect()
+            try:
+                yield client
+            except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused) as exc:
+                # Refused recipients and other SMTP replies leave the connection
+                # usable, except 421: the server is closing it
+                if _closing(exc):
+                    client.close()
+                else:
+                    self._idle.append(client)
+                raise
+            except BaseException:
+                client.close()
+                raise
+            self._idle.append(client)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for client in idle:
+            try:
+                await client.quit()
+            except aiosmtplib.SMTPException:
+                client.close()
+
+
+class SendRate:
+    """Spaces sends at least ``1 / rate`` seconds apart (0 = unlimited)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+@dataclass
+class DispatchReport:
+    campaign_id: str
+    sent: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    connections: int = 0
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.sent / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "campaign_id": self.campaign_id,
+            "sent": self.sent,
+            "failed": self.failed,
+            "seconds": round(self.seconds, 3),
+            "connections": self.connections,
+            "messages_per_second": round(self.messages_per_second, 1),
+        }
+
+
+class NewsletterDispatcher:
+    """Sends campaigns to active subscribers in the background.
+
+    Subscribers are read a page at a time in id order (keyset on the primary
+    key). The campaign is rendered once; each message is that payload with a
+    To header, sent over a pool of persistent SMTP connections at most
+    ``send_rate`` messages per second. Each result goes to
+    ``campaign_deliveries`` as soon as the send returns, and after every page
+    the cursor moves past it. An interrupted send resumes with the page it
+    was on, skipping recipients that already have a delivery row; only a
+    message accepted by the server in the instant before a crash can be sent
+    twice.
+
+    A worker claims a campaign with a lease it renews at every checkpoint
+    and, while a page is being sent, every third of ``lease_seconds``;
+    ``claim()`` fails while another worker's lease is live.
+    """
+
+    def __init__(
+        self, *, sender: str, connections: int, send_rate: float, page_size: int,
+        lease_seconds: float
+    ):
+        self.sender = sender
+        self.envelope_sender = parseaddr(sender)[1]
+        self.connections = connections
+        self.send_rate = send_rate
+        self.page_size = page_size
+        self.lease_seconds = lease_seconds
+        self.reports: Dict[str, DispatchReport] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def create_pool(self) -> SMTPConnectionPool:
+        return SMTPConnectionPool(
+            settings.SMTP_HOST, settings.SMTP_PORT, self.connections,
+            username=settings.SMTP_USERNAME, password=settings.SMTP_PASSWORD,
+            start_tls=settings.SMTP_START_TLS, timeout=settings.SMTP_TIMEOUT_SECONDS
+        )
+
+    def _lease(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+
+    async def claim(self, campaign_id: str) -> bool:
+        """Take the campaign's lease unless it is sent or another send holds it."""
+        async with async_session_maker() as session:
+            result = await session.execute(
+                update(Campaign)
+                .where(
+                    Campaign.id == campaign_id,
+                    Campaign.status != CampaignStatus.SENT,
+                    or_(
+                        Campaign.lease_expires_at.is_(None),
+                        Campaign.lease_expires_at < datetime.utcnow()
+                    )
+                )
+                .values(status=CampaignStatus.SENDING, lease_expires_at=self._lease())
+            )
+            await session.commit()
+            return result.rowcount == 1
+
+    async def _heartbeat(self, campaign_id: str) -> None:
+        """Keep the lease live while a page (which may outlast it at a low send rate) is sent."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with async_session_maker() as session:
+                    await session.execute(
+                        update(Campaign)
+                        .where(Campaign.id == campaign_id, Campaign.status == CampaignStatus.SENDING)
+                        .values(lease_expires_at=self._lease())
+                    )
+                    await session.commit()
+            except Exception:
+                logger.warning("Failed to renew the lease on campaign %s", campaign_id, exc_info=True)
+
+    async def _deliver(
+        self, pool: SMTPConnectionPool, rate: SendRate, payload: bytes, email: str
+    ) -> Tuple[bool, Optional[str], int]:
+        message = b"To: " + email.encode() + b"\r\n" + payload
+        for attempt in (1, 2):
+            await rate.wait()
+            try:
+                async with pool.connection() as client:
+                    await client.sendmail(self.envelope_sender, [email], message)
+                return True, None, attempt
+            except CONNECTION_ERRORS as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            except aiosmtplib.SMTPException as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                if not _closing(exc):
+                    return False, error[:500], attempt
+            except Exception as exc:
+                # One recipient's failure must not abort the rest of the page
+                logger.exception("Unexpected error sending to %s", email)
+                return False, f"{type(exc).__name__}: {exc}"[:500], attempt
+        return False, error[:500], attempt
+
+    async def _record(
+        self, campaign_id: str, row, result: Tuple[bool, Optional[str], int]
+    ) -> None:
+        ok, error, attempts = result
+        async with async_session_maker() as session:
+            insert = dialect_insert(session)
+            table = CampaignDelivery.__table__
+            statement = insert(table).values(
+                campaign_id=campaign_id,
+                subscriber_id=row.id,
+                email=row.email,
+                status=DeliveryStatus.SENT if ok else DeliveryStatus.FAILED,
+                error=error,
+                attempts=attempts,
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.campaign_id, table.c.subscriber_id],
+                set_={
+                    "status": statement.excluded.status,
+                    "error": statement.excluded.error,
+                    "attempts": table.c.attempts + statement.excluded.attempts,
+                    "sent_at": func.now(),
+                }
+            )
+            await session.execute(statement)
+            await session.commit()
+
+    async def _send(
+        self, pool: SMTPConnectionPool, rate: SendRate, payload: bytes, campaign_id: str,
+        row, report: DispatchReport
+    ) -> None:
+        """Deliver to one subscriber and record the result right away."""
+        result = await self._deliver(pool, rate, payload, row.email)
+        await self._record(campaign_id, row, result)
+        if result[0]:
+            report.sent += 1
+        else:
+            report.failed += 1
+
+    async def _checkpoint(self, campaign_id: str, cursor: str) -> None:
+        """Move the cursor past a finished page and refresh the counts from the delivery log."""
+        def delivered(status: DeliveryStatus):
+            return (
+                select(func.count())
+                .select_from(CampaignDelivery)
+                .where(CampaignDelivery.campaign_id == campaign_id, CampaignDelivery.status == status)
+                .scalar_subquery()
+            )
+
+        async with async_session_maker() as session:
+            await session.execute(
+                update(Campaign)
+                .where(Campaign.id == campaign_id)
+                .values(
+                    cursor=cursor,
+                    sent_count=delivered(DeliveryStatus.SENT),
+                    failed_count=delivered(DeliveryStatus.FAILED),
+                    lease_expires_at=self._lease()
+                )
+            )
+            await session.commit()
+
+    async def run(self, campaign_id: str) -> DispatchReport:
+        """Send (or resume) a campaign already claimed with ``claim()``."""
+        report = self.reports[campaign_id] = DispatchReport(campaign_id)
+        async with async_session_maker() as session:
+            campaign = await session.get(Campaign, campaign_id)
+            if campaign.started_at is None:
+                campaign.started_at = datetime.utcnow()
+                await session.commit()
+            payload = render_campaign(campaign, self.sender)
+            cursor = campaign.cursor
+
+        pool = self.create_pool()
+        rate = SendRate(self.send_rate)
+        heartbeat = asyncio.create_task(self._heartbeat(campaign_id))
+        started = time.perf_counter()
+        try:
+            while True:
+                query = select(Newsletter.id, Newsletter.email).where(Newsletter.active == True)
+                if cursor is not None:
+                    query = query.where(Newsletter.id > cursor)
+                async with async_session_maker() as session:
+                    result = await session.execute(query.order_by(Newsletter.id).limit(self.page_size))
+                    page = result.all()
+                    if not page:
+                        break
+                    # Recipients of an interrupted run's page already have a row
+                    recorded = set((await session.execute(
+                        select(CampaignDelivery.subscriber_id).where(
+                            CampaignDelivery.campaign_id == campaign_id,
+                            CampaignDelivery.subscriber_id.in_([row.id for row in page])
+                        )
+                    )).scalars())
+
+                # Every send finishes and is recorded even if another one fails
+                results = await asyncio.gather(
+                    *(
+                        self._send(pool, rate, payload, campaign_id, row, report)
+                        for row in page if row.id not in recorded
+                    ),
+                    return_exceptions=True
+                )
+                errors = [result for result in results if isinstance(result, BaseException)]
+                if errors:
+                    raise errors[0]
+                await self._checkpoint(campaign_id, page[-1].id)
+                cursor = page[-1].id
+
+                report.seconds = time.perf_counter() - started
+                report.connections = pool.opened
+
+            async with async_session_maker() as session:
+                await session.execute(
+                    update(Campaign)
+                    .where(Campaign.id == campaign_id)
+                    .values(
+                        status=CampaignStatus.SENT,
+                        finished_at=datetime.utcnow(),
+                        lease_expires_at=None
+                    )
+                )
+                await session.commit()
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            await pool.close()
+            report.seconds = time.perf_counter() - started
+            report.connections = pool.opened
+
+        logger.info(
+            "Campaign %s: %d sent, %d failed, %.1f messages/s",
+            campaign_id, report.sent, report.failed, report.messages_per_second
+        )
+        return report
+
+    async def _release(self, campaign_id: str) -> None:
+        """Drop the lease so the campaign can be resumed right away."""
+        async with async_session_maker() as session:
+            await session.execute(
+                update(Campaign)
+                .where(and_(Campaign.id == campaign_id, Campaign.status == CampaignStatus.SENDING))
+                .values(lease_expires_at=None)
+            )
+            await session.commit()
+
+    async def _run_task(self, campaign_id: str) -> None:
+        try:
+            await self.run(campaign_id)
+        except asyncio.CancelledError:
+            await self._release(campaign_id)
+            raise
+        except Exception:
+            logger.exception("Campaign %s send failed; it can be resumed", campaign_id)
+            await self._release(campaign_id)
+        finally:
+            self._tasks.pop(campaign_id, None)
+
+    def start(self, campaign_id: str) -> None:
+        """Run a claimed campaign in the background."""
+        self._tasks[campaign_id] = asyncio.create_task(self._run_task(campaign_id))
+
+    def running(self, campaign_id: str) -> bool:
+        return campaign_id in self._tasks
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "running": sorted(self._tasks),
+            "reports": [report.as_dict() for report in self.reports.values()],
+        }
+
+
+newsletter_dispatcher = NewsletterDispatcher(
+    sender=settings.NEWSLETTER_FROM,
+    connections=settings.NEWSLETTER_SMTP_CONNECTIONS,
+    send_rate=settings.NEWSLETTER_SEND_RATE,
+    page_size=settings.NEWSLETTER_PAGE_SIZE,
+    lease_seconds=settings.NEWSLETTER_LEASE_SECONDS,
+)
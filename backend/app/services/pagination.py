@@ -0,0 +1,70 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, bindparam, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+CURSOR_SEPARATOR = ","
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Opaque keyset cursor for a ``(timestamp, id)`` ordering."""
+    raw = f"{sort_value.isoformat()}{CURSOR_SEPARATOR}{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        sort_value, row_id = raw.split(CURSOR_SEPARATOR, 1)
+        return datetime.fromisoformat(sort_value), row_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+class comparable_timestamp(FunctionElement):
+    """A timestamp column, compared against bound datetimes in keyset conditions.
+
+    SQLite stores timestamps as text: ``server_default=func.now()`` writes
+    ``YYYY-MM-DD HH:MM:SS`` while bound datetimes are rendered with
+    microseconds, so a row would compare lower than its own cursor. The
+    stored value is padded to the bound format there; other dialects compare
+    the column as is (and keep using its index).
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(comparable_timestamp)
+def _compile_comparable_timestamp(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(comparable_timestamp, "sqlite")
+def _compile_comparable_timestamp_sqlite(element, compiler, **kw):
+    return f"substr({compiler.process(element.clauses, **kw)} || '.000000', 1, 26)"
+
+
+def keyset_after(sort_column, id_column, cursor: str):
+    """WHERE clause for the page after ``cursor`` in ``sort DESC, id DESC`` order."""
+    sort_value, row_id = decode_cursor(cursor)
+    return tuple_(comparable_timestamp(sort_column), id_column) < tuple_(
+        bindparam(None, sort_value, type_=DateTime()), row_id
+    )
+
+
+def next_cursor(rows, limit: int, sort_attr: str, id_attr: str = "id") -> Optional[str]:
+    """Cursor for the following page, or None when this page is the last one."""
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
@@ -0,0 +1,19 @@
+from typing import List, Type
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def schema_columns(model: type, schema: Type[BaseModel], *extra: str) -> List[InstrumentedAttribute]:
+    """Mapped columns of ``model`` that ``schema`` serializes, plus ``extra`` keys.
+
+    Meant for ``load_only()`` so list queries leave out wide columns (post
+    bodies, password hashes) that the response never uses.
+    """
+    keys = set(schema.model_fields) | set(extra)
+    return [
+        getattr(model, attr.key)
+        for attr in inspect(model).column_attrs
+        if attr.key in keys
+    ]
@@ -0,0 +1,218 @@
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rules ending in _account are keyed by the submitted email, the rest by client
+# IP. An account's token is refunded when its login succeeds, so only failed
+# attempts count against it (they still lock out the owner once it is spent).
+DEFAULT_RATE_LIMITS = {
+    "register": "5/hour",
+    "login": "20/minute",
+    "admin_login": "10/minute",
+    "login_account": "10/minute",
+    "contact": "5/minute",
+    "comment": "10/minute",
+    "newsletter": "5/minute",
+}
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+RULE = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)\s*$")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A token bucket: ``burst`` tokens, refilled at ``rate`` tokens per second."""
+    rate: float
+    burst: int
+
+    @classmethod
+    def parse(cls, rule: str) -> "RateLimit":
+        """``"10/minute"``: bursts of 10, refilled evenly over a minute."""
+        match = RULE.match(rule)
+        if match is None:
+            raise ValueError(f"Invalid rate limit {rule!r}, expected e.g. '10/minute'")
+        count = int(match.group(1))
+        return cls(rate=count / PERIODS[match.group(2)], burst=count)
+
+
+def client_ip(request: Request, trusted_proxies: int) -> str:
+    """The caller's address, read from X-Forwarded-For behind ``trusted_proxies`` hops."""
+    if trusted_proxies:
+        forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+        if len(forwarded) >= trusted_proxies:
+            return forwarded[-trusted_proxies]
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimiter:
+    """Per-route token buckets, keyed by client IP or by account.
+
+    Each named rule in ``rules`` is a RateLimit; a request spends one token
+    from the bucket for (rule, identity) and is answered 429 with
+    Retry-After when the bucket is empty; ``refund()`` gives the token back
+    once the request turns out not to count. Buckets live in this worker's
+    memory, at most ``max_keys`` of them (least recently used are dropped,
+    which only ever forgives a client).
+    """
+
+    def __init__(
+        self, rules: Dict[str, str], *, max_keys: int = 100_000, trusted_proxies: int = 0,
+        enabled: bool = True
+    ):
+        self.rules = {name: RateLimit.parse(rule) for name, rule in rules.items()}
+        self.max_keys = max_keys
+        self.trusted_proxies = trusted_proxies
+        self.enabled = enabled
+        self.allowed = 0
+        self.limited = 0
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    async def take(self, key: str, limit: RateLimit, cost: int = 1) -> float:
+        """Spend ``cost`` tokens (a negative cost refunds); 0 if done, else seconds until a token is available."""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(limit.burst), now]
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(limit.burst, bucket[0] + (now - bucket[1]) * limit.rate)
+            bucket[1] = now
+
+        if cost <= 0 or bucket[0] >= 1:
+            bucket[0] = min(limit.burst, bucket[0] - cost)
+            return 0.0
+        return (1 - bucket[0]) / limit.rate
+
+    async def check(self, name: str, identity: str) -> None:
+        if not self.enabled:
+            return
+        wait = await self.take(f"{name}:{identity}", self.rules[name])
+        if not wait:
+            self.allowed += 1
+            return
+        self.limited += 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(wait)))}
+        )
+
+    async def refund(self, name: str, identity: str) -> None:
+        """Return the token a passed ``check()`` spent, e.g. after a successful login."""
+        if self.enabled:
+            await self.take(f"{name}:{identity}", self.rules[name], -1)
+
+    def limit(self, name: str) -> Callable:
+        """Dependency applying rule ``name`` per client IP."""
+        if name not in self.rules:
+            raise KeyError(f"No rate limit rule named {name!r}")
+
+        async def dependency(request: Request) -> None:
+            await self.check(name, client_ip(request, self.trusted_proxies))
+
+        return dependency
+
+    async def stop(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "enabled": self.enabled,
+            "buckets": len(self._buckets),
+            "allowed": self.allowed,
+            "limited": self.limited,
+        }
+
+
+# Refill, spend (or, with a negative cost, refund) and expire one bucket
+# atomically, on Redis' clock. Returns the wait in seconds as a string (Lua
+# numbers come back truncated to integers).
+TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'stamp')
+local tokens = tonumber(state[1]) or burst
+local stamp = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - stamp) * rate)
+local wait = 0
+if cost <= 0 or tokens >= 1 then
+    tokens = math.min(burst, tokens - cost)
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'stamp', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """RateLimiter whose buckets are Redis hashes shared by all workers.
+
+    One script call per request; a bucket expires once it would be full
+    again. If Redis is unreachable requests are let through (and logged)
+    rather than failing the route.
+    """
+
+    def __init__(self, redis_url: str, rules: Dict[str, str], *, prefix: str = "ratelimit:", **kwargs):
+        super().__init__(rules, **kwargs)
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package") from exc
+
+        self.prefix = prefix
+        self.errors = 0
+        self.redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+        self._take = self.redis.register_script(TAKE_SCRIPT)
+
+    async def take(self, key: str, limit: RateLimit, cost: int = 1) -> float:
+        try:
+            wait = await self._take(keys=[self.prefix + key], args=[limit.rate, limit.burst, cost])
+        except Exception:
+            self.errors += 1
+            logger.warning("Rate limit check failed for %s; allowing the request", key, exc_info=True)
+            return 0.0
+        return float(wait)
+
+    async def stop(self) -> None:
+        await self.redis.close()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "redis",
+            "enabled": self.enabled,
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "errors": self.errors,
+        }
+
+
+def create_rate_limiter() -> RateLimiter:
+    rules = {**DEFAULT_RATE_LIMITS, **settings.RATE_LIMITS}
+    options = {
+        "trusted_proxies": settings.RATE_LIMIT_TRUSTED_PROXIES,
+        "enabled": settings.RATE_LIMIT_ENABLED,
+    }
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimiter(settings.REDIS_URL, rules, **options)
+    return RateLimiter(rules, max_keys=settings.RATE_LIMIT_MAX_KEYS, **options)
+
+
+rate_limiter = create_rate_limiter()
@@ -0,0 +1,434 @@
+import asyncio
+import logging
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sqlalchemy import bindparam, delete, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database import async_session_maker
+from app.models.models import Blog, RelatedPost, blog_tags
+from app.schemas.schemas import BlogList
+from app.services.blog_list import list_columns, list_item
+from app.services.pagination import comparable_timestamp
+from app.services.serialization import validate_rows
+
+logger = logging.getLogger(__name__)
+
+TOKEN = re.compile(r"[a-z0-9]{3,}")
+STOP_WORDS = frozenset(
+    "and are but can for from has have how its not our out that the their this "
+    "was what when who why will with you your".split()
+)
+# Rows scored per matrix product, bounding the dense (rows x posts) score block
+CHUNK_ROWS = 128
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def _grow(matrix: sp.csr_matrix, columns: int) -> sp.csr_matrix:
+    """``matrix`` with at least ``columns`` columns (new ones empty)."""
+    if matrix.shape[1] >= columns:
+        return matrix
+    return sp.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], columns))
+
+
+class RelatedModel:
+    """Similarity between published posts, as sparse (CSR) matrices.
+
+    A post's score against another is a weighted sum of the Jaccard overlap
+    of their tag sets and the cosine similarity of their title + excerpt
+    TF-IDF vectors (sublinear tf, smoothed idf). Both are symmetric, so
+    ``scores(rows)`` also says where the posts at ``rows`` rank in every
+    other post's list.
+
+    Memory is proportional to the terms and tags actually used, not to
+    posts x vocabulary. ``update()`` replaces or drops individual posts
+    without re-reading the rest: their tf rows are kept, and idf and the
+    normalised TF-IDF matrix are recomputed from them (vectorised, linear in
+    the stored entries).
+    """
+
+    def __init__(self, tag_weight: float):
+        self.tag_weight = tag_weight
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.vocabulary: Dict[str, int] = {}
+        self.tag_columns: Dict[str, int] = {}
+        self.document_frequency = np.zeros(0, dtype=np.float64)
+        self.tf = sp.csr_matrix((0, 0), dtype=np.float32)
+        self.tags = sp.csr_matrix((0, 0), dtype=np.float32)
+        self.text = self.text_t = self.tf
+        self.tags_t = self.tags
+        self.tag_counts = np.zeros(0, dtype=np.float32)
+
+    @classmethod
+    def build(
+        cls, ids: List[str], texts: List[str], tags: List[Set[str]], tag_weight: float
+    ) -> "RelatedModel":
+        model = cls(tag_weight)
+        model.update(ids, texts, tags)
+        return model
+
+    def _columns(self, mapping: Dict[str, int], keys: Iterable[str]) -> List[int]:
+        return [mapping.setdefault(key, len(mapping)) for key in keys]
+
+    def _rows(self, texts: List[str], tags: List[Set[str]]) -> Tuple[sp.csr_matrix, sp.csr_matrix]:
+        data, indices, indptr = [], [], [0]
+        for text in texts:
+            counts = Counter(tokenize(text))
+            indices += self._columns(self.vocabulary, counts)
+            data += [1 + np.log(count) for count in counts.values()]
+            indptr.append(len(indices))
+        tf = sp.csr_matrix(
+            (np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32), indptr),
+            shape=(len(texts), len(self.vocabulary))
+        )
+
+        indices, indptr = [], [0]
+        for tag_ids in tags:
+            indices += self._columns(self.tag_columns, sorted(tag_ids))
+            indptr.append(len(indices))
+        tag_matrix = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int32), indptr),
+            shape=(len(tags), len(self.tag_columns))
+        )
+        return tf, tag_matrix
+
+    def update(
+        self, ids: List[str], texts: List[str], tags: List[Set[str]],
+        removed: Iterable[str] = ()
+    ) -> None:
+        """Add or replace the posts ``ids`` and drop the posts ``removed``."""
+        replaced = set(removed) | set(ids)
+        keep = np.array(
+            [row for row, blog_id in enumerate(self.ids) if blog_id not in replaced], dtype=np.intp
+        )
+        tf, tag_matrix = self._rows(texts, tags)
+
+        self.tf = sp.vstack(
+            [_grow(self.tf[keep], len(self.vocabulary)), tf], format="csr", dtype=np.float32
+        )
+        self.tags = sp.vstack(
+            [_grow(self.tags[keep], len(self.tag_columns)), tag_matrix], format="csr", dtype=np.float32
+        )
+        self.ids = [self.ids[row] for row in keep] + list(ids)
+        self.index = {blog_id: row for row, blog_id in enumerate(self.ids)}
+        self._reweight()
+
+    def _reweight(self) -> None:
+        self.document_frequency = np.bincount(self.tf.indices, minlength=self.tf.shape[1])
+        idf = np.log((1 + len(self.ids)) / (1 + self.document_frequency)) + 1
+        text = self.tf.multiply(idf.astype(np.float32)).tocsr()
+        norms = np.sqrt(np.asarray(text.multiply(text).sum(axis=1)).ravel())
+        self.text = sp.diags(1 / np.where(norms > 0, norms, 1)).dot(text).astype(np.float32).tocsr()
+        self.text_t = self.text.T.tocsr()
+        self.tags_t = self.tags.T.tocsr()
+        self.tag_counts = np.asarray(self.tags.sum(axis=1), dtype=np.float32).ravel()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scores(self, rows: np.ndarray) -> np.ndarray:
+        """Dense (len(rows), len(self)) scores; a post scores -inf against itself."""
+        text = (self.text[rows] @ self.text_t).toarray()
+
+        shared = (self.tags[rows] @ self.tags_t).toarray()
+        union = self.tag_counts[rows, None] + self.tag_counts[None, :] - shared
+        jaccard = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+
+        scores = self.tag_weight * jaccard + (1 - self.tag_weight) * text
+        scores[np.arange(len(rows)), rows] = -np.inf
+        return scores
+
+    def top_k(self, blog_ids: Iterable[str], k: int) -> Dict[str, List[Tuple[str, float]]]:
+        """Each post's ``k`` best neighbours with a positive score, best first."""
+        rows = np.array([self.index[blog_id] for blog_id in blog_ids], dtype=np.intp)
+        k = min(k, len(self) - 1)
+        neighbours = {self.ids[row]: [] for row in rows}
+        if k <= 0:
+            return neighbours
+
+        for start in range(0, len(rows), CHUNK_ROWS):
+            chunk = rows[start:start + CHUNK_ROWS]
+            scores = self.scores(chunk)
+            best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(scores, best, axis=1)
+            order = np.argsort(-best_scores, axis=1, kind="stable")
+            best = np.take_along_axis(best, order, axis=1)
+            best_scores = np.take_along_axis(best_scores, order, axis=1)
+
+            for row, columns, values in zip(chunk, best, best_scores):
+                neighbours[self.ids[row]] = [
+                    (self.ids[column], float(score))
+                    for column, score in zip(columns, values) if score > 0
+                ]
+        return neighbours
+
+
+class RelatedPostsEngine:
+    """Background job that keeps ``related_posts`` (top-K per post) current.
+
+    The blog write handlers call ``mark_dirty()`` after committing; every
+    ``refresh_interval`` seconds the job updates its in-memory model with
+    the posts that changed (the dirty ids, plus posts other workers edited
+    since the last refresh, found by ``updated_at``) and rewrites only the
+    lists that can have changed: the changed posts' own, the ones that
+    mention a changed post, and the ones a changed post now outranks. Lists
+    of untouched posts keep the idf weights they were scored with until the
+    next ``rebuild()``.
+
+    The model is loaded in full on the first refresh, by ``rebuild()`` (the
+    admin endpoint, e.g. after a bulk import), and whenever it no longer
+    holds as many posts as are published (a post deleted by another worker).
+    The job builds every list on start when ``related_posts`` is empty (a
+    fresh database or migration).
+    """
+
+    def __init__(self, k: int = 6, tag_weight: float = 0.5, refresh_interval: float = 10.0):
+        self.k = k
+        self.tag_weight = tag_weight
+        self.refresh_interval = refresh_interval
+        self.refreshes = 0
+        self.rebuilds = 0
+        self.reloads = 0
+        self.lists_written = 0
+        self._dirty: Set[str] = set()
+        self._model: Optional[RelatedModel] = None
+        self._synced_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    def mark_dirty(self, *blog_ids: str) -> None:
+        self._dirty.update(blog_ids)
+
+    async def _load_posts(self, session: AsyncSession, *conditions) -> Tuple[list, Dict[str, Set[str]]]:
+        """(id, title, excerpt, published) rows matching ``conditions`` and their tag ids."""
+        result = await session.execute(
+            select(Blog.id, Blog.title, Blog.excerpt, Blog.published)
+            .where(*conditions)
+            .order_by(Blog.id)
+        )
+        posts = result.all()
+
+        tags: Dict[str, Set[str]] = {post.id: set() for post in posts}
+        if posts:
+            result = await session.execute(
+                select(blog_tags.c.blog_id, blog_tags.c.tag_id)
+                .join(Blog, Blog.id == blog_tags.c.blog_id)
+                .where(*conditions)
+            )
+            for blog_id, tag_id in result:
+                tags[blog_id].add(tag_id)
+        return posts, tags
+
+    async def _sync_point(self, session: AsyncSession) -> Tuple[Optional[datetime], int]:
+        result = await session.execute(
+            select(func.max(Blog.updated_at), func.count().filter(Blog.published == True))
+        )
+        return tuple(result.one())
+
+    async def _load_model(self, session: AsyncSession) -> RelatedModel:
+        synced_at, _ = await self._sync_point(session)
+        posts, tags = await self._load_posts(session, Blog.published == True)
+        self._model = await asyncio.to_thread(
+            RelatedModel.build,
+            [post.id for post in posts],
+            [f"{post.title} {post.excerpt}" for post in posts],
+            [tags[post.id] for post in posts],
+            self.tag_weight
+        )
+        self._synced_at = synced_at
+        self.reloads += 1
+        return self._model
+
+    async def _update_model(self, session: AsyncSession, dirty: Set[str]) -> Tuple[RelatedModel, Set[str]]:
+        """The model with ``dirty`` and recently edited posts applied; returns it and those ids."""
+        if self._model is None:
+            return await self._load_model(session), set(dirty)
+
+        synced_at, published = await self._sync_point(session)
+        if not dirty and synced_at == self._synced_at and published == len(self._model):
+            return self._model, set()
+        conditions = [Blog.id.in_(dirty)] if dirty else []
+        if self._synced_at is not None:
+            # >= : rows stamped within the same clock tick as the last sync are re-read
+            conditions.append(comparable_timestamp(Blog.updated_at) >= bindparam(
+                None, self._synced_at, type_=Blog.updated_at.type
+            ))
+        posts, tags = await self._load_posts(session, or_(*conditions)) if conditions else ([], {})
+
+        current = [post for post in posts if post.published]
+        changed = set(dirty) | {post.id for post in posts}
+        model = self._model
+        await asyncio.to_thread(
+            model.update,
+            [post.id for post in current],
+            [f"{post.title} {post.excerpt}" for post in current],
+            [tags[post.id] for post in current],
+            changed - {post.id for post in current}
+        )
+        self._synced_at = synced_at
+
+        if len(model) != published:
+            # Posts deleted by another worker leave no trace to sync from
+            previous = set(model.ids)
+            model = await self._load_model(session)
+            changed |= previous.difference(model.ids)
+        return model, changed
+
+    async def _write(
+        self, session: AsyncSession, neighbours: Dict[str, List[Tuple[str, float]]],
+        removed: Set[str] = frozenset()
+    ) -> None:
+        if removed:
+            await session.execute(
+                delete(RelatedPost).where(
+                    or_(RelatedPost.blog_id.in_(removed), RelatedPost.related_id.in_(removed))
+                )
+            )
+        if neighbours:
+            await session.execute(delete(RelatedPost).where(RelatedPost.blog_id.in_(neighbours)))
+            rows = [
+                {"blog_id": blog_id, "related_id": related_id, "rank": rank, "score": score}
+                for blog_id, ranked in neighbours.items()
+                for rank, (related_id, score) in enumerate(ranked)
+            ]
+            if rows:
+                await session.execute(insert(RelatedPost), rows)
+        self.lists_written += len(neighbours)
+
+    async def _outranked(
+        self, session: AsyncSession, model: RelatedModel, changed: List[str]
+    ) -> Set[str]:
+        """Posts whose list a changed post would now enter."""
+        result = await session.execute(
+            select(RelatedPost.blog_id, func.min(RelatedPost.score), func.count())
+            .group_by(RelatedPost.blog_id)
+        )
+        threshold = np.zeros(len(model), dtype=np.float32)
+        for blog_id, lowest, count in result:
+            if blog_id in model.index and count >= self.k:
+                threshold[model.index[blog_id]] = lowest
+
+        rows = np.array([model.index[blog_id] for blog_id in changed], dtype=np.intp)
+        outranked = set()
+        for start in range(0, len(rows), CHUNK_ROWS):
+            scores = await asyncio.to_thread(model.scores, rows[start:start + CHUNK_ROWS])
+            hits = np.nonzero(((scores > threshold) & (scores > 0)).any(axis=0))[0]
+            outranked.update(model.ids[column] for column in hits)
+        return outranked
+
+    async def refresh(self) -> int:
+        """Rewrite the lists affected by the posts marked dirty here or edited
+        by other workers since the last refresh; returns lists written."""
+        async with self._lock:
+            dirty, self._dirty = self._dirty, set()
+
+            try:
+                async with async_session_maker() as session:
+                    model, touched = await self._update_model(session, dirty)
+                    if not touched:
+                        return 0
+                    changed = [blog_id for blog_id in touched if blog_id in model.index]
+                    removed = touched - set(changed)
+
+                    result = await session.execute(
+                        select(RelatedPost.blog_id).where(RelatedPost.related_id.in_(touched))
+                    )
+                    affected = set(changed) | set(result.scalars())
+                    affected |= await self._outranked(session, model, changed)
+                    affected = [blog_id for blog_id in affected if blog_id in model.index]
+
+                    neighbours = await asyncio.to_thread(model.top_k, affected, self.k)
+                    await self._write(session, neighbours, removed)
+                    await session.commit()
+            except Exception:
+                logger.exception("Failed to refresh related posts (%d marked dirty)", len(dirty))
+                # The model may be part-updated: start over from the database
+                self._model = None
+                self._dirty |= dirty
+                return 0
+
+            self.refreshes += 1
+            return len(neighbours)
+
+    async def rebuild(self) -> int:
+        """Recompute every list from scratch; returns lists written."""
+        async with self._lock:
+            self._dirty.clear()
+            async with async_session_maker() as session:
+                model = await self._load_model(session)
+                neighbours = await asyncio.to_thread(model.top_k, model.ids, self.k)
+                await session.execute(delete(RelatedPost))
+                await self._write(session, neighbours)
+                await session.commit()
+
+            self.rebuilds += 1
+            return len(neighbours)
+
+    async def _build_if_empty(self) -> None:
+        try:
+            async with async_session_maker() as session:
+                empty = await session.scalar(select(RelatedPost.blog_id).limit(1)) is None
+            if empty:
+                await self.rebuild()
+        except Exception:
+            logger.exception("Failed to build the initial related posts")
+
+    async def _run(self) -> None:
+        await self._build_if_empty()
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.refresh()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._dirty),
+            "refreshes": self.refreshes,
+            "rebuilds": self.rebuilds,
+            "reloads": self.reloads,
+            "posts": len(self._model) if self._model is not None else None,
+            "lists_written": self.lists_written,
+        }
+
+
+related_engine = RelatedPostsEngine(
+    k=settings.RELATED_POSTS_K,
+    tag_weight=settings.RELATED_POSTS_TAG_WEIGHT,
+    refresh_interval=settings.RELATED_POSTS_REFRESH_SECONDS,
+)
+
+
+async def related_posts(session: AsyncSession, blog_id: str, limit: int) -> List[BlogList]:
+    """``blog_id``'s precomputed neighbours, best first (one statement)."""
+    result = await session.execute(
+        select(*list_columns(session.bind.dialect.name))
+        .join(Blog.author)
+        .join(RelatedPost, RelatedPost.related_id == Blog.id)
+        .where(RelatedPost.blog_id == blog_id, Blog.published == True)
+        .order_by(RelatedPost.rank)
+        .limit(limit)
+    )
+    return validate_rows(BlogList, [list_item(row) for row in result])
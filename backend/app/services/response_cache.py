@@ -0,0 +1,97 @@
+import time
+from dataclasses import replace
+from typing import Any, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.cache import TTLCache
+from app.services.conditional import Validators, load_validators
+from app.services.serialization import adapter
+
+
+class ResponseCache:
+    """Serialized JSON responses for public read endpoints.
+
+    Entries are grouped by namespace (``"blogs"``, ``"features"``, ...) so an
+    admin write can drop everything derived from the rows it touched. Cached
+    bodies are returned as a plain ``Response``, which skips response_model
+    validation and serialization on a hit; the OpenAPI schema still comes
+    from the route's ``response_model``.
+
+    Every entry carries its ETag/Last-Modified validators, derived from the
+    namespace's content version, so conditional requests get a 304 without
+    loading rows, both on a hit and on a miss.
+
+    A miss served from the read replica shortly after its namespace was
+    invalidated is not stored: the replica may not have the write yet, and
+    caching its answer would outlive the lag. Neither is a miss whose
+    namespace was invalidated while it was loading: its rows may predate the
+    write, and nothing would drop the entry before its TTL.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, cache: TTLCache, replica_stale_window: float = 0.0):
+        self.cache = cache
+        self.replica_stale_window = replica_stale_window
+        self._invalidated_at = {}
+        self._generations = {}
+
+    @staticmethod
+    def key(namespace: str, route: str, **params: Hashable) -> Tuple:
+        return (namespace, route, tuple(sorted(params.items())))
+
+    async def lookup(
+        self, request: Request, session: AsyncSession, key: Tuple
+    ) -> Tuple[Optional[Response], Validators]:
+        """Cached (or 304) response for ``key``, plus the validators to store on a miss."""
+        generation = self._generations.get(key[0], 0)
+        entry = self.cache.get(key)
+        if entry is not None:
+            body, validators = entry
+            if validators.matches(request):
+                return validators.not_modified(), validators
+            return self._response(body, validators), validators
+
+        validators = replace(await load_validators(session, key[0], key), generation=generation)
+        if session.info.get("replica") and self._recently_invalidated(key[0]):
+            validators = replace(validators, cacheable=False)
+        if validators.matches(request):
+            return validators.not_modified(), validators
+        return None, validators
+
+    def set(
+        self, key: Tuple, content: Any, response_type: Any, validators: Validators,
+        ttl: Optional[float] = None
+    ) -> Response:
+        """Serialize ``content`` as ``response_type``, cache it and return the response."""
+        body = adapter(response_type).dump_json(content)
+        if validators.cacheable and validators.generation == self._generations.get(key[0], 0):
+            self.cache.set(key, (body, validators), ttl=ttl)
+        return self._response(body, validators)
+
+    def _response(self, body: bytes, validators: Validators) -> Response:
+        return Response(content=body, media_type=self.media_type, headers=validators.headers())
+
+    def invalidate(self, namespace: str) -> int:
+        self._invalidated_at[namespace] = time.monotonic()
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        return self.cache.delete_where(lambda key: key[0] == namespace)
+
+    def _recently_invalidated(self, namespace: str) -> bool:
+        invalidated_at = self._invalidated_at.get(namespace)
+        return (
+            invalidated_at is not None
+            and time.monotonic() - invalidated_at < self.replica_stale_window
+        )
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+response_cache = ResponseCache(
+    TTLCache(maxsize=settings.RESPONSE_CACHE_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS),
+    replica_stale_window=settings.REPLICA_MAX_LAG_SECONDS + settings.REPLICA_CHECK_INTERVAL_SECONDS,
+)
@@ -0,0 +1,98 @@
+import re
+from typing import List, Optional
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Blog, BLOG_SEARCH_CONFIG
+
+# ts_headline / fallback snippet formatting
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter= ... "
+)
+SNIPPET_RADIUS = 120
+
+
+def uses_postgres(session: AsyncSession) -> bool:
+    return session.bind.dialect.name == "postgresql"
+
+
+class BlogSearch:
+    """Search predicate, ranking and snippets for a blog search term.
+
+    On Postgres this matches and ranks against ``blogs.search_vector``, the
+    stored, GIN-indexed weighted tsvector document (see
+    ``blog_search_document``). Other backends (the local
+    SQLite test database) fall back to substring matching with snippets
+    built in Python.
+    """
+
+    def __init__(self, term: str, postgres: bool):
+        self.term = term.strip()
+        self.postgres = postgres
+
+        if self.postgres:
+            self.document = Blog.__table__.c.search_vector
+            self.query = func.websearch_to_tsquery(
+                literal_column(f"'{BLOG_SEARCH_CONFIG}'"), self.term
+            )
+
+    @property
+    def condition(self):
+        if self.postgres:
+            return self.document.op("@@")(self.query)
+
+        pattern = f"%{self.term}%"
+        return or_(
+            Blog.title.ilike(pattern),
+            Blog.excerpt.ilike(pattern),
+            Blog.content.ilike(pattern)
+        )
+
+    @property
+    def rank(self):
+        if not self.postgres:
+            return None
+        return func.ts_rank_cd(self.document, self.query).label("search_rank")
+
+    @property
+    def headline(self):
+        if not self.postgres:
+            return None
+        return func.ts_headline(
+            literal_column(f"'{BLOG_SEARCH_CONFIG}'"),
+            Blog.content,
+            self.query,
+            HEADLINE_OPTIONS
+        ).label("search_snippet")
+
+    def snippet(self, text: Optional[str]) -> Optional[str]:
+        """Python-side highlighted snippet for backends without ts_headline."""
+        if not text:
+            return None
+
+        terms = _terms(self.term)
+        if not terms:
+            return None
+
+        pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+        match = pattern.search(text)
+        if not match:
+            return None
+
+        start = max(match.start() - SNIPPET_RADIUS, 0)
+        end = min(match.end() + SNIPPET_RADIUS, len(text))
+        fragment = pattern.sub(
+            lambda m: f"{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_STOP}",
+            text[start:end]
+        )
+        prefix = "... " if start > 0 else ""
+        suffix = " ..." if end < len(text) else ""
+        return f"{prefix}{fragment}{suffix}"
+
+
+def _terms(term: str) -> List[str]:
+    return [word for word in re.findall(r"\w+", term) if word]
@@ -0,0 +1,40 @@
+from functools import lru_cache
+from typing import Any, List, Mapping, Optional, Sequence, Type, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def adapter(response_type: Any) -> TypeAdapter:
+    """TypeAdapter for ``response_type``, built once per type."""
+    return TypeAdapter(response_type)
+
+
+def validate_rows(schema: Type[SchemaT], rows: Sequence[Any]) -> List[SchemaT]:
+    """Validate ORM rows into ``schema`` instances in a single pydantic-core call."""
+    return adapter(List[schema]).validate_python(rows, from_attributes=True)
+
+
+class TypedJSONResponse(Response):
+    """JSON response serialized by pydantic-core straight to bytes.
+
+    Returning one of these from a handler skips FastAPI's second validation
+    pass against ``response_model`` and the stdlib json encoder; the route's
+    ``response_model`` still drives the OpenAPI schema, so ``response_type``
+    should match it.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self, content: Any, response_type: Any, status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None
+    ):
+        self.response_type = response_type
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        return adapter(self.response_type).dump_json(content)
@@ -0,0 +1,151 @@
+import asyncio
+import codecs
+import csv
+import json
+import uuid
+from typing import AsyncIterator, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pydantic.networks import validate_email
+from pydantic_core import PydanticCustomError
+from sqlalchemy import func, select
+
+from app.database import async_session_maker
+from app.models.models import Newsletter
+from app.schemas.schemas import SubscriberImportBatch, SubscriberImportResponse
+from app.services.export import ExportFormat
+from app.services.upsert import dialect_insert
+
+# Invalid addresses echoed back per batch
+MAX_INVALID_EXAMPLES = 5
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode an uploaded byte stream into lines without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_addresses(
+    lines: AsyncIterator[str], import_format: ExportFormat
+) -> AsyncIterator[Tuple[int, str]]:
+    """(line number, raw address) per record; CSV needs an ``email`` header column."""
+    column: Optional[int] = None
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if import_format == ExportFormat.NDJSON:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield line_number, line
+                continue
+            email = record.get("email") if isinstance(record, dict) else None
+            yield line_number, email if isinstance(email, str) else ""
+            continue
+
+        fields = next(csv.reader([line]))
+        if column is None:
+            header = [field.strip().lower() for field in fields]
+            if "email" not in header:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="CSV import needs a header row with an 'email' column"
+                )
+            column = header.index("email")
+            continue
+        yield line_number, fields[column] if column < len(fields) else ""
+
+
+def normalize_addresses(addresses: List[Tuple[int, str]]) -> Tuple[List[str], List[str]]:
+    """Unique normalized addresses (first occurrence wins) and the invalid inputs."""
+    valid, invalid, seen = [], [], set()
+    for line_number, address in addresses:
+        try:
+            _, email = validate_email(address.strip())
+        except PydanticCustomError:
+            invalid.append(f"line {line_number}: {address}")
+            continue
+        if email not in seen:
+            seen.add(email)
+            valid.append(email)
+    return valid, invalid
+
+
+async def _write_batch(number: int, addresses: List[Tuple[int, str]]) -> SubscriberImportBatch:
+    # Validation is CPU-bound: keep it off the event loop
+    emails, invalid = await asyncio.to_thread(normalize_addresses, addresses)
+
+    async with async_session_maker() as session:
+        existing = {}
+        if emails:
+            result = await session.execute(
+                select(Newsletter.email, Newsletter.active).where(Newsletter.email.in_(emails))
+            )
+            existing = dict(result.all())
+
+            insert = dialect_insert(session)
+            table = Newsletter.__table__
+            statement = insert(table).values([
+                {"id": str(uuid.uuid4()), "email": email, "active": True} for email in emails
+            ])
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.email],
+                set_={"active": True, "updated_at": func.now()},
+                where=table.c.active == False
+            )
+            await session.execute(statement)
+            await session.commit()
+
+    reactivated = sum(1 for active in existing.values() if not active)
+    return SubscriberImportBatch(
+        batch=number,
+        received=len(addresses),
+        new=len(emails) - len(existing),
+        reactivated=reactivated,
+        already_active=len(existing) - reactivated,
+        duplicates=len(addresses) - len(emails) - len(invalid),
+        invalid=len(invalid),
+        invalid_examples=invalid[:MAX_INVALID_EXAMPLES]
+    )
+
+
+async def import_subscribers(
+    chunks: AsyncIterator[bytes], import_format: ExportFormat, batch_size: int
+) -> SubscriberImportResponse:
+    """Upsert every address in the upload, ``batch_size`` rows per statement.
+
+    Each batch is validated, then written with one ``INSERT ... ON CONFLICT
+    (email) DO UPDATE`` that only touches inactive rows, and committed on its
+    own, so a failure part-way keeps the batches already reported.
+    """
+    batches: List[SubscriberImportBatch] = []
+    pending: List[Tuple[int, str]] = []
+    async for record in iter_addresses(iter_lines(chunks), import_format):
+        pending.append(record)
+        if len(pending) >= batch_size:
+            batches.append(await _write_batch(len(batches) + 1, pending))
+            pending = []
+    if pending:
+        batches.append(await _write_batch(len(batches) + 1, pending))
+
+    return SubscriberImportResponse(
+        batches=batches,
+        received=sum(batch.received for batch in batches),
+        new=sum(batch.new for batch in batches),
+        reactivated=sum(batch.reactivated for batch in batches),
+        already_active=sum(batch.already_active for batch in batches),
+        duplicates=sum(batch.duplicates for batch in batches),
+        invalid=sum(batch.invalid for batch in batches)
+    )
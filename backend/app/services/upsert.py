@@ -0,0 +1,15 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_inserts = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def dialect_insert(session: AsyncSession):
+    """The session dialect's ``insert()``, which supports ``on_conflict_do_update``."""
+    insert = _inserts.get(session.bind.dialect.name)
+    if insert is None:
+        raise RuntimeError(f"Unsupported dialect: {session.bind.dialect.name}")
+    return insert
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, update
+
+from app.core.config import settings
+from app.database import engine
+from app.models.models import Blog
+
+logger = logging.getLogger(__name__)
+
+blogs_table = Blog.__table__
+
+# One atomic increment per post; updated_at is pinned so a page view does not
+# look like a content edit.
+INCREMENT_VIEWS = (
+    update(blogs_table)
+    .where(blogs_table.c.id == bindparam("blog_id"))
+    .values(
+        views=blogs_table.c.views + bindparam("increment"),
+        updated_at=blogs_table.c.updated_at
+    )
+)
+
+
+class ViewCounter:
+    """Write-behind accumulator for blog views.
+
+    ``record()`` only bumps an in-memory counter; ``flush()`` writes the
+    accumulated increments with one ``UPDATE ... SET views = views + n`` per
+    post. A background task flushes every ``flush_interval`` seconds, and
+    ``record()`` triggers an early flush once ``max_pending`` views are queued.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_pending: int = 1000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.flushed = 0
+        self._pending: Dict[str, int] = defaultdict(int)
+        self._pending_total = 0
+        self._task: Optional[asyncio.Task] = None
+        self._kicked: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def _kick(self) -> None:
+        """Start an early flush unless one is already queued or running."""
+        if self._flush_lock.locked() or (self._kicked is not None and not self._kicked.done()):
+            return
+        self._kicked = asyncio.create_task(self.flush())
+
+    async def record(self, blog_id: str) -> int:
+        """Queue one view and return the views not yet written for this post."""
+        self._pending[blog_id] += 1
+        self._pending_total += 1
+        if self._pending_total >= self.max_pending:
+            self._kick()
+        return self._pending[blog_id]
+
+    async def _take(self) -> Dict[str, int]:
+        pending, self._pending = self._pending, defaultdict(int)
+        self._pending_total = 0
+        return dict(pending)
+
+    async def _restore(self, increments: Dict[str, int]) -> None:
+        for blog_id, increment in increments.items():
+            self._pending[blog_id] += increment
+            self._pending_total += increment
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            increments = await self._take()
+            if not increments:
+                return 0
+
+            params = [
+                {"blog_id": blog_id, "increment": increment}
+                for blog_id, increment in sorted(increments.items())
+            ]
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(INCREMENT_VIEWS, params)
+            except Exception:
+                logger.exception("Failed to flush %d blog view increments", len(params))
+                await self._restore(increments)
+                return 0
+
+            flushed = sum(increments.values())
+            self.flushed += flushed
+            return flushed
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "pending": self._pending_total,
+            "flushed": self.flushed,
+        }
+
+
+class RedisViewCounter(ViewCounter):
+    """ViewCounter that accumulates in a Redis hash shared by all workers.
+
+    If Redis is unreachable views are counted in this worker's memory instead
+    (and logged), like the rate limiter, rather than failing the page; the
+    next flush writes both.
+    """
+
+    def __init__(self, redis_url: str, key: str = "blog:views:pending", **kwargs):
+        super().__init__(**kwargs)
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError("VIEW_COUNTER_BACKEND=redis requires the 'redis' package") from exc
+
+        self.key = key
+        self.errors = 0
+        self.redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+
+    def _redis_failed(self, action: str) -> None:
+        self.errors += 1
+        logger.warning("Redis view counter failed to %s; using local memory", action, exc_info=True)
+
+    async def record(self, blog_id: str) -> int:
+        try:
+            pending = await self.redis.hincrby(self.key, blog_id, 1)
+        except Exception:
+            self._redis_failed("record a view")
+            return await super().record(blog_id)
+        if pending >= self.max_pending:
+            self._kick()
+        return pending
+
+    async def _take(self) -> Dict[str, int]:
+        # Views counted locally while Redis was unreachable, plus the shared hash
+        increments = await super()._take()
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hgetall(self.key)
+                pipe.delete(self.key)
+                pending, _ = await pipe.execute()
+        except Exception:
+            self._redis_failed("take pending views")
+            return increments
+        for blog_id, increment in pending.items():
+            increments[blog_id] = increments.get(blog_id, 0) + int(increment)
+        return increments
+
+    async def _restore(self, increments: Dict[str, int]) -> None:
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for blog_id, increment in increments.items():
+                    pipe.hincrby(self.key, blog_id, increment)
+                await pipe.execute()
+        except Exception:
+            self._redis_failed("restore pending views")
+            await super()._restore(increments)
+
+    async def stop(self) -> None:
+        await super().stop()
+        await self.redis.close()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "redis",
+            "local_pending": self._pending_total,
+            "flushed": self.flushed,
+            "errors": self.errors,
+        }
+
+
+def create_view_counter() -> ViewCounter:
+    options = {
+        "flush_interval": settings.VIEW_COUNTER_FLUSH_SECONDS,
+        "max_pending": settings.VIEW_COUNTER_MAX_PENDING,
+    }
+    if settings.VIEW_COUNTER_BACKEND == "redis":
+        return RedisViewCounter(settings.REDIS_URL, **options)
+    return ViewCounter(**options)
+
+
+view_counter = create_view_counter()
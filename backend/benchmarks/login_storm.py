@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Login storm benchmark.
+
+Fires a burst of concurrent logins at the app in-process (one event loop,
+like a single uvicorn worker) while a probe keeps hitting a cheap endpoint,
+then reports login throughput and the probe's latency percentiles.
+
+Compare hashing on the event loop with the hashing pool:
+
+    PASSWORD_HASH_WORKERS=0 python benchmarks/login_storm.py
+    PASSWORD_HASH_WORKERS=4 python benchmarks/login_storm.py
+
+Requires httpx and a database reachable through DATABASE_URL (a SQLite file
+such as sqlite+aiosqlite:///./bench.db works).
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from sqlalchemy import select
+
+from app.core.security import get_password_hash, hashing_executor
+from app.database import async_session_maker, create_tables
+from app.models.models import User, Role
+from main import app
+
+EMAIL = "login-storm@example.com"
+PASSWORD = "login-storm-password"
+
+
+async def ensure_user():
+    await create_tables()
+    async with async_session_maker() as session:
+        result = await session.execute(select(User).where(User.email == EMAIL))
+        if result.scalar_one_or_none() is None:
+            session.add(User(
+                id=str(uuid.uuid4()),
+                email=EMAIL,
+                name="Login Storm",
+                password=get_password_hash(PASSWORD),
+                role=Role.USER
+            ))
+            await session.commit()
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def probe(client, path, latencies, stop, interval=0.01):
+    # Latency is measured from when each probe was due, so time spent waiting
+    # for a blocked event loop counts against the probe
+    due = time.perf_counter()
+    while not stop.is_set():
+        await client.get(path)
+        latencies.append((time.perf_counter() - due) * 1000)
+        due += interval
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+
+
+async def login(client, semaphore):
+    async with semaphore:
+        response = await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+        response.raise_for_status()
+
+
+async def main(logins, concurrency, probe_path):
+    await ensure_user()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Baseline probe latency with no logins in flight
+        idle, stop = [], asyncio.Event()
+        task = asyncio.create_task(probe(client, probe_path, idle, stop))
+        await asyncio.sleep(1)
+        stop.set()
+        await task
+
+        storm, stop = [], asyncio.Event()
+        task = asyncio.create_task(probe(client, probe_path, storm, stop))
+        semaphore = asyncio.Semaphore(concurrency)
+        started = time.perf_counter()
+        await asyncio.gather(*(login(client, semaphore) for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await task
+
+    print(f"hash workers:       {hashing_executor.max_workers}")
+    print(f"logins:             {logins} in {elapsed:.2f}s ({logins / elapsed:.1f}/s)")
+    for label, samples in (("idle", idle), ("during storm", storm)):
+        print(
+            f"{probe_path} {label:>12}: n={len(samples)} "
+            f"p50={statistics.median(samples):.1f}ms p99={percentile(samples, 99):.1f}ms"
+        )
+    print(f"hashing stats:      {hashing_executor.stats()}")
+    hashing_executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--probe-path", default="/health")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency, args.probe_path))
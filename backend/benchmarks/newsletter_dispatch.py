@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Newsletter dispatch benchmark against a local SMTP sink.
+
+Starts an aiosmtpd server that accepts and counts every message, seeds
+synthetic subscribers (ids prefixed ``bench-``), sends one campaign through
+the NewsletterDispatcher and reports messages per second. With
+``--interrupt-after`` the send is cancelled part-way and resumed from its
+checkpoint, and the script checks that every subscriber got the campaign.
+
+    pip install aiosmtpd
+    DATABASE_URL=sqlite+aiosqlite:///./dispatch.db \\
+        python benchmarks/newsletter_dispatch.py --subscribers 5000 --connections 8
+"""
+import argparse
+import asyncio
+import sys
+import uuid
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiosmtpd.controller import Controller
+from sqlalchemy import delete, insert, select
+
+from app.core.config import settings
+from app.database import async_session_maker, create_tables, engine
+from app.models.models import Campaign, CampaignStatus, Newsletter
+from app.services.newsletter_dispatch import NewsletterDispatcher
+
+
+class CountingSink:
+    """aiosmtpd handler that only counts deliveries per recipient."""
+
+    def __init__(self):
+        self.recipients = Counter()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.recipients.update(envelope.rcpt_tos)
+        return "250 Message accepted for delivery"
+
+
+async def seed(subscribers: int) -> str:
+    async with async_session_maker() as session:
+        await session.execute(delete(Newsletter).where(Newsletter.id.like("bench-%")))
+        rows = [
+            {"id": f"bench-{i:07d}", "email": f"bench-{i}@example.com", "active": True}
+            for i in range(subscribers)
+        ]
+        for start in range(0, len(rows), 1000):
+            await session.execute(insert(Newsletter), rows[start:start + 1000])
+
+        campaign = Campaign(
+            id=str(uuid.uuid4()),
+            subject="Dispatch benchmark",
+            body_text="Plain text body.\n" * 20,
+            body_html="<p>HTML body.</p>" * 20,
+            status=CampaignStatus.DRAFT
+        )
+        session.add(campaign)
+        await session.commit()
+        return campaign.id
+
+
+async def main(args):
+    await create_tables()
+    sink = CountingSink()
+    controller = Controller(sink, hostname="127.0.0.1", port=args.port)
+    controller.start()
+    settings.SMTP_HOST, settings.SMTP_PORT = "127.0.0.1", args.port
+
+    dispatcher = NewsletterDispatcher(
+        sender=settings.NEWSLETTER_FROM,
+        connections=args.connections,
+        send_rate=args.rate,
+        page_size=args.page_size,
+        lease_seconds=settings.NEWSLETTER_LEASE_SECONDS,
+    )
+    try:
+        campaign_id = await seed(args.subscribers)
+        active = args.subscribers
+        async with async_session_maker() as session:
+            result = await session.execute(select(Newsletter.email).where(Newsletter.active == True))
+            expected = set(result.scalars())
+
+        assert await dispatcher.claim(campaign_id)
+        if args.interrupt_after:
+            dispatcher.start(campaign_id)
+            await asyncio.sleep(args.interrupt_after)
+            await dispatcher.stop()
+            interrupted = dispatcher.reports[campaign_id]
+            print(f"interrupted after {interrupted.sent} messages; resuming")
+            assert await dispatcher.claim(campaign_id)
+
+        report = await dispatcher.run(campaign_id)
+        print(
+            f"connections={args.connections} page_size={args.page_size} "
+            f"sent={report.sent} failed={report.failed} seconds={report.seconds:.2f} "
+            f"messages/s={report.messages_per_second:.0f} smtp_connections={report.connections}"
+        )
+
+        missing = expected - set(sink.recipients)
+        duplicates = sum(1 for count in sink.recipients.values() if count > 1)
+        print(f"subscribers={active} delivered={len(sink.recipients)} missing={len(missing)} duplicates={duplicates}")
+        if missing or (duplicates and not args.interrupt_after) or duplicates > args.page_size:
+            return 1
+        return 0
+    finally:
+        controller.stop()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=settings.NEWSLETTER_SMTP_CONNECTIONS)
+    parser.add_argument("--page-size", type=int, default=settings.NEWSLETTER_PAGE_SIZE)
+    parser.add_argument("--rate", type=float, default=0.0, help="messages per second, 0 = unlimited")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument(
+        "--interrupt-after", type=float, default=0.0,
+        help="cancel the send after this many seconds, then resume it"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
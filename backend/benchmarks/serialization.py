@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Response serialization benchmark.
+
+Compares the two ways a blog page can be turned into response bytes, using
+in-memory ORM objects (no database):
+
+* ``fastapi``: ``BlogList.model_validate`` per row, then FastAPI's
+  ``response_model`` pass (validate + ``jsonable_encoder``) and the stdlib
+  json encoder in ``JSONResponse``.
+* ``typed``: one ``validate_rows`` call and ``TypedJSONResponse``, which
+  dumps straight to bytes with pydantic-core.
+
+    python benchmarks/serialization.py --rows 100 --iterations 500
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models.models import Blog, Role, Tag, User
+from app.schemas.schemas import BlogList, BlogsResponse
+from app.services.serialization import TypedJSONResponse, validate_rows
+
+
+def make_blogs(count: int):
+    author = User(
+        id="author", email="author@example.com", name="Author", password="x",
+        role=Role.ADMIN, created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1)
+    )
+    tags = [Tag(id=f"t{i}", name=f"Tag {i}", slug=f"tag-{i}", color="#3b82f6") for i in range(3)]
+    blogs = []
+    for i in range(count):
+        blog = Blog(
+            id=f"blog-{i}", title=f"Post {i}", excerpt="An excerpt " * 5, content="",
+            image="cover.png", slug=f"post-{i}", published=True, featured=i % 5 == 0,
+            views=i, author_id=author.id, publish_date=datetime(2024, 1, 1),
+            created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1),
+        )
+        blog.author = author
+        blog.tags = tags
+        blogs.append(blog)
+    return blogs
+
+
+async def fastapi_path(blogs, field) -> bytes:
+    content = BlogsResponse(
+        blogs=[BlogList.model_validate(blog) for blog in blogs],
+        total=len(blogs), skip=0, limit=len(blogs)
+    )
+    data = await serialize_response(field=field, response_content=content)
+    return JSONResponse(data).body
+
+
+async def typed_path(blogs, field) -> bytes:
+    content = BlogsResponse(
+        blogs=validate_rows(BlogList, blogs), total=len(blogs), skip=0, limit=len(blogs)
+    )
+    return TypedJSONResponse(content, BlogsResponse).body
+
+
+async def measure(path, blogs, field, iterations: int):
+    await path(blogs, field)  # warm up adapters and schema caches
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await path(blogs, field)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def main(rows: int, iterations: int):
+    blogs = make_blogs(rows)
+    field = create_response_field(name="Response_get_blogs", type_=BlogsResponse, mode="serialization")
+
+    for name, path in (("fastapi", fastapi_path), ("typed", typed_path)):
+        timings = await measure(path, blogs, field, iterations)
+        body = await path(blogs, field)
+        print(
+            f"{name:8s} rows={rows} bytes={len(body)} "
+            f"median={statistics.median(timings):.3f}ms "
+            f"p95={statistics.quantiles(timings, n=20)[18]:.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.iterations))
@@ -81,16 +81,38 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
 
-from app.database import create_tables
-from app.routers import auth, blogs, users, navbar, testimonials, features, contact, newsletter
+from app.database import create_tables, read_engine, read_your_writes
+from app.routers import auth, blogs, users, navbar, testimonials, features, contact, newsletter, metrics
 from app.core.config import settings  # Import settings for CORS origins
+from app.core.security import hashing_executor
+from app.services.events import event_bus
+from app.services.ingest import ingest_buffer
+from app.services.newsletter_dispatch import newsletter_dispatcher
+from app.services.rate_limit import rate_limiter
+from app.services.related import related_engine
+from app.services.view_counter import view_counter
 
 # Lifespan context manager for database initialization
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create database tables on startup
-    await create_tables()
+    # Create database tables on startup (unless migrations manage the schema)
+    if settings.DB_CREATE_TABLES:
+        await create_tables()
+    await event_bus.start()
+    await view_counter.start()
+    await related_engine.start()
+    # Replays submissions spooled by a worker that crashed
+    await ingest_buffer.start()
     yield
+    # Write out buffered blog views and submissions before the worker exits
+    await view_counter.stop()
+    await ingest_buffer.stop()
+    await related_engine.stop()
+    # Interrupted campaign sends keep their checkpoint and can be resumed
+    await newsletter_dispatcher.stop()
+    await event_bus.stop()
+    await rate_limiter.stop()
+    hashing_executor.shutdown()
 
 # Create a single FastAPI app instance
 app = FastAPI(
@@ -109,6 +131,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Pin a client's reads to the primary for a while after it writes (only
+# needed with a read replica)
+if read_engine is not None:
+    app.middleware("http")(read_your_writes)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
@@ -118,6 +145,7 @@ app.include_router(testimonials.router, prefix="/api/testimonials", tags=["testi
 app.include_router(features.router, prefix="/api/features", tags=["features"])
 app.include_router(contact.router, prefix="/api/contact", tags=["contact"])
 app.include_router(newsletter.router, prefix="/api/newsletter", tags=["newsletter"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["metrics"])
 
 # Root endpoint
 @app.get("/")
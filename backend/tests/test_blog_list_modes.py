@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from sqlalchemy import insert, literal_column
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.models.models import Blog, Role, Tag, User, blog_tags
+from app.routers.blogs import get_blogs
+from app.services.counts import TotalMode, blog_counts
+from app.services.response_cache import response_cache
+
+pytestmark = pytest.mark.anyio
+
+MODES = ("single", "orm")
+
+
+def stored_timestamp(minute: int):
+    return literal_column(f"'2024-01-01 12:{minute:02d}:00'")
+
+
+async def seed_posts(session) -> None:
+    session.add(User(id="u1", email="author@example.com", password="x", name="Author", role=Role.ADMIN))
+    session.add_all([
+        Tag(id="t1", name="Python", slug="python", color="#111111"),
+        Tag(id="t2", name="Databases", slug="databases", color="#222222"),
+    ])
+    await session.flush()
+    for i in range(12):
+        await session.execute(insert(Blog).values(
+            id=f"b{i:02d}", title=f"Post {i}", excerpt="excerpt", image="x.png", slug=f"post-{i}",
+            content=f"Notes on {'indexing' if i % 3 == 0 else 'writing'} number {i}",
+            published=i != 11, featured=i % 4 == 0, author_id="u1", views=i,
+            # Pairs of posts share a timestamp, so the id tiebreak matters
+            publish_date=stored_timestamp(i // 2)
+        ))
+    links = [{"blog_id": f"b{i:02d}", "tag_id": "t1"} for i in range(0, 12, 2)]
+    links += [{"blog_id": f"b{i:02d}", "tag_id": "t2"} for i in range(0, 12, 3)]
+    await session.execute(insert(blog_tags).values(links))
+    await session.commit()
+
+
+async def list_blogs(session, mode: str, **params) -> dict:
+    """GET /api/blogs in ``mode``, with no cached responses or totals."""
+    settings.BLOG_LIST_QUERY_MODE = mode
+    response_cache.invalidate("blogs")
+    blog_counts.invalidate()
+    query = {
+        "skip": 0, "limit": 4, "search": None, "featured": None, "published": True,
+        "tag": None, "after": None, "total_mode": TotalMode.EXACT,
+    }
+    query.update(params)
+    request = Request({"type": "http", "method": "GET", "path": "/api/blogs/", "headers": []})
+    response = await get_blogs(request, session=session, **query)
+
+    body = json.loads(response.body)
+    for blog in body["blogs"]:
+        blog["tags"].sort(key=lambda tag: tag["id"])
+    return body
+
+
+@pytest.fixture
+def restore_mode():
+    mode = settings.BLOG_LIST_QUERY_MODE
+    yield
+    settings.BLOG_LIST_QUERY_MODE = mode
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"published": None},
+    {"published": False},
+    {"featured": True},
+    {"featured": False, "limit": 3},
+    {"search": "indexing"},
+    {"search": "indexing", "skip": 1, "limit": 2},
+    {"tag": "python"},
+    {"tag": "databases", "featured": True},
+    {"skip": 4},
+    {"skip": 9},
+    {"skip": 20},
+], ids=repr)
+async def test_modes_return_the_same_page(session, restore_mode, params):
+    await seed_posts(session)
+
+    single, orm = [await list_blogs(session, mode, **params) for mode in MODES]
+
+    assert single == orm
+    assert single["total"] is not None
+
+
+@pytest.mark.parametrize("params", [{}, {"tag": "python"}, {"featured": False}, {"search": "writing"}], ids=repr)
+async def test_modes_walk_the_same_cursor_pages(session, restore_mode, params):
+    await seed_posts(session)
+
+    walks = {}
+    for mode in MODES:
+        pages, after = [], None
+        for _ in range(10):
+            page = await list_blogs(session, mode, after=after, limit=3, **params)
+            pages.append(page)
+            after = page["next_cursor"]
+            if after is None:
+                break
+        walks[mode] = pages
+
+    assert walks["single"] == walks["orm"]
+    assert len(walks["single"]) > 1
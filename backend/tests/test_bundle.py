@@ -0,0 +1,59 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.deps import Principal
+from app.models.models import Blog, Role, User
+from app.routers.blogs import get_blog_bundle, slug_cache
+
+pytestmark = pytest.mark.anyio
+
+ADMIN = Principal(id="u1", email="author@example.com", role=Role.ADMIN)
+
+
+@pytest.fixture
+async def posts(session, monkeypatch):
+    monkeypatch.setattr(
+        "app.database.async_session_maker",
+        async_sessionmaker(session.bind, expire_on_commit=False)
+    )
+    slug_cache.clear()
+    session.add(User(id="u1", email="author@example.com", password="x", name="Author", role=Role.ADMIN))
+    await session.flush()
+    for blog_id, published in [("draft", False), ("live", True)]:
+        await session.execute(insert(Blog).values(
+            id=blog_id, title=blog_id, content="body", excerpt="excerpt", image="x.png",
+            slug=blog_id, published=published, featured=False, author_id="u1", views=0
+        ))
+    await session.commit()
+
+
+async def bundle(session, slug: str, current_user=None):
+    response = await get_blog_bundle(
+        slug, comments_limit=20, related_limit=3, session=session, current_user=current_user
+    )
+    return json.loads(response.body)
+
+
+async def test_unpublished_bundle_is_hidden_from_anonymous_readers(session, posts):
+    with pytest.raises(HTTPException) as raised:
+        await bundle(session, "draft")
+
+    assert raised.value.status_code == 404
+    assert (await bundle(session, "draft", current_user=ADMIN))["blog"]["id"] == "draft"
+
+
+async def test_bundle_rechecks_a_stale_slug_entry(session, posts):
+    assert (await bundle(session, "live"))["blog"]["id"] == "live"
+
+    # Unpublished by another worker: this worker's slug entry still says published
+    await session.execute(update(Blog).where(Blog.id == "live").values(published=False))
+    await session.commit()
+
+    with pytest.raises(HTTPException) as raised:
+        await bundle(session, "live")
+    assert raised.value.status_code == 404
+    assert slug_cache.get("live") is None
@@ -0,0 +1,57 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+
+from app.core.deps import Principal
+from app.models.models import Blog, Comment, Role, User
+from app.routers.blogs import approve_comment, delete_comment
+
+pytestmark = pytest.mark.anyio
+
+ADMIN = Principal(id="u1", email="author@example.com", role=Role.ADMIN)
+
+
+async def seed_comments(session) -> None:
+    session.add(User(id="u1", email="author@example.com", password="x", name="Author", role=Role.ADMIN))
+    await session.flush()
+    await session.execute(insert(Blog).values(
+        id="b1", title="Post", content="body", excerpt="excerpt", image="x.png", slug="post",
+        published=True, featured=False, author_id="u1", views=0
+    ))
+    await session.execute(insert(Comment).values([
+        {"id": f"c{i}", "content": "hi", "author_name": "n", "author_email": "n@example.com",
+         "approved": False, "blog_id": "b1"}
+        for i in range(3)
+    ]))
+    await session.commit()
+
+
+async def approved_count(session) -> int:
+    session.expire_all()
+    return await session.scalar(select(Blog.approved_comment_count).where(Blog.id == "b1"))
+
+
+async def test_repeated_approve_counts_once(session):
+    await seed_comments(session)
+
+    await approve_comment("c0", current_user=ADMIN, session=session)
+    approved = await approve_comment("c0", current_user=ADMIN, session=session)
+
+    assert approved.approved
+    assert await approved_count(session) == 1
+
+
+async def test_delete_only_uncounts_approved_comments(session):
+    await seed_comments(session)
+    await approve_comment("c0", current_user=ADMIN, session=session)
+    await approve_comment("c1", current_user=ADMIN, session=session)
+
+    await delete_comment("c0", current_user=ADMIN, session=session)
+    await delete_comment("c2", current_user=ADMIN, session=session)
+    with pytest.raises(HTTPException) as raised:
+        await delete_comment("c0", current_user=ADMIN, session=session)
+
+    assert raised.value.status_code == 404
+    assert await approved_count(session) == 1
+    remaining = (await session.execute(select(Comment.id))).scalars().all()
+    assert remaining == ["c1"]
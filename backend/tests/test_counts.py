@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from sqlalchemy import insert
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.deps import Principal
+from app.models.models import Blog, Role, User
+from app.routers import blogs
+from app.services.cache import TTLCache
+from app.services.counts import CountStrategy, TotalMode
+from app.services.response_cache import response_cache
+
+pytestmark = pytest.mark.anyio
+
+ADMIN = Principal(id="u1", email="author@example.com", role=Role.ADMIN)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(blogs, "blog_counts", CountStrategy(TTLCache(ttl=30, clock=clock)))
+    mode = settings.BLOG_LIST_QUERY_MODE
+    yield clock
+    settings.BLOG_LIST_QUERY_MODE = mode
+
+
+async def add_post(session, i: int) -> None:
+    await session.execute(insert(Blog).values(
+        id=f"b{i}", title=f"Post {i}", content="body", excerpt="excerpt", image="x.png",
+        slug=f"post-{i}", published=True, featured=False, author_id="u1", views=0
+    ))
+    await session.commit()
+
+
+@pytest.fixture
+async def posts(session):
+    session.add(User(id="u1", email="author@example.com", password="x", name="Author", role=Role.ADMIN))
+    await session.flush()
+    for i in range(5):
+        await add_post(session, i)
+
+
+async def list_blogs(session, **params) -> dict:
+    """GET /api/blogs with no cached response (cached totals are kept)."""
+    response_cache.invalidate("blogs")
+    query = {
+        "skip": 0, "limit": 2, "search": None, "featured": None, "published": True,
+        "tag": None, "after": None, "total_mode": TotalMode.EXACT,
+    }
+    query.update(params)
+    request = Request({"type": "http", "method": "GET", "path": "/api/blogs/", "headers": []})
+    response = await blogs.get_blogs(request, session=session, **query)
+    return json.loads(response.body)
+
+
+@pytest.mark.parametrize("mode", ["single", "orm"])
+async def test_cached_total_is_served_until_the_ttl(session, posts, clock, mode):
+    settings.BLOG_LIST_QUERY_MODE = mode
+    assert (await list_blogs(session))["total"] == 5
+
+    # Inserted without going through a write handler, so nothing invalidates
+    await add_post(session, 5)
+    assert (await list_blogs(session))["total"] == 5
+
+    clock.now += 31
+    assert (await list_blogs(session))["total"] == 6
+
+
+async def test_cached_total_is_dropped_on_a_write(session, posts, clock):
+    assert (await list_blogs(session))["total"] == 5
+
+    await blogs.delete_blog("b0", current_user=ADMIN, session=session)
+
+    assert (await list_blogs(session))["total"] == 4
+
+
+async def test_total_modes_shape(session, posts, clock):
+    none = await list_blogs(session, total_mode=TotalMode.NONE)
+    # Planner estimates are Postgres only; other databases count exactly
+    estimate = await list_blogs(session, total_mode=TotalMode.ESTIMATE)
+
+    assert none["total"] is None
+    assert len(none["blogs"]) == 2 and none["next_cursor"] is not None
+    assert [blog["id"] for blog in estimate["blogs"]] == [blog["id"] for blog in none["blogs"]]
+    if session.bind.dialect.name == "postgresql":
+        assert isinstance(estimate["total"], int) and estimate["total"] >= 0
+    else:
+        assert estimate["total"] == 5
@@ -0,0 +1,71 @@
+import json
+import os
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.services.ingest import DEAD_LETTER_NAME, IngestBuffer
+
+pytestmark = pytest.mark.anyio
+
+
+def record(row_id: str) -> dict:
+    return {"table": "contacts", "row": {"id": row_id}}
+
+
+def write_spool(path, records) -> None:
+    with open(path, "w", encoding="utf-8") as spool:
+        spool.writelines(json.dumps(item) + "\n" for item in records)
+
+
+def test_recover_skips_spool_claimed_by_another_worker(tmp_path, monkeypatch):
+    write_spool(tmp_path / "ingest-999999.jsonl", [record("a")])
+    gone = str(tmp_path / "ingest-999998.jsonl")
+    first, second = IngestBuffer(str(tmp_path)), IngestBuffer(str(tmp_path))
+
+    # Both workers list the directory before either claims anything
+    listing = [gone, str(tmp_path / "ingest-999999.jsonl")]
+    monkeypatch.setattr("app.services.ingest.glob.glob", lambda pattern: list(listing))
+
+    assert first._recover() == [record("a")]
+    assert second._recover() == []
+    assert os.listdir(tmp_path) == []
+
+
+async def test_rows_failing_on_their_own_are_quarantined(tmp_path):
+    buffer = IngestBuffer(str(tmp_path))
+    written = []
+
+    async def write(records):
+        if any(item["row"]["id"] == "bad" for item in records):
+            raise IntegrityError("INSERT", {}, Exception("NOT NULL constraint failed"))
+        written.extend(records)
+        buffer.flushed += len(records)
+
+    buffer._write = write
+    buffer._append_to_spool([record("a"), record("bad"), record("b")])
+    buffer._pending = [record("a"), record("bad"), record("b")]
+
+    assert await buffer.flush() == 2
+    assert written == [record("a"), record("b")]
+    assert buffer.stats()["pending"] == 0 and buffer.quarantined == 1
+    with open(tmp_path / DEAD_LETTER_NAME, encoding="utf-8") as dead:
+        [line] = dead.readlines()
+    assert json.loads(line)["row"] == {"id": "bad"}
+    assert "IntegrityError" in json.loads(line)["error"]
+
+
+async def test_batch_failing_on_the_database_is_retried(tmp_path):
+    buffer = IngestBuffer(str(tmp_path))
+
+    async def write(records):
+        raise OperationalError("INSERT", {}, Exception("connection refused"))
+
+    buffer._write = write
+    buffer._append_to_spool([record("a"), record("b")])
+    buffer._pending = [record("a"), record("b")]
+
+    assert await buffer.flush() == 0
+    assert buffer._pending == [record("a"), record("b")]
+    assert buffer.quarantined == 0
+    assert not os.path.exists(tmp_path / DEAD_LETTER_NAME)
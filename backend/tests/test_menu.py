@@ -0,0 +1,54 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.models.models import MenuItem
+from app.routers.navbar import bulk_menu_action, load_menu_tree, update_menu_item
+from app.schemas.schemas import MenuItemCreate
+
+pytestmark = pytest.mark.anyio
+
+
+async def seed_menu(session) -> None:
+    # root -> child -> grandchild, plus an unrelated item
+    for item_id, parent_id in [("root", None), ("child", "root"), ("grandchild", "child"), ("other", None)]:
+        session.add(MenuItem(id=item_id, title=item_id, path=f"/{item_id}", parent_id=parent_id))
+        await session.flush()
+    await session.commit()
+
+
+async def test_bulk_delete_removes_the_whole_subtree(session):
+    await seed_menu(session)
+
+    await bulk_menu_action(item_ids=["root"], action="delete", current_user=None, session=session)
+
+    remaining = (await session.execute(select(MenuItem.id))).scalars().all()
+    assert remaining == ["other"]
+    assert [item.id for item in await load_menu_tree(session)] == ["other"]
+
+
+async def test_update_rejects_a_parent_cycle(session):
+    await seed_menu(session)
+
+    with pytest.raises(HTTPException) as raised:
+        await update_menu_item(
+            "root", MenuItemCreate(title="root", path="/root", parent_id="grandchild"),
+            current_user=None, session=session
+        )
+
+    assert raised.value.status_code == 400
+    assert (await session.get(MenuItem, "root")).parent_id is None
+
+
+async def test_update_moves_an_item_under_another_branch(session):
+    await seed_menu(session)
+
+    moved = await update_menu_item(
+        "child", MenuItemCreate(title="child", path="/child", parent_id="other"),
+        current_user=None, session=session
+    )
+
+    assert moved.parent_id == "other"
+    tree = {item.id: item for item in await load_menu_tree(session)}
+    assert [child.id for child in tree["other"].children] == ["child"]
+    assert [child.id for child in tree["other"].children[0].children] == ["grandchild"]
@@ -0,0 +1,134 @@
+from collections import Counter
+from contextlib import asynccontextmanager
+
+import aiosmtplib
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.models import Campaign, CampaignDelivery, CampaignStatus, Newsletter
+from app.services.newsletter_dispatch import NewsletterDispatcher, SMTPConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeClient:
+    def __init__(self, sent: Counter, refuse: set, broken: set = frozenset()):
+        self.sent = sent
+        self.refuse = refuse
+        self.broken = broken
+        self.closed = False
+
+    async def sendmail(self, sender, recipients, message):
+        [email] = recipients
+        if email in self.broken:
+            raise ValueError("not an SMTP error")
+        if email in self.refuse:
+            raise aiosmtplib.SMTPRecipientsRefused([aiosmtplib.SMTPRecipientRefused(550, "No such user", email)])
+        self.sent[email] += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool:
+    def __init__(self, client: FakeClient):
+        self.client = client
+        self.opened = 1
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.client
+
+    async def close(self):
+        pass
+
+
+class Dispatcher(NewsletterDispatcher):
+    def __init__(self, client: FakeClient):
+        super().__init__(
+            sender="Test <news@example.com>", connections=2, send_rate=0, page_size=4,
+            lease_seconds=60
+        )
+        self.client = client
+
+    def create_pool(self):
+        return FakePool(self.client)
+
+
+@pytest.fixture
+async def campaign(session, monkeypatch):
+    monkeypatch.setattr(
+        "app.services.newsletter_dispatch.async_session_maker",
+        async_sessionmaker(session.bind, expire_on_commit=False)
+    )
+    session.add_all(Newsletter(id=f"s{i}", email=f"s{i}@example.com") for i in range(10))
+    session.add(Campaign(id="c1", subject="Hello", body_text="Hi", status=CampaignStatus.SENDING))
+    await session.commit()
+    return "c1"
+
+
+async def campaign_row(session, campaign_id: str) -> Campaign:
+    session.expire_all()
+    return await session.get(Campaign, campaign_id)
+
+
+async def test_resumed_send_skips_recorded_recipients(session, campaign):
+    sent = Counter()
+    dispatcher = Dispatcher(FakeClient(sent, refuse={"s2@example.com"}))
+    record = dispatcher._record
+
+    async def record_or_crash(campaign_id, row, result):
+        if row.id == "s5":
+            raise RuntimeError("database went away")
+        await record(campaign_id, row, result)
+
+    dispatcher._record = record_or_crash
+    with pytest.raises(RuntimeError):
+        await dispatcher.run(campaign)
+    # The rest of the interrupted page was still sent and recorded
+    assert set(sent) == {f"s{i}@example.com" for i in range(8) if i != 2}
+    assert (await campaign_row(session, campaign)).cursor == "s3"
+
+    dispatcher._record = record
+    report = await dispatcher.run(campaign)
+
+    # Only the recipient whose result was never recorded gets a second copy
+    assert {email for email, count in sent.items() if count > 1} == {"s5@example.com"}
+    assert set(sent) == {f"s{i}@example.com" for i in range(10) if i != 2}
+    assert (report.sent, report.failed) == (3, 0)
+    row = await campaign_row(session, campaign)
+    assert (row.status, row.sent_count, row.failed_count) == (CampaignStatus.SENT, 9, 1)
+    deliveries = (await session.execute(select(CampaignDelivery.subscriber_id))).scalars().all()
+    assert len(deliveries) == 10
+
+
+async def test_unexpected_errors_fail_one_recipient(session, campaign):
+    sent = Counter()
+    dispatcher = Dispatcher(FakeClient(sent, refuse=set(), broken={"s1@example.com"}))
+
+    await dispatcher.run(campaign)
+
+    row = await campaign_row(session, campaign)
+    assert (row.status, row.sent_count, row.failed_count) == (CampaignStatus.SENT, 9, 1)
+    assert len(sent) == 9
+
+
+async def test_pool_closes_connections_on_421():
+    pool = SMTPConnectionPool("localhost", 25, 1)
+    clients = []
+
+    async def connect():
+        clients.append(FakeClient(Counter(), set()))
+        return clients[-1]
+
+    pool._connect = connect
+    with pytest.raises(aiosmtplib.SMTPResponseException):
+        async with pool.connection():
+            raise aiosmtplib.SMTPResponseException(550, "Mailbox unavailable")
+    assert pool._idle == clients and not clients[0].closed
+
+    with pytest.raises(aiosmtplib.SMTPResponseException):
+        async with pool.connection():
+            raise aiosmtplib.SMTPResponseException(421, "Service closing transmission channel")
+    assert pool._idle == [] and clients[0].closed
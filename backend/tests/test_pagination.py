@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import insert, literal_column
+
+from app.models.models import Blog, Comment, Role, User
+from app.routers.blogs import _comment_page
+from app.services.blog_list import BlogPage
+from app.services.pagination import next_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+def stored_timestamp(minute: int):
+    # What server_default=func.now() stores: no fractional seconds
+    return literal_column(f"'2024-01-01 12:{minute:02d}:00'")
+
+
+async def seed_posts(session, count: int = 7):
+    session.add(User(id="u1", email="author@example.com", password="x", name="Author", role=Role.ADMIN))
+    await session.flush()
+    for i in range(count):
+        await session.execute(insert(Blog).values(
+            id=f"b{i}", title=f"Post {i}", content="body", excerpt="excerpt", image="x.png",
+            slug=f"post-{i}", published=True, featured=False, author_id="u1", views=0,
+            publish_date=stored_timestamp(i)
+        ))
+    await session.commit()
+
+
+async def walk(session, fetch) -> list:
+    pages, after = [], None
+    for _ in range(10):
+        page = BlogPage(
+            published=True, featured=None, tag=None, search=None, after=after, skip=0, limit=3
+        )
+        blogs = await fetch(page, session)
+        pages.append([blog.id for blog in blogs])
+        after = next_cursor(blogs, 3, "publish_date")
+        if after is None:
+            return pages
+    raise AssertionError("cursor walk did not terminate")
+
+
+async def fetch_single(page, session):
+    blogs, _ = await page.fetch_single(session)
+    return blogs
+
+
+async def fetch_orm(page, session):
+    return await page.fetch_orm(session)
+
+
+@pytest.mark.parametrize("fetch", [fetch_single, fetch_orm])
+async def test_blog_cursor_pages_do_not_repeat_rows(session, fetch):
+    await seed_posts(session)
+
+    pages = await walk(session, fetch)
+
+    assert pages == [["b6", "b5", "b4"], ["b3", "b2", "b1"], ["b0"]]
+
+
+async def test_comment_cursor_pages_do_not_repeat_rows(session):
+    await seed_posts(session, count=1)
+    for i in range(5):
+        await session.execute(insert(Comment).values(
+            id=f"c{i}", content="hi", author_name="n", author_email="n@example.com",
+            approved=True, blog_id="b0", created_at=stored_timestamp(i)
+        ))
+    await session.commit()
+
+    seen, after = [], None
+    for _ in range(5):
+        page = await _comment_page(session, "b0", True, 2, after)
+        seen += [comment.id for comment in page.comments]
+        after = page.next_cursor
+        if after is None:
+            break
+
+    assert seen == ["c4", "c3", "c2", "c1", "c0"]
@@ -0,0 +1,213 @@
+"""Query-plan regression check (Postgres only; see conftest for TEST_DATABASE_URL).
+
+Seeds a large synthetic dataset, drives the API in-process through a fixed
+set of list/detail requests, captures every SELECT the routers send, runs
+EXPLAIN on each one and fails when a plan sequentially scans a large table.
+Statements that must read every matching row (``count(*)`` totals) are
+allowed.
+"""
+import json
+
+import httpx
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.security import create_access_token
+from app.services.counts import blog_counts
+from app.services.response_cache import response_cache
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+ADMIN_ID = "plan-admin"
+
+# Tables the check cares about and how many synthetic rows are seeded
+SEED_ROWS = {
+    "users": 2_000,
+    "blogs": 50_000,
+    "comments": 200_000,
+    "contacts": 50_000,
+    "newsletters": 100_000,
+}
+TAG_COUNT = 50
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, email, name, password, role)
+    SELECT 'plan-user-' || g, 'plan-user-' || g || '@example.com', 'User ' || g, 'x',
+           CASE WHEN g = 1 THEN 'ADMIN'::role ELSE 'USER'::role END
+    FROM generate_series(1, :users) AS g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO users (id, email, name, password, role)
+    VALUES (:admin_id, 'plan-admin@example.com', 'Plan Admin', 'x', 'ADMIN'::role)
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO tags (id, name, slug, color)
+    SELECT 'plan-tag-' || g, 'Plan tag ' || g, 'plan-tag-' || g, '#3B82F6'
+    FROM generate_series(1, :tags) AS g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO blogs (id, title, content, excerpt, image, slug, published, featured, views,
+                       publish_date, created_at, updated_at, author_id)
+    SELECT 'plan-blog-' || g, 'Post ' || g || ' on query performance',
+           repeat('Lorem ipsum dolor sit amet, postgres indexes and plans. ', 40),
+           'Excerpt ' || g, 'cover.png', 'plan-blog-' || g,
+           g % 20 <> 0, g % 50 = 0, g % 1000,
+           now() - g * interval '1 hour', now(), now(),
+           'plan-user-' || (1 + g % :users)
+    FROM generate_series(1, :blogs) AS g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO blog_tags (blog_id, tag_id)
+    SELECT 'plan-blog-' || g, 'plan-tag-' || (1 + g % :tags)
+    FROM generate_series(1, :blogs) AS g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO comments (id, content, author_name, author_email, approved, created_at, updated_at, blog_id)
+    SELECT 'plan-comment-' || g, 'Comment ' || g, 'Reader', 'reader@example.com',
+           g % 3 <> 0, now() - g * interval '1 minute', now(), 'plan-blog-' || (1 + g % :blogs)
+    FROM generate_series(1, :comments) AS g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO contacts (id, name, email, subject, message, status, created_at, updated_at)
+    SELECT 'plan-contact-' || g, 'Sender', 'sender@example.com', 'Hello', 'Message ' || g,
+           (ARRAY['UNREAD', 'READ', 'REPLIED', 'ARCHIVED'])[1 + g % 4]::contactstatus,
+           now() - g * interval '1 minute', now()
+    FROM generate_series(1, :contacts) AS g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO newsletters (id, email, active, created_at, updated_at)
+    SELECT 'plan-subscriber-' || g, 'plan-subscriber-' || g || '@example.com', g % 10 <> 0,
+           now() - g * interval '1 minute', now()
+    FROM generate_series(1, :newsletters) AS g
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+# Public requests, then admin-only ones (sent with an admin token)
+PUBLIC_REQUESTS = [
+    "/api/blogs/?total_mode=none",
+    "/api/blogs/?total_mode=none&featured=true",
+    "/api/blogs/?total_mode=none&tag=plan-tag-7",
+    "/api/blogs/?total_mode=none&search=indexes",
+    "/api/blogs/?total_mode=exact",
+    "/api/blogs/featured",
+    "/api/blogs/plan-blog-42",
+    "/api/blogs/plan-blog-42/bundle",
+    "/api/blogs/plan-blog-42/related",
+    "/api/blogs/plan-blog-42/comments",
+    "/api/blogs/plan-blog-42/comments?approved_only=false",
+    "/api/features/",
+    "/api/testimonials/",
+    "/api/navbar/menu",
+]
+ADMIN_REQUESTS = [
+    "/api/users/",
+    "/api/contact/",
+    "/api/contact/?status_filter=unread",
+    "/api/newsletter/subscribers",
+    "/api/navbar/admin/menu",
+]
+
+# Plans that have to visit every matching row anyway
+ALLOWED_SEQ_SCAN_MARKERS = ("count(*)",)
+
+# Tables with fewer rows may be scanned sequentially
+MIN_ROWS = 10_000
+
+
+async def seed(engine) -> None:
+    params = dict(SEED_ROWS, tags=TAG_COUNT, admin_id=ADMIN_ID)
+    async with engine.begin() as conn:
+        for statement in SEED_SQL:
+            await conn.execute(text(statement), params)
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE"))
+
+
+async def capture_statements(engine) -> list:
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            captured.append((statement, parameters))
+
+    token = create_access_token(ADMIN_ID)
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://plans") as client:
+            for path in PUBLIC_REQUESTS + ADMIN_REQUESTS:
+                response_cache.cache.clear()
+                blog_counts.invalidate()
+                headers = {"Authorization": f"Bearer {token}"} if path in ADMIN_REQUESTS else {}
+                response = await client.get(path, headers=headers)
+                assert response.status_code < 400, f"{path} returned {response.status_code}: {response.text}"
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    # The same statement text with the same parameters only needs one plan
+    unique = {}
+    for statement, parameters in captured:
+        unique.setdefault((statement, repr(parameters)), (statement, parameters))
+    return list(unique.values())
+
+
+def seq_scans(plan: dict):
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"], plan.get("Plan Rows", 0)
+    for child in plan.get("Plans", []):
+        yield from seq_scans(child)
+
+
+async def large_seq_scans(engine, statements) -> list:
+    """Statements whose plan sequentially scans a table of ``MIN_ROWS`` or more."""
+    failures = []
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r'")
+        )
+        table_rows = {name: rows for name, rows in result}
+
+        for statement, parameters in statements:
+            if any(marker in statement for marker in ALLOWED_SEQ_SCAN_MARKERS):
+                continue
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            tables = [
+                f"{table} (~{int(table_rows[table])} rows)"
+                for table, _ in seq_scans(plan[0]["Plan"])
+                if table_rows.get(table, 0) >= MIN_ROWS
+            ]
+            if tables:
+                failures.append(f"Seq Scan on {', '.join(tables)}: {' '.join(statement.split())[:400]}")
+    return failures
+
+
+async def test_api_queries_avoid_seq_scans_on_large_tables(session, monkeypatch):
+    if session.bind.dialect.name != "postgresql":
+        pytest.skip("query plans are only checked against Postgres")
+    monkeypatch.setattr(
+        "app.database.async_session_maker",
+        async_sessionmaker(session.bind, class_=AsyncSession, expire_on_commit=False)
+    )
+    await seed(session.bind)
+
+    statements = await capture_statements(session.bind)
+
+    assert statements
+    failures = await large_seq_scans(session.bind, statements)
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.security import get_password_hash
+from app.models.models import Role, User
+from app.routers import auth
+from app.schemas.schemas import UserLogin
+from app.services.rate_limit import TAKE_SCRIPT, RateLimiter, RedisRateLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("app.services.rate_limit.time.monotonic", clock)
+    return clock
+
+
+async def test_bucket_allows_a_burst_then_refills(clock):
+    limiter = RateLimiter({"x": "2/second"})
+    rule = limiter.rules["x"]
+
+    assert [await limiter.take("k", rule) for _ in range(3)] == [0, 0, 0.5]
+    clock.now += 0.25
+    assert await limiter.take("k", rule) == pytest.approx(0.25)
+    clock.now += 0.25
+    assert await limiter.take("k", rule) == 0
+
+
+async def test_limited_check_answers_429_with_retry_after(clock):
+    limiter = RateLimiter({"contact": "5/minute"})
+    for _ in range(5):
+        await limiter.check("contact", "10.0.0.1")
+
+    with pytest.raises(HTTPException) as raised:
+        await limiter.check("contact", "10.0.0.1")
+
+    assert raised.value.status_code == 429
+    # One token every 12 seconds
+    assert raised.value.headers["Retry-After"] == "12"
+    await limiter.check("contact", "10.0.0.2")
+    assert (limiter.allowed, limiter.limited) == (6, 1)
+
+
+async def test_parallel_checks_cannot_exceed_the_burst(clock):
+    limiter = RateLimiter({"login_account": "10/minute"})
+
+    results = await asyncio.gather(
+        *(limiter.check("login_account", "a@example.com") for _ in range(15)),
+        return_exceptions=True
+    )
+
+    assert sum(result is None for result in results) == 10
+    assert all(isinstance(result, HTTPException) for result in results if result is not None)
+
+
+async def test_refund_is_capped_at_the_burst(clock):
+    limiter = RateLimiter({"x": "2/minute"})
+    rule = limiter.rules["x"]
+
+    await limiter.refund("x", "k")
+    await limiter.refund("x", "k")
+
+    assert [await limiter.take("x:k", rule) for _ in range(3)][:2] == [0, 0]
+
+
+async def test_redis_script_takes_and_refunds():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    limiter = RedisRateLimiter("redis://localhost", {"x": "3/minute"})
+    limiter.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    limiter._take = limiter.redis.register_script(TAKE_SCRIPT)
+    rule = limiter.rules["x"]
+
+    waits = [await limiter.take("k", rule) for _ in range(4)]
+    assert waits[:3] == [0, 0, 0] and 19 < waits[3] <= 20.1
+    await limiter.refund("x", "k")
+    assert await limiter.take("x:k", rule) == 0
+    assert 0 < await limiter.redis.pttl("ratelimit:k") <= 60000
+
+
+@pytest.fixture
+async def account(session, monkeypatch):
+    limiter = RateLimiter({"login_account": "3/minute"})
+    monkeypatch.setattr(auth, "rate_limiter", limiter)
+    session.add(User(
+        id="u1", email="owner@example.com", password=get_password_hash("right"),
+        name="Owner", role=Role.USER
+    ))
+    await session.commit()
+    return limiter
+
+
+async def attempt(session, password: str) -> int:
+    try:
+        await auth.login(UserLogin(email="owner@example.com", password=password), session=session)
+    except HTTPException as exc:
+        return exc.status_code
+    return 200
+
+
+async def test_successful_logins_are_not_charged(session, account):
+    assert [await attempt(session, "right") for _ in range(5)] == [200] * 5
+
+
+async def test_failed_logins_drain_the_account_bucket(session, account):
+    assert [await attempt(session, "wrong") for _ in range(3)] == [401] * 3
+    # The owner is locked out too until a token refills
+    assert await attempt(session, "right") == 429
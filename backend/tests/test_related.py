@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.models import Blog, RelatedPost, Role, Tag, User, blog_tags
+from app.services.related import RelatedModel, RelatedPostsEngine
+
+POSTS = {
+    "a": ("Banana smoothie recipe with oat milk", {"food"}),
+    "b": ("Green smoothie recipe for breakfast", {"food", "health"}),
+    "c": ("Profiling async Python services", {"python"}),
+    "d": ("Async database pools in Python", {"python", "databases"}),
+    "e": ("Choosing database indexes", {"databases"}),
+}
+
+
+def build(posts) -> RelatedModel:
+    ids = sorted(posts)
+    return RelatedModel.build(
+        ids, [posts[i][0] for i in ids], [posts[i][1] for i in ids], tag_weight=0.5
+    )
+
+
+def all_scores(model: RelatedModel) -> dict:
+    scores = model.scores(np.arange(len(model)))
+    return {
+        (model.ids[row], model.ids[column]): scores[row, column]
+        for row in range(len(model)) for column in range(len(model)) if row != column
+    }
+
+
+def test_top_k_ranks_by_shared_terms_and_tags():
+    neighbours = build(POSTS).top_k(["a", "c"], 2)
+
+    assert neighbours["a"][0][0] == "b"
+    assert neighbours["c"][0][0] == "d"
+    assert all(score > 0 for ranked in neighbours.values() for _, score in ranked)
+
+
+def test_update_matches_a_fresh_build():
+    model = build({key: POSTS[key] for key in "abcd"})
+    edited = ("Indexes for async Python database pools", {"databases"})
+
+    model.update(["e", "c"], [POSTS["e"][0], edited[0]], [POSTS["e"][1], edited[1]], removed=["a"])
+
+    expected = build({"b": POSTS["b"], "c": edited, "d": POSTS["d"], "e": POSTS["e"]})
+    assert sorted(model.ids) == sorted(expected.ids)
+    actual, wanted = all_scores(model), all_scores(expected)
+    assert actual.keys() == wanted.keys()
+    assert all(np.isclose(actual[pair], wanted[pair], atol=1e-6) for pair in wanted)
+
+
+@pytest.fixture
+async def posts(session, monkeypatch):
+    monkeypatch.setattr(
+        "app.services.related.async_session_maker",
+        async_sessionmaker(session.bind, expire_on_commit=False)
+    )
+    session.add(User(id="u1", email="author@example.com", password="x", name="Author", role=Role.USER))
+    session.add_all(
+        Tag(id=tag, name=tag, slug=tag) for tag in {tag for _, tags in POSTS.values() for tag in tags}
+    )
+    await session.flush()
+    for blog_id, (title, tags) in POSTS.items():
+        await session.execute(insert(Blog).values(
+            id=blog_id, title=title, content="body", excerpt="", image="x.png", slug=blog_id,
+            published=True, featured=False, author_id="u1", views=0,
+            updated_at=datetime(2024, 1, 1)
+        ))
+        await session.execute(insert(blog_tags).values([{"blog_id": blog_id, "tag_id": tag} for tag in tags]))
+    await session.commit()
+
+
+async def neighbours(session, blog_id: str) -> list:
+    result = await session.execute(
+        select(RelatedPost.related_id).where(RelatedPost.blog_id == blog_id).order_by(RelatedPost.rank)
+    )
+    return result.scalars().all()
+
+
+@pytest.mark.anyio
+async def test_start_builds_an_empty_table(session, posts):
+    engine = RelatedPostsEngine(k=2)
+
+    await engine._build_if_empty()
+    await engine._build_if_empty()
+
+    assert engine.rebuilds == 1
+    assert (await neighbours(session, "a"))[0] == "b"
+
+
+@pytest.mark.anyio
+async def test_refresh_picks_up_edits_from_other_workers(session, posts):
+    await RelatedPostsEngine(k=2).rebuild()
+    engine = RelatedPostsEngine(k=2)
+    assert await engine.refresh() == 0
+
+    # Edited by another worker: nothing is marked dirty here
+    await session.execute(
+        update(Blog).where(Blog.id == "e")
+        .values(title="Banana smoothie recipe with oat milk", updated_at=datetime(2024, 1, 2))
+    )
+    await session.commit()
+
+    assert await engine.refresh() > 0
+    assert (await neighbours(session, "e"))[0] == "a"
+    assert await engine.refresh() == 0
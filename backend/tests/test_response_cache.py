@@ -0,0 +1,36 @@
+import pytest
+from starlette.requests import Request
+
+from app.services.cache import TTLCache
+from app.services.response_cache import ResponseCache
+
+pytestmark = pytest.mark.anyio
+
+
+def get_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+async def test_miss_is_stored(session):
+    cache = ResponseCache(TTLCache(maxsize=8, ttl=60))
+    key = cache.key("menu", "published")
+
+    _, validators = await cache.lookup(get_request(), session, key)
+    cache.set(key, ["old"], list, validators)
+
+    cached, _ = await cache.lookup(get_request(), session, key)
+    assert cached is not None and cached.body == b'["old"]'
+
+
+async def test_miss_invalidated_while_loading_is_not_stored(session):
+    cache = ResponseCache(TTLCache(maxsize=8, ttl=60))
+    key = cache.key("menu", "published")
+
+    _, validators = await cache.lookup(get_request(), session, key)
+    # A write commits and invalidates between the row read and set()
+    cache.invalidate("menu")
+    response = cache.set(key, ["old"], list, validators)
+
+    assert response.body == b'["old"]'
+    cached, _ = await cache.lookup(get_request(), session, key)
+    assert cached is None
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.deps import Principal
+from app.models.models import Newsletter, Role
+from app.routers.newsletter import export_newsletter_subscribers
+from app.services.export import ExportFormat
+from app.services.subscriber_import import import_subscribers
+
+pytestmark = pytest.mark.anyio
+
+ADMIN = Principal(id="u1", email="admin@example.com", role=Role.ADMIN)
+
+
+@pytest.fixture
+async def subscribers(session, monkeypatch):
+    monkeypatch.setattr("app.services.export.engine", session.bind)
+    monkeypatch.setattr(
+        "app.services.subscriber_import.async_session_maker",
+        async_sessionmaker(session.bind, expire_on_commit=False)
+    )
+    session.add_all(
+        Newsletter(id=f"s{i}", email=f"s{i}@example.com", active=i % 3 != 0) for i in range(8)
+    )
+    await session.commit()
+
+
+async def read_body(response) -> list:
+    return [chunk async for chunk in response.body_iterator]
+
+
+@pytest.mark.parametrize("export_format", list(ExportFormat))
+async def test_export_streams_the_database_rows(session, subscribers, monkeypatch, export_format):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+
+    response = await export_newsletter_subscribers(
+        format=export_format, active_only=True, current_user=ADMIN
+    )
+    chunks = await read_body(response)
+
+    body = b"".join(chunks).decode()
+    if export_format == ExportFormat.CSV:
+        rows = list(csv.DictReader(io.StringIO(body)))
+    else:
+        rows = [json.loads(line) for line in body.splitlines()]
+    result = await session.execute(
+        select(Newsletter.id, Newsletter.email)
+        .where(Newsletter.active == True)
+        .order_by(Newsletter.created_at.desc(), Newsletter.id.desc())
+    )
+    assert [(row["id"], row["email"]) for row in rows] == [tuple(row) for row in result]
+    # Five active subscribers, two per batch
+    assert len(rows) == 5 and len(chunks) >= 3
+
+
+async def upload(body: bytes, size: int):
+    # Chunk boundaries fall inside lines, as they do for a real request body
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+async def test_import_counts_a_mixed_batch(session, subscribers):
+    body = "\n".join([
+        "name,email",
+        "A,new1@example.com",
+        "B,s0@example.com",
+        "C,s1@example.com",
+        "D,new1@example.com",
+        "E,not-an-address",
+        "F,new2@example.com",
+    ]).encode()
+
+    report = await import_subscribers(upload(body, 7), ExportFormat.CSV, batch_size=4)
+
+    assert (
+        report.received, report.new, report.reactivated, report.already_active,
+        report.duplicates, report.invalid
+    ) == (6, 2, 1, 1, 1, 1)
+    assert [batch.received for batch in report.batches] == [4, 2]
+    assert report.batches[1].invalid_examples == ["line 6: not-an-address"]
+
+    session.expire_all()
+    result = await session.execute(
+        select(Newsletter.email, Newsletter.active)
+        .where(Newsletter.email.in_(["new1@example.com", "new2@example.com", "s0@example.com"]))
+    )
+    assert dict(result.all()) == {
+        "new1@example.com": True, "new2@example.com": True, "s0@example.com": True
+    }
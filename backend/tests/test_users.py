@@ -0,0 +1,104 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import insert, select
+
+from app.core.deps import Principal, get_current_principal, principal_cache
+from app.core.security import create_access_token
+from app.models.models import Blog, BlogFacet, ContentVersion, Role, Tag, User, blog_tags
+from app.routers.users import delete_user, update_user
+from app.schemas.schemas import UserUpdate
+from app.services.events import event_bus
+from app.services.facets import rebuild_facets
+from app.services.related import related_engine
+
+pytestmark = pytest.mark.anyio
+
+ADMIN = Principal(id="admin", email="admin@example.com", role=Role.ADMIN)
+
+
+async def seed_authors(session) -> None:
+    session.add_all([
+        User(id="admin", email="admin@example.com", password="x", name="Admin", role=Role.ADMIN),
+        User(id="author", email="author@example.com", password="x", name="Author", role=Role.USER),
+        Tag(id="t1", name="Python", slug="python"),
+    ])
+    await session.flush()
+    for blog_id, author_id in [("a1", "author"), ("a2", "author"), ("k1", "admin")]:
+        await session.execute(insert(Blog).values(
+            id=blog_id, title=blog_id, content="body", excerpt="excerpt", image="x.png",
+            slug=blog_id, published=True, featured=False, author_id=author_id, views=0
+        ))
+    await session.execute(insert(blog_tags).values([
+        {"blog_id": "a1", "tag_id": "t1"}, {"blog_id": "k1", "tag_id": "t1"},
+    ]))
+    await rebuild_facets(session)
+    await session.commit()
+
+
+async def facet_counts(session) -> dict:
+    result = await session.execute(select(BlogFacet.kind, BlogFacet.key, BlogFacet.count))
+    return {(kind, key): count for kind, key, count in result if count}
+
+
+async def blogs_version(session) -> int:
+    return await session.scalar(
+        select(ContentVersion.version).where(ContentVersion.namespace == "blogs")
+    ) or 0
+
+
+async def test_deleting_an_author_keeps_blog_bookkeeping_in_step(session):
+    await seed_authors(session)
+    version = await blogs_version(session)
+
+    await delete_user("author", current_user=ADMIN, session=session)
+
+    assert (await session.execute(select(Blog.id))).scalars().all() == ["k1"]
+    counts = await facet_counts(session)
+    await rebuild_facets(session)
+    assert counts == await facet_counts(session)
+    assert counts[("tag", "t1")] == 1 and counts[("published", "all")] == 1
+    assert await blogs_version(session) == version + 1
+    assert {"a1", "a2"} <= related_engine._dirty
+
+
+async def test_renaming_an_author_invalidates_blog_lists(session, monkeypatch):
+    await seed_authors(session)
+    version = await blogs_version(session)
+    published = []
+
+    async def publish(entity, action, entity_id=None):
+        published.append((entity, action))
+
+    monkeypatch.setattr(event_bus, "publish", publish)
+
+    await update_user("author", UserUpdate(email="author@example.com"), current_user=ADMIN, session=session)
+    assert await blogs_version(session) == version
+    assert published == [("user", "updated")]
+
+    await update_user("author", UserUpdate(name="Renamed"), current_user=ADMIN, session=session)
+    assert await blogs_version(session) == version + 1
+    assert published[1:] == [("user", "updated"), ("blog", "updated")]
+
+
+async def authenticate(session, user_id: str) -> Principal:
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(user_id))
+    return await get_current_principal(credentials, session=session)
+
+
+async def test_cached_principal_is_dropped_when_the_user_changes(session):
+    await seed_authors(session)
+    principal_cache.clear()
+    assert (await authenticate(session, "author")).email == "author@example.com"
+    assert principal_cache.get("author") is not None
+
+    await update_user("author", UserUpdate(email="renamed@example.com"), current_user=ADMIN, session=session)
+    assert principal_cache.get("author") is None
+    assert (await authenticate(session, "author")).email == "renamed@example.com"
+
+    await delete_user("author", current_user=ADMIN, session=session)
+    assert principal_cache.get("author") is None
+    # A token issued before the deletion no longer authenticates
+    with pytest.raises(HTTPException) as raised:
+        await authenticate(session, "author")
+    assert raised.value.status_code == 401
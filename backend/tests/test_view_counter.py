@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import insert, select
+
+from app.models.models import Blog, Role, User
+from app.services.view_counter import RedisViewCounter, ViewCounter
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def blog(session, monkeypatch):
+    monkeypatch.setattr("app.services.view_counter.engine", session.bind)
+    session.add(User(id="u1", email="author@example.com", password="x", name="Author", role=Role.USER))
+    await session.flush()
+    await session.execute(insert(Blog).values(
+        id="b1", title="Post", content="body", excerpt="excerpt", image="x.png", slug="post",
+        published=True, featured=False, author_id="u1", views=0
+    ))
+    await session.commit()
+    return "b1"
+
+
+async def views(session, blog_id: str) -> int:
+    session.expire_all()
+    return await session.scalar(select(Blog.views).where(Blog.id == blog_id))
+
+
+async def test_early_flush_runs_once_at_a_time(blog, session):
+    counter = ViewCounter(max_pending=2)
+    kicked = set()
+    for _ in range(5):
+        await counter.record(blog)
+        kicked.add(counter._kicked)
+
+    # Views past the threshold reuse the flush that is already pending
+    assert len(kicked - {None}) == 1
+    await counter._kicked
+    await counter.flush()
+    assert await views(session, blog) == 5
+
+
+async def test_redis_outage_falls_back_to_memory(blog, session):
+    pytest.importorskip("redis")
+    counter = RedisViewCounter("redis://127.0.0.1:1")
+
+    assert await counter.record(blog) == 1
+    assert await counter.record(blog) == 2
+    assert await counter.flush() == 2
+
+    assert await views(session, blog) == 2
+    stats = counter.stats()
+    assert stats["errors"] >= 3 and stats["local_pending"] == 0
+    await counter.stop()
@@ -407,16 +407,19 @@ export interface BlogList {
   published: boolean;
   featured: boolean;
   views: number;
+  approved_comment_count: number;
   publish_date: string;
   author: User;
   tags: Tag[];
+  snippet?: string | null; // Highlighted search match, only set when searching
 }
 
 export interface BlogsResponse {
   blogs: BlogList[];
-  total: number;
+  total: number | null; // null when requested with total_mode=none
   skip: number;
   limit: number;
+  next_cursor?: string | null; // Pass as `after` to fetch the next page
 }
 
 export interface Tag {
@@ -426,6 +429,23 @@ export interface Tag {
   color: string;
 }
 
+export interface TagFacet extends Tag {
+  count: number;
+}
+
+export interface MonthFacet {
+  year: number;
+  month: number; // 1-12
+  count: number;
+}
+
+export interface BlogFacets {
+  total: number; // Published posts
+  featured: number;
+  tags: TagFacet[];
+  archive: MonthFacet[]; // Newest month first
+}
+
 export interface Feature {
   id: string;
   title: string;
@@ -470,6 +490,18 @@ export interface Comment {
   blog_id: string;
 }
 
+export interface CommentsResponse {
+  comments: Comment[];
+  limit: number;
+  next_cursor?: string | null; // Pass as `after` to fetch the next page
+}
+
+export interface BlogBundle {
+  blog: Blog;
+  comments: CommentsResponse; // First page of approved comments
+  related: BlogList[];
+}
+
 // Utility function to get auth headers
 const getAuthHeaders = (): HeadersInit => {
   const token = typeof window !== 'undefined' ? localStorage.getItem('token') : null;
@@ -550,6 +582,8 @@ export const blogsAPI = {
     featured?: boolean;
     published?: boolean;
     tag?: string;
+    after?: string;
+    total_mode?: 'exact' | 'estimate' | 'none';
   }): Promise<BlogsResponse> => {
     const queryParams = new URLSearchParams();
     if (params) {
@@ -567,10 +601,21 @@ export const blogsAPI = {
     return apiFetch<BlogList[]>(`/api/blogs/featured?limit=${limit}`);
   },
 
+  getBlogFacets: async (): Promise<BlogFacets> => {
+    return apiFetch<BlogFacets>('/api/blogs/facets');
+  },
+
   getBlogBySlug: async (slug: string): Promise<Blog> => {
     return apiFetch<Blog>(`/api/blogs/${slug}`);
   },
 
+  // Post, first comments page and related posts for the detail page
+  getBlogBundle: async (slug: string, commentsLimit = 20, relatedLimit = 3): Promise<BlogBundle> => {
+    return apiFetch<BlogBundle>(
+      `/api/blogs/${slug}/bundle?comments_limit=${commentsLimit}&related_limit=${relatedLimit}`
+    );
+  },
+
   createBlog: async (blogData: {
     title: string;
     content: string;
@@ -610,8 +655,25 @@ export const blogsAPI = {
     });
   },
 
-  getBlogComments: async (blogId: string, approvedOnly = true): Promise<Comment[]> => {
-    return apiFetch<Comment[]>(`/api/blogs/${blogId}/comments?approved_only=${approvedOnly}`);
+  getRelatedPosts: async (blogId: string, limit = 3): Promise<BlogList[]> => {
+    return apiFetch<BlogList[]>(`/api/blogs/${blogId}/related?limit=${limit}`);
+  },
+
+  getBlogComments: async (blogId: string, params?: {
+    approved_only?: boolean;
+    limit?: number;
+    after?: string;
+  }): Promise<CommentsResponse> => {
+    const queryParams = new URLSearchParams();
+    if (params) {
+      Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined) {
+          queryParams.append(key, value.toString());
+        }
+      });
+    }
+    const queryString = queryParams.toString();
+    return apiFetch<CommentsResponse>(`/api/blogs/${blogId}/comments${queryString ? `?${queryString}` : ''}`);
   },
 
   createComment: async (blogId: string, commentData: {